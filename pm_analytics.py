@@ -0,0 +1,170 @@
+"""
+pm_analytics.py
+(Project Manager)
+
+Columnar in-memory snapshot of the assignment table for reporting. Every column is held
+in a compact array('i') and the employee, task and status names are kept once each in
+dictionaries, so questions over millions of assignments are answered in-process without
+querying the database again.
+
+    store = AssignmentStore.load()
+    store.filter(status='Completed').count_by('employee')
+    store.named(store.count_by('status', 'employee'), 'status', 'employee')
+
+Last modified 10/18/2026
+"""
+
+import sys
+from array import array
+from collections import Counter
+from itertools import compress
+import pm_db
+
+FETCH_SIZE = 10000
+
+# name of each id column, as used by the group by, count and filter functions
+COLUMNS = {'employee': 'emp_ids', 'task': 'task_ids', 'status': 'status_ids'}
+
+
+class AssignmentStore:
+    """
+    Assignments held as parallel arrays of ids, row i being
+    (ids[i], emp_ids[i], task_ids[i], status_ids[i]), together with the name of every id
+    """
+
+    def __init__(self, ids: array, emp_ids: array, task_ids: array, status_ids: array, names: dict):
+        self.ids = ids
+        self.emp_ids = emp_ids
+        self.task_ids = task_ids
+        self.status_ids = status_ids
+        self.names = names
+        self._ids = {}
+
+    @classmethod
+    def load(cls, fetch_size: int = FETCH_SIZE):
+        """
+        Takes a snapshot of the assignment table
+
+        :param fetch_size: number of rows fetched from the database at a time
+        :return:
+            AssignmentStore
+        """
+
+        columns = [array('i') for _ in range(4)]
+        cursor = pm_db.get_assignment_columns()
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            for column, values in zip(columns, zip(*rows)):
+                column.extend(values)
+        names = {kind: {row_id: sys.intern(name) for name, row_id in pm_db.get_names_and_ids(kind)}
+                 for kind in COLUMNS}
+        return cls(*columns, names)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def column(self, kind: str):
+        """
+        Returns the id column of employee, task or status
+
+        :param kind: employee, task or status
+        :return:
+            array of ids
+        """
+
+        if kind not in COLUMNS:
+            raise ValueError('No {} column, use one of {}'.format(kind, ', '.join(COLUMNS)))
+        return getattr(self, COLUMNS[kind])
+
+    def id_of(self, kind: str, name: str):
+        """
+        Finds the id of an employee, task or status name
+
+        :param kind: employee, task or status
+        :param name: employee full name, task name or status description
+        :return:
+            int - the id, None if there is no such name
+        """
+
+        ids = self._ids.get(kind)
+        if ids is None:
+            ids = self._ids[kind] = {known: row_id for row_id, known in self.names[kind].items()}
+        return ids.get(name)
+
+    def filter(self, **criteria):
+        """
+        Keeps the assignments matching every criterion
+
+        :param criteria: employee, task and/or status, each an id, a name or a collection
+            of ids and names
+        :return:
+            AssignmentStore - a new store sharing the name dictionaries
+        """
+
+        mask = None
+        for kind, wanted in criteria.items():
+            column = self.column(kind)
+            if isinstance(wanted, (str, int)):
+                wanted = (wanted,)
+            wanted = {self.id_of(kind, value) if isinstance(value, str) else value for value in wanted}
+            if len(wanted) == 1:
+                value, = wanted
+                matches = [row_id == value for row_id in column]
+            else:
+                matches = [row_id in wanted for row_id in column]
+            mask = matches if mask is None else [a and b for a, b in zip(mask, matches)]
+        if mask is None:
+            return AssignmentStore(array('i', self.ids), array('i', self.emp_ids), array('i', self.task_ids),
+                                   array('i', self.status_ids), self.names)
+        return AssignmentStore(*(array('i', compress(column, mask))
+                                 for column in (self.ids, self.emp_ids, self.task_ids, self.status_ids)), self.names)
+
+    def count_by(self, *kinds: str):
+        """
+        Counts the assignments per id of one or more columns
+
+        :param kinds: employee, task and/or status
+        :return:
+            Counter keyed by id, or by a tuple of ids when counting by several columns
+        """
+
+        if len(kinds) == 1:
+            return Counter(self.column(kinds[0]))
+        return Counter(zip(*(self.column(kind) for kind in kinds)))
+
+    def group_by(self, *kinds: str):
+        """
+        Groups the assignments per id of one or more columns
+
+        :param kinds: employee, task and/or status
+        :return:
+            dict - array of assignment ids keyed by id, or by a tuple of ids when grouping by several columns
+        """
+
+        keys = self.column(kinds[0]) if len(kinds) == 1 else zip(*(self.column(kind) for kind in kinds))
+        groups = {}
+        for key, asgmt_id in zip(keys, self.ids):
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = array('i')
+            group.append(asgmt_id)
+        return groups
+
+    def named(self, result: dict, *kinds: str):
+        """
+        Replaces the id keys of a count_by or group_by result with names
+
+        :param result: a dictionary keyed by id or by tuples of ids
+        :param kinds: the columns the result was keyed by, in the same order
+        :return:
+            dict - the same values keyed by name or by tuples of names
+        """
+
+        if len(kinds) == 1:
+            names = self.names[kinds[0]]
+            return {names.get(key, key): value for key, value in result.items()}
+        names = [self.names[kind] for kind in kinds]
+        return {tuple(kind_names.get(row_id, row_id) for kind_names, row_id in zip(names, key)): value
+                for key, value in result.items()}
@@ -0,0 +1,237 @@
+"""
+pm_cli.py
+(Project Manager)
+
+Command line tool for bulk operations on the project manager database, usable on
+hosts without a display since it never imports tkinter.
+
+    python pm_cli.py migrate
+    python pm_cli.py import employee employees.csv
+    python pm_cli.py import assignment history.jsonl --workers 8
+    python pm_cli.py export assignment assignments.csv
+    python pm_cli.py export assignment assignments.pmc
+    python pm_cli.py query "SELECT name, price FROM task WHERE price > ?" 1000
+    python pm_cli.py stats
+    python pm_cli.py report employee --enable-summary
+    python pm_cli.py view enable
+    python pm_cli.py importtime --runs 5
+
+Last modified 10/18/2026
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import pm_db
+import pm_export
+import pm_import
+import pm_queries
+import pm_reports
+
+TABLES = ('employee', 'task', 'status', 'assignment')
+
+# cold start budget of each entry module in milliseconds, the cumulative import time
+# reported by python -X importtime with compiled bytecode. The fastest of 5 runs measured
+# about 20, 30 and 38 ms on the development machine, the budgets leave 2.5 to 3 times that
+IMPORT_BUDGETS = {'pm_db': 60, 'pm_cli': 90, 'pm_ui': 100}
+
+# modules an entry module must not load when imported, they are imported where used
+IMPORT_FORBIDDEN = {'pm_db': ('tkinter', 'urllib.request', 'http.client', 'multiprocessing'),
+                    'pm_cli': ('tkinter', 'urllib.request', 'http.client', 'multiprocessing'),
+                    'pm_ui': ('urllib.request', 'http.client', 'multiprocessing')}
+
+
+def cmd_migrate(args):
+    applied = pm_db.migrate(args.target)
+    if applied:
+        print('Applied migrations {}'.format(', '.join(str(version) for version in applied)))
+    print('Schema version {}'.format(pm_db.get_schema_version()))
+
+
+def cmd_import(args):
+    pm_db.migrate()
+    report = pm_import.import_file(args.table, args.file, args.format, args.batch_size, args.workers, args.chunk_size)
+    for line, message in report.rejected:
+        print('{}:{}: {}'.format(args.file, line, message), file=sys.stderr)
+    if report.rejected_count > len(report.rejected):
+        print('{}: {} more rejected rows'.format(args.file, report.rejected_count - len(report.rejected)),
+              file=sys.stderr)
+    print(report)
+    return 1 if report.rejected_count else 0
+
+
+def cmd_export(args):
+    count = pm_export.export_table(args.table, args.file, args.format, args.batch_size)
+    print('Exported {} rows from {}'.format(count, args.table), file=sys.stderr)
+
+
+def cmd_query(args):
+    pm_export.write_csv(pm_db.run_query(args.sql, args.params), sys.stdout)
+
+
+def cmd_stats(args):
+    print('Schema version {}'.format(pm_db.get_schema_version()))
+    for table, count in pm_db.count_rows().items():
+        print('{:<12}{:>10} rows'.format(table, count))
+
+
+def cmd_report(args):
+    if args.enable_summary:
+        pm_reports.enable_summary()
+    elif args.disable_summary:
+        pm_reports.disable_summary()
+    rows = pm_reports.report(args.group)
+    print('{:<32}{:>12}{:>16}{:>12}{:>12}'.format(args.group.capitalize(), 'Assignments', 'Price', 'Hours',
+                                                  'Completion'))
+    for name, assignments, price, hours, completion in rows:
+        print('{:<32}{:>12}{:>16.2f}{:>12.1f}{:>12.1%}'.format(name, assignments, price, hours, completion))
+
+
+def cmd_view(args):
+    if args.action == 'enable':
+        pm_db.enable_assignment_view()
+    elif args.action == 'disable':
+        pm_db.disable_assignment_view()
+    print('Assignment view {}'.format('enabled' if pm_db.ASSIGNMENT_VIEW else 'disabled'))
+
+
+def measure_import(module: str):
+    """
+    Imports a module in a new interpreter with python -X importtime
+
+    :param module: name of a module next to this file
+    :return:
+        tuple - (cumulative import time in milliseconds, set of the names of every module it loaded)
+    """
+
+    # only this command starts other interpreters, the other commands do not pay for subprocess
+    import subprocess
+
+    # bytecode may be written, else every run under PYTHONDONTWRITEBYTECODE compiles modules edited since the last one
+    env = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                            cwd=os.path.dirname(os.path.abspath(__file__)), env=env, capture_output=True, text=True)
+    if result.returncode:
+        raise ValueError('cannot import {}: {}'.format(module, result.stderr.strip().splitlines()[-1]))
+    cumulative = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if not line.startswith('import time:') or not fields[1].strip().isdecimal():
+            continue
+        name = fields[2].strip()
+        loaded.add(name)
+        if name == module:
+            cumulative = int(fields[1]) / 1000
+    return cumulative, loaded
+
+
+def cmd_importtime(args):
+    failed = False
+    print('{:<12}{:>12}{:>12}'.format('Module', 'Import ms', 'Budget ms'))
+    for module in args.modules or IMPORT_BUDGETS:
+        # untimed, brings the bytecode of the module and of what it imports up to date
+        measure_import(module)
+        runs = [measure_import(module) for _ in range(args.runs)]
+        # the fastest run is the least disturbed by the rest of the host
+        best = min(cumulative for cumulative, _ in runs)
+        budget = IMPORT_BUDGETS.get(module)
+        over = budget is not None and best > budget
+        print('{:<12}{:>12.1f}{:>12}{}'.format(module, best, budget or '-', '  over budget' if over else ''))
+        forbidden = sorted(name for name in IMPORT_FORBIDDEN.get(module, ()) if name in runs[0][1])
+        if forbidden:
+            print('{}: imports {}'.format(module, ', '.join(forbidden)), file=sys.stderr)
+        failed = failed or over or bool(forbidden)
+    return 1 if failed else 0
+
+
+def build_parser():
+    """Returns the argument parser of the pm command"""
+
+    parser = argparse.ArgumentParser(prog='pm', description='Project manager database tool')
+    parser.add_argument('--db', help='path of the database file, defaults to the application database')
+    parser.add_argument('--profile', choices=sorted(pm_db.PROFILES),
+                        help='connection profile, defaults to {}'.format(pm_db.DEFAULT_PROFILE))
+    parser.add_argument('--timings', action='store_true', help='print the time spent in each statement when done')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    migrate = commands.add_parser('migrate', help='bring the schema up to date')
+    migrate.add_argument('--target', type=int, help='schema version to stop at')
+    migrate.set_defaults(func=cmd_migrate)
+
+    imp = commands.add_parser('import', help='import rows from a CSV or JSON Lines file')
+    imp.add_argument('table', choices=TABLES)
+    imp.add_argument('file')
+    imp.add_argument('--format', choices=('csv', 'jsonl'), help='file format, detected from the extension if omitted')
+    imp.add_argument('--workers', type=int, help='number of validation processes, defaults to the number of CPUs')
+    imp.add_argument('--batch-size', type=int, default=pm_import.BATCH_SIZE,
+                     help='rows validated and written per transaction')
+    imp.add_argument('--chunk-size', type=int, default=pm_db.CHUNK_SIZE)
+    imp.set_defaults(func=cmd_import, profile_default='bulk-load')
+
+    export = commands.add_parser('export', help='export a table to a CSV, JSON Lines or columnar file')
+    export.add_argument('table', choices=TABLES)
+    export.add_argument('file', nargs='?', help='output file, standard output if omitted')
+    export.add_argument('--format', choices=sorted(pm_export.WRITERS),
+                        help='file format, detected from the extension if omitted')
+    export.add_argument('--batch-size', type=int, default=pm_export.BATCH_SIZE, help='rows fetched at a time')
+    export.set_defaults(func=cmd_export)
+
+    query = commands.add_parser('query', help='run a read-only SQL statement and print the rows as CSV')
+    query.add_argument('sql')
+    query.add_argument('params', nargs='*')
+    query.set_defaults(func=cmd_query)
+
+    stats = commands.add_parser('stats', help='show the schema version and table sizes')
+    stats.set_defaults(func=cmd_stats)
+
+    report = commands.add_parser('report', help='total the price, hours and completion of the assignments')
+    report.add_argument('group', choices=pm_reports.GROUPS)
+    summary = report.add_mutually_exclusive_group()
+    summary.add_argument('--enable-summary', action='store_true',
+                         help='build the summary table and keep it up to date from now on')
+    summary.add_argument('--disable-summary', action='store_true', help='drop the summary table')
+    report.set_defaults(func=cmd_report)
+
+    view = commands.add_parser('view', help='serve assignment reads from a denormalized table kept by triggers')
+    view.add_argument('action', choices=('enable', 'disable', 'status'))
+    view.set_defaults(func=cmd_view)
+
+    importtime = commands.add_parser('importtime',
+                                     help='check the cold start import time of the entry modules against their budget')
+    importtime.add_argument('modules', nargs='*', help='modules to measure, defaults to {}'.format(
+        ', '.join(IMPORT_BUDGETS)))
+    importtime.add_argument('--runs', type=int, default=5, help='imports per module, the fastest one is kept')
+    importtime.set_defaults(func=cmd_importtime, connect=False)
+    return parser
+
+
+def main(argv=None):
+    """
+    Runs the pm command
+
+    :param argv: command line arguments, defaults to sys.argv
+    :return:
+        int - the exit status
+    """
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        if getattr(args, 'connect', True):
+            pm_db.connect(args.profile or getattr(args, 'profile_default', None), db_file=args.db)
+        return args.func(args) or 0
+    except (sqlite3.Error, ValueError, OSError) as e:
+        print('pm: error: {}'.format(e), file=sys.stderr)
+        return 1
+    finally:
+        pm_db.close()
+        if args.timings:
+            for name, calls, total, average, slowest in pm_queries.stats():
+                print('{:<24}{:>8} calls {:>10.4f}s total {:>10.6f}s avg {:>10.6f}s max'.format(
+                    name, calls, total, average, slowest), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,36 +10,576 @@ Last modified 12/5/2020
 import sys
 import os
 import sqlite3
-from sqlite3 import Error
-from contextlib import closing
-from tkinter import messagebox
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from functools import partial
 import pm_objects
+import pm_migrations
+import pm_queries
 
-CONN = None
+POOL = None
 DB_NAME = 'pm.sqlite'
+CHUNK_SIZE = 1000
+PAGE_SIZE = 100
+NAME_CACHE_SIZE = 10000
+SEARCH_LIMIT = 50
+# matches of a search looked at in each of the name and the whole entry, a word found in most rows
+# is looked up among the first ones only
+SEARCH_CANDIDATES = 2000
+# entries offered by a type-ahead list
+TYPEAHEAD_LIMIT = 20
+# sorts after any text a user can type, closes the range of names starting with a prefix
+PREFIX_END = '\U0010ffff'
+# True while the assignment reads are served by the assignment_view table
+ASSIGNMENT_VIEW = False
+# most parameters bound to one statement, below the SQLite default limit
+MAX_VARIABLES = 500
+
+# connection settings for each way the database is used
+PROFILES = {
+    # the GUI session: WAL so readers and the single writer do not block each other
+    'interactive': {'read_only': False,
+                    'journal_mode': 'WAL',
+                    'synchronous': 'NORMAL',
+                    'cache_size': -16000,
+                    'mmap_size': 64 * 1024 * 1024,
+                    'temp_store': 'MEMORY',
+                    'busy_timeout': 5000},
+    # large imports: no fsync per commit and a big page cache
+    'bulk-load': {'read_only': False,
+                  'journal_mode': 'WAL',
+                  'synchronous': 'OFF',
+                  'cache_size': -256000,
+                  'mmap_size': 256 * 1024 * 1024,
+                  'temp_store': 'MEMORY',
+                  'busy_timeout': 30000},
+    # reporting queries: never writes, waits longer for the writer
+    'reporting': {'read_only': True,
+                  'journal_mode': None,
+                  'synchronous': None,
+                  'cache_size': -64000,
+                  'mmap_size': 256 * 1024 * 1024,
+                  'temp_store': 'MEMORY',
+                  'busy_timeout': 15000},
+}
+DEFAULT_PROFILE = os.environ.get('PM_DB_PROFILE', 'interactive')
+
+# columns the tables can be sorted by, keyed by table heading: (SQL expression, value type)
+SORT_COLUMNS = {
+    'employee': {'ID': ('employee.id', int),
+                 'FIRST': ('employee.first', str),
+                 'LAST': ('employee.last', str),
+                 'PHONE': ("IFNULL(employee.phone, '')", str),
+                 'EMAIL': ("IFNULL(employee.email, '')", str)},
+    'task': {'ID': ('task.id', int),
+             'NAME': ('task.name', str),
+             'DESCRIPTION': ('task.description', str),
+             'PRICE': ('task.price', float),
+             'HOURS': ('task.hours', float)},
+    'status': {'ID': ('status.id', int),
+               'DESCRIPTION': ('status.description', str)},
+    'assignment': {'ID': ('assignment.id', int),
+                   'EMPLOYEE': ('employee.full_name', str),
+                   'TASK': ('task.name', str),
+                   'STATUS': ('status.description', str)},
+    'assignment_view': {'ID': ('assignment_view.id', int),
+                        'EMPLOYEE': ('assignment_view.employee', str),
+                        'TASK': ('assignment_view.task', str),
+                        'STATUS': ('assignment_view.status', str)},
+}
+
+
+class NameCache:
+    """Bounded least recently used cache of name to id lookups with hit and miss counters"""
+
+    def __init__(self, size: int = NAME_CACHE_SIZE):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._rows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name: str):
+        """
+        Looks a name up in the cache
+
+        :param name: an employee full name, task name or status description
+        :return:
+            the cached id row, None on a miss
+        """
+
+        with self._lock:
+            row = self._rows.get(name)
+            if row is None:
+                self.misses += 1
+                return None
+            self._rows.move_to_end(name)
+            self.hits += 1
+            return row
+
+    def put(self, name: str, row):
+        """
+        Stores the id row of a name, evicting the least recently used name when full
+
+        :param name: an employee full name, task name or status description
+        :param row: the id row found in the database
+        """
+
+        with self._lock:
+            self._rows[name] = row
+            self._rows.move_to_end(name)
+            while len(self._rows) > self.size:
+                self._rows.popitem(last=False)
+
+    def clear(self):
+        """Forgets every cached name"""
+
+        with self._lock:
+            self._rows.clear()
+
+    def stats(self):
+        """
+        Reports the cache usage
+
+        :return:
+            dict - number of entries, hits and misses
+        """
+
+        with self._lock:
+            return {'entries': len(self._rows), 'hits': self.hits, 'misses': self.misses}
+
+
+NAME_CACHES = {'employee': NameCache(), 'task': NameCache(), 'status': NameCache()}
+
+# column names of the rows each read statement returns, keyed by statement name
+COLUMN_CACHE = {}
+
+
+class AssignmentFilter:
+    """
+    Criteria assignments must all meet, turned into the conditions of a single
+    parameterized query. A criterion left as None is not applied and the price and hours
+    bounds are inclusive.
 
+        AssignmentFilter(employee='Ada Lovelace').where(status='Completed', min_price=100)
+    """
 
-def connect():
-    """Establishes connection to database"""
+    FIELDS = ('employee', 'task', 'status', 'min_price', 'max_price', 'min_hours', 'max_hours')
+
+    # task column and comparison of each bound
+    BOUNDS = {'min_price': 'task.price >= ?', 'max_price': 'task.price <= ?',
+              'min_hours': 'task.hours >= ?', 'max_hours': 'task.hours <= ?'}
+
+    def __init__(self, employee: str = None, task: str = None, status: str = None, min_price: float = None,
+                 max_price: float = None, min_hours: float = None, max_hours: float = None):
+        self.employee = employee
+        self.task = task
+        self.status = status
+        self.min_price = min_price
+        self.max_price = max_price
+        self.min_hours = min_hours
+        self.max_hours = max_hours
+
+    def where(self, **criteria):
+        """
+        Adds or replaces criteria
+
+        :param criteria: any of the FIELDS, None to drop a criterion
+        :return:
+            AssignmentFilter - a new filter, this one is left unchanged
+        """
+
+        unknown = set(criteria) - set(self.FIELDS)
+        if unknown:
+            raise ValueError('Cannot filter assignments by {}'.format(', '.join(sorted(unknown))))
+        values = {field: getattr(self, field) for field in self.FIELDS}
+        values.update(criteria)
+        return AssignmentFilter(**values)
+
+    def conditions(self, table: str = 'assignment'):
+        """
+        Builds the SQL conditions of the filter
+
+        :param table: assignment or assignment_view, the table the rows are read from
+        :return:
+            tuple - (list of SQL conditions to join with AND, list of their parameters)
+        """
+
+        sql = pm_queries.ASSIGNMENT_FILTERS[table]
+        conditions = []
+        params = []
+        for field in ('employee', 'task', 'status'):
+            value = getattr(self, field)
+            if value is not None:
+                conditions.append(sql[field])
+                params.append(value)
+        bounds = [(condition, getattr(self, field)) for field, condition in self.BOUNDS.items()
+                  if getattr(self, field) is not None]
+        if bounds:
+            conditions.append(sql['task_range'].format(' AND '.join(condition for condition, _ in bounds)))
+            params.extend(float(value) for _, value in bounds)
+        return conditions, params
+
+    def __bool__(self):
+        return any(getattr(self, field) is not None for field in self.FIELDS)
+
+    def __eq__(self, other):
+        if not isinstance(other, AssignmentFilter):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.FIELDS)
+
+    def __repr__(self):
+        return 'AssignmentFilter({})'.format(', '.join('{}={!r}'.format(field, getattr(self, field))
+                                                       for field in self.FIELDS if getattr(self, field) is not None))
+
+
+def _db_file():
+    """Returns the path of the database file"""
+
+    if sys.platform == "win32":
+        return DB_NAME
+    return os.environ["HOME"] + DB_NAME
+
+
+class Connection(sqlite3.Connection):
+    """Database connection that keeps open cursors for the hot lookups in pm_queries"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cursors = {}
+
+
+def open_connection(profile: str = None, db_file: str = None, check_same_thread: bool = True):
+    """
+    Opens a new connection to the database tuned for one of the PROFILES
 
-    global CONN
-    if not CONN:
-        if sys.platform == "win32":
-            db_file = DB_NAME
-        else:
-            db_file = os.environ["HOME"] + DB_NAME
+    :param profile: name of the connection profile, defaults to DEFAULT_PROFILE
+    :param db_file: path of the database file, defaults to the application database
+    :param check_same_thread: False to allow handing the connection to another thread
+    :return:
+        an open sqlite3 connection returning sqlite3.Row rows
+    :raises ValueError: if the profile, or PM_DB_PROFILE when no profile is given, is not one of the PROFILES
+    """
+
+    profile = profile or DEFAULT_PROFILE
+    if profile not in PROFILES:
+        raise ValueError('Unknown connection profile {!r}, use one of {}'.format(profile, ', '.join(sorted(PROFILES))))
+    settings = PROFILES[profile]
+    db_file = db_file or _db_file()
+    if settings['read_only']:
+        # urllib.request pulls in http and email, only pay for them when a read-only connection is opened
+        from urllib.request import pathname2url
+        conn = sqlite3.connect('file:{}?mode=ro'.format(pathname2url(db_file)), uri=True,
+                               check_same_thread=check_same_thread, factory=Connection,
+                               cached_statements=pm_queries.STATEMENT_CACHE_SIZE)
+        conn.execute('PRAGMA query_only = ON')
+    else:
+        conn = sqlite3.connect(db_file, check_same_thread=check_same_thread, factory=Connection,
+                               cached_statements=pm_queries.STATEMENT_CACHE_SIZE)
+    conn.row_factory = sqlite3.Row
+    for pragma in ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store', 'busy_timeout'):
+        if settings[pragma] is not None:
+            conn.execute('PRAGMA {} = {}'.format(pragma, settings[pragma]))
+    return conn
+
+
+class StreamCursor:
+    """
+    Cursor of a read that holds a reader connection of its own. The reader goes back to the
+    pool once the cursor is read to the end, closed or garbage collected.
+    """
+
+    def __init__(self, cursor, release):
+        self._cursor = cursor
+        self._release = release
+        # kept, the cursor itself is closed along with the read
+        self.description = cursor.description
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        while True:
+            rows = self.fetchmany(pm_queries.FETCH_BATCH)
+            if not rows:
+                return
+            yield from rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def fetchone(self):
+        if self._release is None:
+            return None
+        row = self._cursor.fetchone()
+        if row is None:
+            self.close()
+        return row
+
+    def fetchmany(self, size: int = None):
+        if self._release is None:
+            return []
+        size = self._cursor.arraysize if size is None else size
+        rows = self._cursor.fetchmany(size)
+        if len(rows) < size:
+            self.close()
+        return rows
+
+    def fetchall(self):
+        if self._release is None:
+            return []
+        rows = self._cursor.fetchall()
+        self.close()
+        return rows
+
+    def close(self):
+        """Stops the read and gives its reader back to the pool"""
+
+        release, self._release = self._release, None
+        if release is not None:
+            self._cursor.close()
+            release()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of database connections: one writer shared under a lock and up to
+    max_readers read-only connections.
+
+    A thread keeps the reader it is given (affinity) for the reads it finishes before
+    returning. A reader goes back to the pool when its thread calls release() or has
+    finished. Reads that hand their cursor to the caller run through stream() on a reader
+    of their own instead: a partly read cursor keeps its reader inside a read transaction,
+    pinned to the snapshot of the database it started with, and on the thread's reader that
+    would hide every later write from the thread's other reads. Connections that have been
+    idle longer than health_interval seconds are checked with a trivial query and reopened
+    if broken.
+    """
+
+    def __init__(self, profile: str = None, db_file: str = None, max_readers: int = 4,
+                 health_interval: float = 30.0, timeout: float = 30.0):
+        self.profile = profile
+        self.db_file = db_file
+        self.max_readers = max_readers
+        self.health_interval = health_interval
+        self.timeout = timeout
+        self._writer = None
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0
+        self._readers = {}
+        self._streams = set()
+        self._idle = []
+        self._opened = 0
+        self._checked = {}
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def writer(self):
+        """
+        Checks out the writer connection, blocking other writers until it is returned.
+        The outermost checkout commits on success and rolls back on an exception.
+        """
+
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._open(read_only=False)
+            elif self._writer_depth == 0:
+                self._writer = self._healthy(self._writer, read_only=False)
+            self._writer_depth += 1
+            try:
+                yield self._writer
+            except BaseException:
+                if self._writer_depth == 1 and self._writer.in_transaction:
+                    self._writer.rollback()
+                raise
+            else:
+                if self._writer_depth == 1 and self._writer.in_transaction:
+                    self._writer.commit()
+            finally:
+                self._writer_depth -= 1
+
+    @contextmanager
+    def reader(self):
+        """Checks out the reader connection of the calling thread"""
+
+        thread = threading.current_thread()
+        with self._cond:
+            conn = self._readers.get(thread)
+            if conn is None:
+                conn = self._readers[thread] = self._acquire()
+        conn = self._healthy(conn, read_only=True)
+        with self._cond:
+            self._readers[thread] = conn
+        yield conn
+
+    def stream(self, run):
+        """
+        Runs a read on a reader of its own, which stays checked out until the returned cursor
+        is read to the end, closed or garbage collected
+
+        :param run: function running the read on a connection and returning its cursor
+        :return:
+            StreamCursor
+        """
+
+        with self._cond:
+            conn = self._acquire()
+            self._streams.add(conn)
         try:
-            CONN = sqlite3.connect(db_file)
-            CONN.row_factory = sqlite3.Row
-        except Error as e:
-            messagebox.showerror("Database Error", str(e))
+            healthy = self._healthy(conn, read_only=True)
+            if healthy is not conn:
+                with self._cond:
+                    self._streams.discard(conn)
+                    self._streams.add(healthy)
+                conn = healthy
+            cursor = run(conn)
+        except BaseException:
+            self._end_stream(conn)
+            raise
+        return StreamCursor(cursor, partial(self._end_stream, conn))
+
+    def release(self):
+        """Gives the reader of the calling thread back to the pool"""
+
+        with self._cond:
+            conn = self._readers.pop(threading.current_thread(), None)
+            if conn is not None:
+                self._idle.append(conn)
+                self._cond.notify()
+
+    def close(self):
+        """Closes every connection of the pool"""
+
+        with self._writer_lock, self._cond:
+            for conn in list(self._readers.values()) + list(self._streams) + self._idle + [self._writer]:
+                if conn is not None:
+                    conn.close()
+            self._writer = None
+            self._readers = {}
+            self._streams = set()
+            self._idle = []
+            self._opened = 0
+            self._checked = {}
+
+    def _end_stream(self, conn: sqlite3.Connection):
+        """Gives the reader of a finished stream back to the pool, unless the pool was closed meanwhile"""
+
+        with self._cond:
+            if conn in self._streams:
+                self._streams.remove(conn)
+                self._idle.append(conn)
+                self._cond.notify()
+
+    def _acquire(self):
+        """Takes an idle reader, opens a new one or waits for one to be released, holding _cond"""
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            for thread in [thread for thread in self._readers if not thread.is_alive()]:
+                self._idle.append(self._readers.pop(thread))
+            if self._idle:
+                return self._idle.pop()
+            if self._opened < self.max_readers:
+                self._opened += 1
+                return self._open(read_only=True)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise sqlite3.OperationalError('No database connection available')
+            self._cond.wait(min(remaining, 1.0))
+
+    def _open(self, read_only: bool):
+        conn = open_connection(self.profile, self.db_file, check_same_thread=False)
+        if read_only:
+            conn.execute('PRAGMA query_only = ON')
+        self._checked[id(conn)] = time.monotonic()
+        return conn
+
+    def _healthy(self, conn: sqlite3.Connection, read_only: bool):
+        """Returns conn if it still works, a freshly opened connection otherwise"""
+
+        if time.monotonic() - self._checked.get(id(conn), 0) < self.health_interval:
+            return conn
+        try:
+            conn.execute('SELECT 1').fetchone()
+        except sqlite3.Error:
+            self._checked.pop(id(conn), None)
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            return self._open(read_only)
+        self._checked[id(conn)] = time.monotonic()
+        return conn
+
+
+def _reader():
+    """Checks out the reader connection of the calling thread from the pool"""
+
+    return POOL.reader()
+
+
+def _stream(name: str, params=(), sql: str = None):
+    """
+    Runs a registered statement on a reader of its own, for reads returning their cursor
+
+    :param name: name of the statement in pm_queries.QUERIES
+    :param params: statement parameters
+    :param sql: the SQL to run instead of the registered text
+    :return:
+        StreamCursor - the reader goes back to the pool once the cursor is read to the end or closed
+    """
+
+    return POOL.stream(lambda conn: pm_queries.execute(conn, name, params, sql=sql))
+
+
+def _writer():
+    """Checks out the writer connection from the pool"""
+
+    return POOL.writer()
+
+
+def connect(profile: str = None, max_readers: int = 4, db_file: str = None):
+    """
+    Establishes connection to database
+
+    :param profile: name of the connection profile, defaults to DEFAULT_PROFILE
+    :param max_readers: maximum number of threads reading at the same time
+    :param db_file: path of the database file, defaults to the application database
+    :raises sqlite3.Error: if the database cannot be opened
+    :raises ValueError: if the profile is not one of the PROFILES
+    """
+
+    global POOL, ASSIGNMENT_VIEW
+    if not POOL:
+        pool = ConnectionPool(profile, db_file, max_readers=max_readers)
+        with pool.writer():
+            pass
+        POOL = pool
+        ASSIGNMENT_VIEW = table_exists('assignment_view')
+
+
+def release_thread():
+    """Gives the reader connection of the calling thread back to the pool"""
+
+    if POOL:
+        POOL.release()
 
 
 def close():
     """Closes connection to database"""
 
-    if CONN:
-        CONN.close()
+    global POOL
+    if POOL:
+        POOL.close()
+        POOL = None
 
 
 def create_table(sql_query):
@@ -48,54 +588,205 @@ def create_table(sql_query):
 
     :param sql_query: an SQL query
     """
-    try:
-        CONN.cursor().execute(sql_query)
-    except Error as e:
-        messagebox.showerror("Database Error", str(e))
+    with _writer() as conn:
+        conn.execute(sql_query)
 
 
 def drop_all_tables():
     """Drops all 4 tables"""
 
-    CONN.cursor().execute('DROP TABLE IF EXISTS employee')
-    CONN.cursor().execute('DROP TABLE IF EXISTS task')
-    CONN.cursor().execute('DROP TABLE IF EXISTS status')
-    CONN.cursor().execute('DROP TABLE IF EXISTS assignment')
-    CONN.commit()
+    global ASSIGNMENT_VIEW
+    with _writer() as conn:
+        conn.execute('DROP TABLE IF EXISTS employee')
+        conn.execute('DROP TABLE IF EXISTS task')
+        conn.execute('DROP TABLE IF EXISTS status')
+        conn.execute('DROP TABLE IF EXISTS assignment')
+        conn.execute('DROP TABLE IF EXISTS assignment_summary')
+        conn.execute('DROP TABLE IF EXISTS assignment_view')
+        conn.execute('DROP TABLE IF EXISTS search_index')
+        pm_migrations.reset(conn)
+    ASSIGNMENT_VIEW = False
+    for cache in NAME_CACHES.values():
+        cache.clear()
+    COLUMN_CACHE.clear()
+
+
+def migrate(target: int = None):
+    """
+    Brings the database schema up to the latest version
+
+    :param target: version to stop at, defaults to the latest version
+    :return:
+        list - the version numbers that were applied
+    """
+
+    with _writer() as conn:
+        return pm_migrations.migrate(conn, target)
 
 
 def empty_table():
     """
-    determines if assignment table is empty
+    determines if the 4 tables are all empty
 
     :return:
-        bool - true if empty, false if not empty
+        bool - true if no table holds a row or the tables do not exist, false if any row exists
     """
 
     try:
-        return CONN.execute('''SELECT count(*) FROM (select 1 from assignment limit 1)''') is None
-    except sqlite3.Error as e:
-        if str(e) != 'no such table: assignment':
-            messagebox.showerror("Database Error", str(e))
+        with _reader() as conn:
+            return pm_queries.execute(conn, 'empty_table').fetchone()[0] == 0
+    except sqlite3.OperationalError as e:
+        if not str(e).startswith('no such table: '):
+            raise
         return True
 
 
+def get_schema_version():
+    """Returns the schema version of the database, 0 if it was never migrated"""
+
+    with _reader() as conn:
+        return pm_migrations.get_version(conn)
+
+
+def count_rows():
+    """
+    Counts the rows of the 4 tables
+
+    :return:
+        dict - number of rows keyed by table name
+    """
+
+    with _reader() as conn:
+        return {table: pm_queries.execute(conn, table + '_count').fetchone()[0]
+                for table in ('employee', 'task', 'status', 'assignment')}
+
+
+def run_query(sql: str, params=()):
+    """
+    Runs an ad hoc read-only statement on a reader of its own
+
+    :param sql: an SQL statement, reader connections refuse to write
+    :param params: statement parameters
+    :return:
+        the cursor the statement ran on, its reader goes back to the pool once it is read to the end or closed
+    """
+
+    return _stream('ad_hoc', params, sql=sql)
+
+
+def read(name: str, params=()):
+    """
+    Runs a registered statement on a reader of its own
+
+    :param name: name of the statement in pm_queries.QUERIES
+    :param params: statement parameters
+    :return:
+        the cursor the statement ran on, its reader goes back to the pool once it is read to the end or closed
+    """
+
+    return _stream(name, params)
+
+
+def table_exists(table: str):
+    """
+    Determines if a table exists in the database
+
+    :param table: a table name
+    :return:
+        bool - True if it exists, False if not
+    """
+
+    with _reader() as conn:
+        return pm_queries.lookup(conn, 'table_exists', (table,))[0] > 0
+
+
+def execute_statements(statements):
+    """
+    Runs statements that change the schema or many rows, all in one transaction
+
+    :param statements: an iterable of SQL statements without parameters
+    """
+
+    with _writer() as conn:
+        if not conn.in_transaction:
+            conn.execute('BEGIN')
+        for statement in statements:
+            conn.execute(statement)
+
+
+def enable_assignment_view():
+    """
+    Builds the assignment_view table, a copy of the assignments joined with their names kept
+    in sync by triggers on all 4 tables, and switches the assignment reads over to it
+    """
+
+    global ASSIGNMENT_VIEW
+    execute_statements(pm_queries.ASSIGNMENT_VIEW_ENABLE)
+    ASSIGNMENT_VIEW = True
+
+
+def disable_assignment_view():
+    """Drops the assignment_view table and its triggers, assignments are read through joins again"""
+
+    global ASSIGNMENT_VIEW
+    execute_statements(pm_queries.ASSIGNMENT_VIEW_DISABLE)
+    ASSIGNMENT_VIEW = False
+
+
+def _assignment_query(name: str):
+    """Returns the name of the assignment_view variant of a statement when the view is enabled"""
+
+    return name + '_view' if ASSIGNMENT_VIEW else name
+
+
+def warm_name_caches():
+    """Fills the name to id caches with as many employees, tasks and statuses as they hold"""
+
+    with _reader() as conn:
+        for kind, cache in NAME_CACHES.items():
+            for row in pm_queries.execute(conn, kind + '_ids', (cache.size,)):
+                cache.put(row[0], row[1:])
+
+
+def name_cache_stats():
+    """
+    Reports the usage of the name to id caches
+
+    :return:
+        dict - for each of employee, task and status the number of entries, hits and misses
+    """
+
+    return {kind: cache.stats() for kind, cache in NAME_CACHES.items()}
+
+
+def get_columns(table: str):
+    """
+    Returns the column names of the rows read from a table, without reading any row
+
+    :param table: employee, task, status or assignment, whose rows come joined with their names
+    :return:
+        list of column names
+    """
+
+    name = _assignment_query('assignment_all') if table == 'assignment' else table + '_all'
+    columns = COLUMN_CACHE.get(name)
+    if columns is None:
+        with _reader() as conn:
+            cursor = pm_queries.execute(conn, name, sql=pm_queries.QUERIES[name] + ' LIMIT 0')
+            columns = COLUMN_CACHE[name] = [column[0] for column in cursor.description]
+    return columns
+
+
 def get_all_employees():
     """Returns all rows from employee table"""
 
-    try:
-        return CONN.execute('''SELECT * FROM employee''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('employee_all')
 
 
 def get_last_employee():
     """Returns the last row from the employee table"""
 
-    try:
-        return CONN.execute('''SELECT * FROM employee ORDER BY id DESC LIMIT 1''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('employee_last')
 
 
 def get_employee_id(name: str):
@@ -107,32 +798,26 @@ def get_employee_id(name: str):
         id of chosen employee
     """
 
-    query = ('''SELECT id FROM employee
-                WHERE (first || " " || last)=?''')
-    try:
-        with closing(CONN.cursor()) as cur:
-            cur.execute(query, (name,))
-            return cur.fetchone()
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    row = NAME_CACHES['employee'].get(name)
+    if row is not None:
+        return row
+    with _reader() as conn:
+        row = pm_queries.lookup(conn, 'employee_id', (name,))
+    if row is not None:
+        NAME_CACHES['employee'].put(name, row)
+    return row
 
 
 def get_all_tasks():
     """"Returns all rows from task table"""
 
-    try:
-        return CONN.execute('''SELECT * FROM task''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('task_all')
 
 
 def get_last_task():
     """Returns the last row from the task table"""
 
-    try:
-        return CONN.execute('''SELECT * FROM task ORDER BY id DESC LIMIT 1''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('task_last')
 
 
 def get_task_id(name: str):
@@ -144,32 +829,26 @@ def get_task_id(name: str):
         id of chosen task
     """
 
-    query = ('''SELECT id FROM task
-                WHERE name=?''')
-    try:
-        with closing(CONN.cursor()) as cur:
-            cur.execute(query, (name,))
-            return cur.fetchone()
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    row = NAME_CACHES['task'].get(name)
+    if row is not None:
+        return row
+    with _reader() as conn:
+        row = pm_queries.lookup(conn, 'task_id', (name,))
+    if row is not None:
+        NAME_CACHES['task'].put(name, row)
+    return row
 
 
 def get_all_statuses():
     """Returns all rows from status table"""
 
-    try:
-        return CONN.execute('''SELECT * FROM status''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('status_all')
 
 
 def get_last_status():
     """Returns the last row from the status table"""
 
-    try:
-        return CONN.execute('''SELECT * FROM status ORDER BY id DESC LIMIT 1''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('status_last')
 
 
 def get_stat_id(name: str):
@@ -181,77 +860,202 @@ def get_stat_id(name: str):
         id of chosen status
     """
 
-    query = ('''SELECT id FROM status
-                WHERE description=?''')
-    try:
-        with closing(CONN.cursor()) as cur:
-            cur.execute(query, (name,))
-            return cur.fetchone()
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    row = NAME_CACHES['status'].get(name)
+    if row is not None:
+        return row
+    with _reader() as conn:
+        row = pm_queries.lookup(conn, 'status_id', (name,))
+    if row is not None:
+        NAME_CACHES['status'].put(name, row)
+    return row
+
+
+def resolve_names(kind: str, names):
+    """
+    Finds the ids of many employees, tasks or statuses, querying only the names missing
+    from the name cache, MAX_VARIABLES names per statement
+
+    :param kind: employee, task or status
+    :param names: an iterable of employee full names, task names or status descriptions
+    :return:
+        dict - id keyed by name, names that do not exist are left out
+    """
+
+    cache = NAME_CACHES[kind]
+    found = {}
+    missing = []
+    for name in set(names):
+        row = cache.get(name)
+        if row is None:
+            missing.append(name)
+        else:
+            found[name] = row[0]
+    if missing:
+        query = kind + '_ids_in'
+        with _reader() as conn:
+            for start in range(0, len(missing), MAX_VARIABLES):
+                batch = missing[start:start + MAX_VARIABLES]
+                sql = pm_queries.QUERIES[query].format(', '.join('?' * len(batch)))
+                for row in pm_queries.execute(conn, query, batch, sql=sql):
+                    cache.put(row[0], row[1:])
+                    found[row[0]] = row[1]
+    return found
+
+
+def search_terms(query: str):
+    """
+    Turns user typed text into a full-text query matching every word as a prefix, single
+    characters are left out as they match nearly every row
+
+    :param query: words to look for
+    :return:
+        str - the FTS5 query, empty if there are no words
+    """
+
+    return ' '.join('"{}"*'.format(word.replace('"', '""')) for word in query.split() if len(word) > 1)
+
+
+def search(query: str, limit: int = SEARCH_LIMIT):
+    """
+    Finds the employees, tasks and statuses matching some text, name matches first. Every
+    word must start a word of an employee name, email or phone, of a task name or
+    description, or of a status description.
+
+    Only the first SEARCH_CANDIDATES name matches and entry matches are looked at, so that
+    words found in most rows stay quick to look up. Within each group shorter names come first.
+
+    :param query: words to look for
+    :param limit: maximum number of results
+    :return:
+        list of rows of (Kind, ID, Name, Detail), Kind being employee, task or status
+    """
+
+    terms = search_terms(query)
+    if not terms:
+        return []
+    candidates = max(limit, SEARCH_CANDIDATES)
+    with _reader() as conn:
+        rows = pm_queries.execute(conn, 'search_titles', ('{title}: (' + terms + ')', candidates, limit)).fetchall()
+        if len(rows) < limit:
+            found = {row[:2] for row in rows}
+            rows += [row for row in pm_queries.execute(conn, 'search', (terms, candidates, limit))
+                     if row[:2] not in found][:limit - len(rows)]
+    return rows
 
 
 def get_all_assignments():
     """"Returns all adapted rows from assignment table"""
 
-    try:
-        return CONN.execute('''SELECT assignment.id, (first || " " || last) as Employee, 
-                               task.name as Task, status.description as Status FROM assignment
-                               JOIN employee ON assignment.emp_ID = employee.id
-                               JOIN task ON assignment.task_ID = task.ID
-                               JOIN status ON assignment.status_ID = status.ID''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream(_assignment_query('assignment_all'))
+
+
+def get_filtered_assignments(where: AssignmentFilter):
+    """
+    Streams the adapted rows of the assignments matching a filter in id order
+
+    :param where: the criteria the assignments must meet
+    :return:
+        cursor of adapted assignment rows, read it with fetchmany to keep memory use flat
+    """
+
+    table = 'assignment_view' if ASSIGNMENT_VIEW else 'assignment'
+    name = _assignment_query('assignment_filtered')
+    conditions, params = where.conditions(table)
+    query = pm_queries.QUERIES[name]
+    if conditions:
+        query += ' WHERE ' + ' AND '.join(conditions)
+    query += ' ORDER BY {}'.format(SORT_COLUMNS[table]['ID'][0])
+    return _stream(name, params, sql=query)
 
 
 def get_last_assignment():
     """Returns the last adapted row from the assignment table"""
 
-    try:
-        return CONN.execute('''SELECT assignment.id, (first || " " || last) as Employee, 
-                               task.name as Task, status.description as Status FROM assignment
-                               JOIN employee ON assignment.emp_ID = employee.id
-                               JOIN task ON assignment.task_ID = task.ID
-                               JOIN status ON assignment.status_ID = status.ID
-                               ORDER BY assignment.id DESC LIMIT 1''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream(_assignment_query('assignment_last'))
 
 
 def get_asgmt_ids():
     """Returns all the assignment ids"""
 
-    try:
-        return CONN.execute('''SELECT id FROM assignment''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('assignment_ids')
+
+
+def get_assignment_columns():
+    """Returns the id, emp_id, task_id and status_id of every assignment in id order"""
+
+    return _stream('assignment_columns')
+
+
+def get_names_and_ids(kind: str):
+    """
+    Returns the name and id of every employee, task or status
+
+    :param kind: employee, task or status
+    :return:
+        cursor of (name, id) rows, the name being the employee full name, task name or status description
+    """
+
+    return _stream(kind + '_ids', (-1,))
+
+
+def get_names_starting(kind: str, prefix: str, limit: int = TYPEAHEAD_LIMIT):
+    """
+    Finds the first names of employees, tasks or statuses starting with some text, ignoring case
+
+    :param kind: employee, task or status
+    :param prefix: text the names start with, an empty prefix matches every name
+    :param limit: maximum number of names
+    :return:
+        list of the employee full names, task names or status descriptions in alphabetical order
+    """
+
+    with _reader() as conn:
+        return [name for name, in pm_queries.execute(conn, kind + '_prefix', (prefix, prefix + PREFIX_END, limit))]
+
+
+def get_asgmt_ids_starting(prefix: str, limit: int = TYPEAHEAD_LIMIT):
+    """
+    Finds the assignment ids whose digits start with some text, shortest ids first. Each
+    id length is a range of the primary key, so no id is read that does not match.
+
+    :param prefix: digits the ids start with, an empty prefix matches every id
+    :param limit: maximum number of ids
+    :return:
+        list of assignment ids
+    """
+
+    prefix = prefix.strip()
+    if prefix and (not prefix.isdecimal() or prefix.startswith('0')):
+        return []
+    ids = []
+    with _reader() as conn:
+        if not prefix:
+            return [row_id for row_id, in pm_queries.execute(conn, 'assignment_id_range', (1, 2 ** 63 - 1, limit))]
+        last = pm_queries.lookup(conn, 'assignment_max_id')[0] or 0
+        low = high = int(prefix)
+        while low <= last and len(ids) < limit:
+            ids.extend(row_id for row_id, in pm_queries.execute(conn, 'assignment_id_range',
+                                                                (low, high, limit - len(ids))))
+            low, high = low * 10, high * 10 + 9
+    return ids
 
 
 def get_empl_names():
     """Returns all the employee full names"""
 
-    try:
-        return CONN.execute('''SELECT (first || " " || last) as Employee FROM employee ORDER BY id ASC''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('employee_names')
 
 
 def get_task_names():
     """Returns all the task names"""
 
-    try:
-        return CONN.execute('''SELECT name FROM task ORDER BY id ASC''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('task_names')
 
 
 def get_status_names():
     """Returns all the status descriptions"""
 
-    try:
-        return CONN.execute('''SELECT description FROM status ORDER BY id ASC''')
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    return _stream('status_names')
 
 
 def get_by_empl_from_asgmt(empl: str):
@@ -263,18 +1067,8 @@ def get_by_empl_from_asgmt(empl: str):
         all adapted rows from the assignment table that are associated with selected employee
     """
 
-    query = ('''SELECT assignment.id, (first || " " || last) as Employee, 
-                task.name as Task, status.description as Status FROM assignment
-                JOIN employee ON assignment.emp_ID = employee.id
-                JOIN task ON assignment.task_ID = task.ID
-                JOIN status ON assignment.status_ID = status.ID
-                WHERE (first || " " || last) = ? ''')
-    try:
-        with closing(CONN.cursor()) as cur:
-            cur.execute(query, (empl,))
-            return cur.fetchall()
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    with _reader() as conn:
+        return pm_queries.execute(conn, _assignment_query('assignment_by_empl'), (empl,)).fetchall()
 
 
 def get_by_stat_from_asgmt(stat: str):
@@ -286,18 +1080,154 @@ def get_by_stat_from_asgmt(stat: str):
         all adapted rows from the assignment table that are associated with selected task
     """
 
-    query = ('''SELECT assignment.id, (first || " " || last) as Employee, 
-                task.name as Task, status.description as Status FROM assignment
-                JOIN employee ON assignment.emp_ID = employee.id
-                JOIN task ON assignment.task_ID = task.ID
-                JOIN status ON assignment.status_ID = status.ID
-                WHERE status.description = ? ''')
-    try:
-        with closing(CONN.cursor()) as cur:
-            cur.execute(query, (stat,))
-            return cur.fetchall()
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    with _reader() as conn:
+        return pm_queries.execute(conn, _assignment_query('assignment_by_stat'), (stat,)).fetchall()
+
+
+def _get_page(name: str, table: str, key, limit: int, forward: bool, order_by: str, descending: bool,
+              conditions=(), params=()):
+    """
+    Fetches one page of rows using keyset pagination on the sort column and the id
+
+    :param name: name of a registered select statement without WHERE or ORDER BY clauses
+    :param table: the entry of SORT_COLUMNS describing the rows
+    :param key: (sort value, id) of the row the page starts after (or ends before when going
+        backwards), None for the first (or last) page
+    :param limit: maximum number of rows in the page
+    :param forward: True to page in display order, False to page against it
+    :param order_by: heading of the column rows are sorted by
+    :param descending: True to sort from the highest to the lowest value
+    :param conditions: extra SQL conditions every row must satisfy
+    :param params: parameters for the extra conditions
+    :return:
+        list of rows in display order
+    """
+
+    if order_by not in SORT_COLUMNS[table]:
+        raise ValueError('Cannot sort the {} table by {}'.format(table, order_by))
+    column, kind = SORT_COLUMNS[table][order_by]
+    id_column = SORT_COLUMNS[table]['ID'][0]
+    ascending = forward != descending
+    direction = 'ASC' if ascending else 'DESC'
+    query = pm_queries.QUERIES[name]
+    conditions = list(conditions)
+    params = list(params)
+    if key is not None:
+        value, row_id = key
+        if column == id_column:
+            conditions.append('{} {} ?'.format(id_column, '>' if ascending else '<'))
+            params.append(row_id)
+        else:
+            conditions.append('({}, {}) {} (?, ?)'.format(column, id_column, '>' if ascending else '<'))
+            # the nullable columns sort through IFNULL(column, ''), a NULL read from the row sorts as ''
+            params.extend(('' if value is None else kind(value), row_id))
+    if conditions:
+        query += ' WHERE ' + ' AND '.join(conditions)
+    if column == id_column:
+        query += ' ORDER BY {} {} LIMIT ?'.format(id_column, direction)
+    else:
+        query += ' ORDER BY {0} {2}, {1} {2} LIMIT ?'.format(column, id_column, direction)
+    params.append(limit)
+    with _reader() as conn:
+        rows = pm_queries.execute(conn, name, params, sql=query).fetchall()
+    return rows if forward else rows[::-1]
+
+
+def get_employee_page(key: tuple = None, limit: int = PAGE_SIZE, forward: bool = True, order_by: str = 'ID',
+                      descending: bool = False):
+    """
+    Fetches one page of the employee table
+
+    :param key: (sort value, id) of the employee the page starts after (or ends before when going backwards)
+    :param limit: maximum number of rows
+    :param forward: True for the page after key, False for the page before it
+    :param order_by: heading of the column to sort by
+    :param descending: True to sort from the highest to the lowest value
+    :return:
+        list of employee rows in display order
+    """
+
+    return _get_page('employee_page', 'employee', key, limit, forward, order_by, descending)
+
+
+def get_task_page(key: tuple = None, limit: int = PAGE_SIZE, forward: bool = True, order_by: str = 'ID',
+                  descending: bool = False):
+    """
+    Fetches one page of the task table
+
+    :param key: (sort value, id) of the task the page starts after (or ends before when going backwards)
+    :param limit: maximum number of rows
+    :param forward: True for the page after key, False for the page before it
+    :param order_by: heading of the column to sort by
+    :param descending: True to sort from the highest to the lowest value
+    :return:
+        list of task rows in display order
+    """
+
+    return _get_page('task_page', 'task', key, limit, forward, order_by, descending)
+
+
+def get_status_page(key: tuple = None, limit: int = PAGE_SIZE, forward: bool = True, order_by: str = 'ID',
+                    descending: bool = False):
+    """
+    Fetches one page of the status table
+
+    :param key: (sort value, id) of the status the page starts after (or ends before when going backwards)
+    :param limit: maximum number of rows
+    :param forward: True for the page after key, False for the page before it
+    :param order_by: heading of the column to sort by
+    :param descending: True to sort from the highest to the lowest value
+    :return:
+        list of status rows in display order
+    """
+
+    return _get_page('status_page', 'status', key, limit, forward, order_by, descending)
+
+
+def get_assignment_page(key: tuple = None, limit: int = PAGE_SIZE, forward: bool = True, order_by: str = 'ID',
+                        descending: bool = False, empl: str = None, stat: str = None,
+                        where: AssignmentFilter = None):
+    """
+    Fetches one page of adapted rows from the assignment table
+
+    :param key: (sort value, id) of the assignment the page starts after (or ends before when going backwards)
+    :param limit: maximum number of rows
+    :param forward: True for the page after key, False for the page before it
+    :param order_by: heading of the column to sort by
+    :param descending: True to sort from the highest to the lowest value
+    :param empl: only include assignments for this employee full name
+    :param stat: only include assignments with this status description
+    :param where: only include assignments matching this filter, combined with empl and stat
+    :return:
+        list of adapted assignment rows in display order
+    """
+
+    table = 'assignment_view' if ASSIGNMENT_VIEW else 'assignment'
+    where = where or AssignmentFilter()
+    if empl is not None:
+        where = where.where(employee=empl)
+    if stat is not None:
+        where = where.where(status=stat)
+    conditions, params = where.conditions(table)
+    name = _assignment_query('assignment_page')
+    if table == 'assignment' and not conditions and order_by in ('EMPLOYEE', 'TASK', 'STATUS'):
+        # an unfiltered name sort is driven from the name index, a filtered one lets the planner
+        # start from the filter, which may match only a few rows
+        name = 'assignment_page_' + order_by.lower()
+    return _get_page(name, table, key, limit, forward, order_by, descending, conditions, params)
+
+
+def get_assignment_detail(asgmt_id: int):
+    """
+    Gets the employee, task and status of an assignment in a single query
+
+    :param asgmt_id: an assignment id
+    :return:
+        row with the Employee full name, Task name and Status description, None if there is no such assignment
+    """
+
+    with _reader() as conn:
+        return pm_queries.lookup(conn, _assignment_query('assignment_detail'), (asgmt_id,))
 
 
 def get_empl_id_from_asgmt(asgmt_id: int):
@@ -308,14 +1238,8 @@ def get_empl_id_from_asgmt(asgmt_id: int):
         corresponding employee id for selected assignment id
     """
 
-    query = ('''SELECT emp_id FROM assignment
-                WHERE id = ? ''')
-    try:
-        with closing(CONN.cursor()) as cur:
-            cur.execute(query, (asgmt_id,))
-            return cur.fetchone()
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    with _reader() as conn:
+        return pm_queries.lookup(conn, 'assignment_emp_id', (asgmt_id,))
 
 
 def get_task_id_from_asgmt(asgmt_id: int):
@@ -326,14 +1250,8 @@ def get_task_id_from_asgmt(asgmt_id: int):
         corresponding task id for selected assignment id
     """
 
-    query = ('''SELECT task_id FROM assignment
-                WHERE id = ? ''')
-    try:
-        with closing(CONN.cursor()) as cur:
-            cur.execute(query, (asgmt_id,))
-            return cur.fetchone()
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    with _reader() as conn:
+        return pm_queries.lookup(conn, 'assignment_task_id', (asgmt_id,))
 
 
 def get_status_id_from_asgmt(asgmt_id: int):
@@ -344,14 +1262,8 @@ def get_status_id_from_asgmt(asgmt_id: int):
         corresponding status id for selected assignment id
     """
 
-    query = ('''SELECT status_id FROM assignment
-                WHERE id = ? ''')
-    try:
-        with closing(CONN.cursor()) as cur:
-            cur.execute(query, (asgmt_id,))
-            return cur.fetchone()
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    with _reader() as conn:
+        return pm_queries.lookup(conn, 'assignment_status_id', (asgmt_id,))
 
 
 def insert_employee(empl: pm_objects.Employee):
@@ -360,19 +1272,14 @@ def insert_employee(empl: pm_objects.Employee):
 
     :param empl: an employee object with information for all required fields
     :return:
-        bool - True if successful, False if not
+        bool - True once the row is written
+    :raises sqlite3.Error: if the row cannot be inserted
     """
 
-    try:
-        with closing(CONN.cursor()) as cur:
-            query = ''' INSERT INTO employee(first, last, phone, email)
-                        VALUES(?,?,?,?) '''
-            cur.execute(query, (empl.get_first(), empl.get_last(), empl.get_phone(), empl.get_email()))
-        CONN.commit()
-        return True
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
-        return False
+    with _writer() as conn:
+        pm_queries.execute(conn, 'employee_insert', (empl.get_first(), empl.get_last(), empl.get_phone(), empl.get_email()))
+    NAME_CACHES['employee'].clear()
+    return True
 
 
 def insert_task(task: pm_objects.Task):
@@ -381,19 +1288,14 @@ def insert_task(task: pm_objects.Task):
 
     :param task: a task object with information for all required fields
     :return:
-        bool - True if successful, False if not
+        bool - True once the row is written
+    :raises sqlite3.Error: if the row cannot be inserted
     """
 
-    try:
-        with closing(CONN.cursor()) as cur:
-            query = ''' INSERT INTO task(name, description, price, hours)
-                        VALUES(?,?,?,?) '''
-            cur.execute(query, (task.get_name(), task.get_description(), task.get_price(), task.get_hours()))
-        CONN.commit()
-        return True
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
-        return False
+    with _writer() as conn:
+        pm_queries.execute(conn, 'task_insert', (task.get_name(), task.get_description(), task.get_price(), task.get_hours()))
+    NAME_CACHES['task'].clear()
+    return True
 
 
 def insert_status(stat: pm_objects.Status):
@@ -402,19 +1304,14 @@ def insert_status(stat: pm_objects.Status):
 
     :param stat: a status object with information for all required fields
     :return:
-        bool - True if successful, False if not
+        bool - True once the row is written
+    :raises sqlite3.Error: if the row cannot be inserted
     """
 
-    try:
-        with closing(CONN.cursor()) as cur:
-            query = ''' INSERT INTO status(description)
-                        VALUES(?) '''
-            cur.execute(query, (stat.get_description(),))
-        CONN.commit()
-        return True
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
-        return False
+    with _writer() as conn:
+        pm_queries.execute(conn, 'status_insert', (stat.get_description(),))
+    NAME_CACHES['status'].clear()
+    return True
 
 
 def insert_assignment(asgmt: pm_objects.Assignment):
@@ -423,19 +1320,151 @@ def insert_assignment(asgmt: pm_objects.Assignment):
 
     :param asgmt: an assignment object with information for all required fields
     :return:
-        bool - True if successful, False if not
+        bool - True once the row is written
+    :raises sqlite3.Error: if the row cannot be inserted
     """
 
+    with _writer() as conn:
+        pm_queries.execute(conn, 'assignment_insert', (asgmt.get_emp_id(), asgmt.get_task_id(), asgmt.get_status_id()))
+    return True
+
+
+def _insert_many(name: str, params, chunk_size: int):
+    """
+    Streams parameter tuples through executemany inside a single transaction
+
+    Each chunk runs under a savepoint. If a chunk violates a constraint it is rolled back
+    and replayed row by row so the offending rows can be reported while the rest are kept.
+
+    :param name: name of a registered insert statement
+    :param params: an iterable of parameter tuples
+    :param chunk_size: number of rows sent to executemany at a time
+    :return:
+        tuple - (number of rows inserted, list of (row index, error message))
+    """
+
+    inserted = 0
+    errors = []
+    with _writer() as conn, closing(conn.cursor()) as cur:
+        if not conn.in_transaction:
+            cur.execute('BEGIN')
+        chunk = []
+        start = 0
+        for index, row in enumerate(params):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                inserted += _insert_chunk(cur, name, chunk, start, errors)
+                chunk = []
+                start = index + 1
+        if chunk:
+            inserted += _insert_chunk(cur, name, chunk, start, errors)
+    return inserted, errors
+
+
+def _insert_chunk(cur: sqlite3.Cursor, name: str, chunk: list, start: int, errors: list):
+    """
+    Inserts one chunk of rows, replaying it row by row if it violates a constraint
+
+    :param cur: a cursor inside an open transaction
+    :param name: name of a registered insert statement
+    :param chunk: a list of parameter tuples
+    :param start: position of the first row of the chunk in the whole stream
+    :param errors: list that rejected rows are appended to
+    :return:
+        number of rows inserted
+    """
+
+    cur.execute('SAVEPOINT insert_chunk')
     try:
-        with closing(CONN.cursor()) as cur:
-            query = ''' INSERT INTO assignment(emp_id, task_id, status_id)
-                        VALUES(?,?,?) '''
-            cur.execute(query, (asgmt.get_emp_id(), asgmt.get_task_id(), asgmt.get_status_id()))
-        CONN.commit()
-        return True
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
-        return False
+        pm_queries.executemany(cur, name, chunk)
+    except sqlite3.IntegrityError:
+        cur.execute('ROLLBACK TO insert_chunk')
+        inserted = 0
+        for offset, row in enumerate(chunk):
+            try:
+                pm_queries.execute(cur, name, row)
+                inserted += 1
+            except sqlite3.IntegrityError as e:
+                errors.append((start + offset, str(e)))
+        cur.execute('RELEASE insert_chunk')
+        return inserted
+    cur.execute('RELEASE insert_chunk')
+    return len(chunk)
+
+
+def insert_employee_many(employees, chunk_size: int = CHUNK_SIZE):
+    """
+    Inserts many employees into the employee database table in a single transaction
+
+    :param employees: an iterable of employee objects
+    :param chunk_size: number of rows written per executemany call
+    :return:
+        tuple - (number of rows inserted, list of (row index, error message))
+    """
+
+    NAME_CACHES['employee'].clear()
+    return _insert_many('employee_insert', ((empl.get_first(), empl.get_last(), empl.get_phone(), empl.get_email())
+                                for empl in employees), chunk_size)
+
+
+def insert_task_many(tasks, chunk_size: int = CHUNK_SIZE):
+    """
+    Inserts many tasks into the task database table in a single transaction
+
+    :param tasks: an iterable of task objects
+    :param chunk_size: number of rows written per executemany call
+    :return:
+        tuple - (number of rows inserted, list of (row index, error message))
+    """
+
+    NAME_CACHES['task'].clear()
+    return _insert_many('task_insert', ((task.get_name(), task.get_description(), task.get_price(), task.get_hours())
+                                for task in tasks), chunk_size)
+
+
+def insert_status_many(statuses, chunk_size: int = CHUNK_SIZE):
+    """
+    Inserts many statuses into the status database table in a single transaction
+
+    :param statuses: an iterable of status objects
+    :param chunk_size: number of rows written per executemany call
+    :return:
+        tuple - (number of rows inserted, list of (row index, error message))
+    """
+
+    NAME_CACHES['status'].clear()
+    return _insert_many('status_insert', ((stat.get_description(),) for stat in statuses), chunk_size)
+
+
+def insert_assignment_many(assignments, chunk_size: int = CHUNK_SIZE):
+    """
+    Inserts many assignments into the assignment database table in a single transaction
+
+    :param assignments: an iterable of assignment objects
+    :param chunk_size: number of rows written per executemany call
+    :return:
+        tuple - (number of rows inserted, list of (row index, error message))
+    """
+
+    return _insert_many('assignment_insert', ((asgmt.get_emp_id(), asgmt.get_task_id(), asgmt.get_status_id())
+                                for asgmt in assignments), chunk_size)
+
+
+def insert_rows(table: str, rows, chunk_size: int = CHUNK_SIZE):
+    """
+    Inserts already validated rows into a table in a single transaction
+
+    :param table: employee, task, status or assignment
+    :param rows: an iterable of parameter tuples in the column order of the table insert
+        statement, (emp_id, task_id, status_id) for assignments
+    :param chunk_size: number of rows written per executemany call
+    :return:
+        tuple - (number of rows inserted, list of (row index, error message))
+    """
+
+    if table in NAME_CACHES:
+        NAME_CACHES[table].clear()
+    return _insert_many(table + '_insert', rows, chunk_size)
 
 
 def modify_assignment(asgmt_id: int, emp_id: int, task_id: int, status_id: int):
@@ -446,14 +1475,9 @@ def modify_assignment(asgmt_id: int, emp_id: int, task_id: int, status_id: int):
     :param emp_id: employee id
     :param task_id: task id
     :param status_id: status id
+    :return:
+        bool - True if the assignment was found and updated, False if there is no assignment with that id
     """
 
-    try:
-        with closing(CONN.cursor()) as cur:
-            query = ''' UPDATE assignment 
-                        SET emp_id = ? , task_id = ? , status_id = ?
-                        WHERE id = ? '''
-            cur.execute(query, (emp_id, task_id, status_id, asgmt_id))
-        CONN.commit()
-    except sqlite3.Error as e:
-        messagebox.showerror("Database Error", str(e))
+    with _writer() as conn:
+        return pm_queries.execute(conn, 'assignment_update', (emp_id, task_id, status_id, asgmt_id)).rowcount > 0
@@ -0,0 +1,297 @@
+"""
+pm_export.py
+(Project Manager)
+
+Streaming exporter for the project manager tables. Rows are pulled from the cursor in
+fetchmany batches and written straight out as CSV, JSON Lines or a compact columnar
+binary format, so memory use stays flat however large the table is.
+
+The columnar format is a header followed by row groups, one per batch:
+
+    header     b'PMC1', uint16 column count, then per column uint16 length + UTF-8 name
+    row group  uint32 row count, then one chunk per column
+    chunk      type byte, null flag byte, null bitmap if flagged, then the values:
+               q - int64 array, d - float64 array,
+               s - uint32 dictionary size, uint32 byte lengths, UTF-8 bytes, uint32 indexes
+    end        a row group with a row count of 0
+
+Every number is little-endian. A column of one row group holding several value types is
+written as strings.
+
+Last modified 10/18/2026
+"""
+
+import csv
+import json
+import os
+import struct
+import sys
+from array import array
+import pm_db
+
+BATCH_SIZE = 5000
+
+MAGIC = b'PMC1'
+
+# read function of each table, assignments come joined with their names
+SOURCES = {
+    'employee': pm_db.get_all_employees,
+    'task': pm_db.get_all_tasks,
+    'status': pm_db.get_all_statuses,
+    'assignment': pm_db.get_all_assignments,
+}
+
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.pmc': 'columnar'}
+
+
+def detect_format(path: str):
+    """
+    Works out the format of a file from its extension
+
+    :param path: path of the file
+    :return:
+        str - csv, jsonl or columnar
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError('Cannot tell the format of {}, use .csv, .jsonl or .pmc'.format(path))
+    return FORMATS[extension]
+
+
+def iter_batches(cursor, batch_size: int = BATCH_SIZE):
+    """
+    Drains a cursor a batch at a time
+
+    :param cursor: a cursor of an executed statement
+    :param batch_size: number of rows fetched at a time
+    :return:
+        generator of lists of rows
+    """
+
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
+
+
+def _columns(cursor):
+    return [column[0] for column in cursor.description]
+
+
+def write_csv(cursor, f, batch_size: int = BATCH_SIZE):
+    """
+    Writes the rows of a cursor to a CSV file, header line first
+
+    :param cursor: a cursor of an executed statement
+    :param f: a text file opened with newline=''
+    :param batch_size: number of rows fetched at a time
+    :return:
+        int - number of rows written
+    """
+
+    writer = csv.writer(f)
+    writer.writerow(_columns(cursor))
+    count = 0
+    for rows in iter_batches(cursor, batch_size):
+        writer.writerows(rows)
+        count += len(rows)
+    return count
+
+
+def write_jsonl(cursor, f, batch_size: int = BATCH_SIZE):
+    """
+    Writes the rows of a cursor to a JSON Lines file, one object per row
+
+    :param cursor: a cursor of an executed statement
+    :param f: a text file
+    :param batch_size: number of rows fetched at a time
+    :return:
+        int - number of rows written
+    """
+
+    columns = _columns(cursor)
+    count = 0
+    for rows in iter_batches(cursor, batch_size):
+        f.write(''.join(json.dumps(dict(zip(columns, row))) + '\n' for row in rows))
+        count += len(rows)
+    return count
+
+
+def _le(values: array):
+    """Returns the little-endian bytes of an array"""
+
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _encode_column(values: list):
+    """
+    Encodes the values of one column of a row group
+
+    :param values: the column values, None for NULL
+    :return:
+        bytes - the column chunk
+    """
+
+    present = [value for value in values if value is not None]
+    kinds = {type(value) for value in present}
+    nulls = len(present) != len(values)
+    if kinds <= {int}:
+        code, filler = b'q', 0
+    elif kinds <= {int, float}:
+        code, filler = b'd', 0.0
+    else:
+        code, filler = b's', ''
+    chunk = [code, b'\x01' if nulls else b'\x00']
+    if nulls:
+        bitmap = bytearray((len(values) + 7) // 8)
+        for index, value in enumerate(values):
+            if value is None:
+                bitmap[index >> 3] |= 1 << (index & 7)
+        chunk.append(bytes(bitmap))
+    if code == b'q':
+        chunk.append(_le(array('q', (filler if value is None else value for value in values))))
+    elif code == b'd':
+        chunk.append(_le(array('d', (filler if value is None else value for value in values))))
+    else:
+        dictionary = {}
+        indexes = array('I', (dictionary.setdefault(filler if value is None else str(value), len(dictionary))
+                              for value in values))
+        encoded = [text.encode('utf-8') for text in dictionary]
+        chunk.append(struct.pack('<I', len(encoded)))
+        chunk.append(_le(array('I', (len(text) for text in encoded))))
+        chunk.append(b''.join(encoded))
+        chunk.append(_le(indexes))
+    return b''.join(chunk)
+
+
+def write_columnar(cursor, f, batch_size: int = BATCH_SIZE):
+    """
+    Writes the rows of a cursor to a columnar binary file, one row group per batch
+
+    :param cursor: a cursor of an executed statement
+    :param f: a binary file
+    :param batch_size: number of rows per row group
+    :return:
+        int - number of rows written
+    """
+
+    columns = _columns(cursor)
+    f.write(MAGIC + struct.pack('<H', len(columns)))
+    for column in columns:
+        name = column.encode('utf-8')
+        f.write(struct.pack('<H', len(name)) + name)
+    count = 0
+    for rows in iter_batches(cursor, batch_size):
+        f.write(struct.pack('<I', len(rows)))
+        for values in zip(*rows):
+            f.write(_encode_column(list(values)))
+        count += len(rows)
+    f.write(struct.pack('<I', 0))
+    return count
+
+
+def _read(f, size: int):
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError('Truncated columnar file')
+    return data
+
+
+def _read_array(f, typecode: str, length: int):
+    values = array(typecode)
+    values.frombytes(_read(f, values.itemsize * length))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _decode_column(f, length: int):
+    code, nulls = _read(f, 2)
+    bitmap = _read(f, (length + 7) // 8) if nulls else None
+    if code in b'qd':
+        values = list(_read_array(f, chr(code), length))
+    else:
+        size, = struct.unpack('<I', _read(f, 4))
+        lengths = _read_array(f, 'I', size)
+        data = _read(f, sum(lengths))
+        dictionary = []
+        offset = 0
+        for text_length in lengths:
+            dictionary.append(data[offset:offset + text_length].decode('utf-8'))
+            offset += text_length
+        values = [dictionary[index] for index in _read_array(f, 'I', length)]
+    if bitmap is not None:
+        for index in range(length):
+            if bitmap[index >> 3] & (1 << (index & 7)):
+                values[index] = None
+    return values
+
+
+def read_columnar(f):
+    """
+    Reads the rows back from a columnar binary file, a row group at a time
+
+    :param f: a binary file
+    :return:
+        tuple - (list of column names, generator of row tuples)
+    """
+
+    if _read(f, 4) != MAGIC:
+        raise ValueError('Not a columnar export file')
+    count, = struct.unpack('<H', _read(f, 2))
+    columns = []
+    for _ in range(count):
+        length, = struct.unpack('<H', _read(f, 2))
+        columns.append(_read(f, length).decode('utf-8'))
+
+    def rows():
+        while True:
+            length, = struct.unpack('<I', _read(f, 4))
+            if not length:
+                return
+            yield from zip(*(_decode_column(f, length) for _ in columns))
+
+    return columns, rows()
+
+
+WRITERS = {'csv': write_csv, 'jsonl': write_jsonl, 'columnar': write_columnar}
+
+
+def export_table(table: str, path: str = None, fmt: str = None, batch_size: int = BATCH_SIZE):
+    """
+    Streams a table, assignments joined with their names, to a file
+
+    :param table: employee, task, status or assignment
+    :param path: path of the file, standard output for csv and jsonl if omitted or -
+    :param fmt: csv, jsonl or columnar, detected from the file extension if omitted
+    :param batch_size: number of rows fetched at a time
+    :return:
+        int - number of rows written
+    """
+
+    if table not in SOURCES:
+        raise ValueError('Cannot export {}'.format(table))
+    to_stdout = path in (None, '-')
+    fmt = fmt or ('csv' if to_stdout else detect_format(path))
+    if fmt not in WRITERS:
+        raise ValueError('Unknown format {}'.format(fmt))
+    write = WRITERS[fmt]
+    cursor = SOURCES[table]()
+    try:
+        if to_stdout:
+            if fmt == 'columnar':
+                sys.stdout.flush()
+                return write(cursor, sys.stdout.buffer, batch_size)
+            return write(cursor, sys.stdout, batch_size)
+        if fmt == 'columnar':
+            with open(path, 'wb') as f:
+                return write(cursor, f, batch_size)
+        with open(path, 'w', newline='' if fmt == 'csv' else None, encoding='utf-8') as f:
+            return write(cursor, f, batch_size)
+    finally:
+        cursor.close()
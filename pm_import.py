@@ -0,0 +1,266 @@
+"""
+pm_import.py
+(Project Manager)
+
+Streaming importer for CSV and JSON Lines files. Rows are read lazily, validated in
+batches by the pm_objects column checks on a pool of worker processes, assignment
+names are resolved to ids a batch at a time and every batch is written in its own
+transaction, so memory use stays flat however large the file is.
+
+Last modified 10/18/2026
+"""
+
+import csv
+import json
+import os
+import time
+from collections import deque
+import pm_db
+import pm_objects
+
+BATCH_SIZE = 20000
+MAX_REJECTS = 1000
+
+# fields each table reads from a file, assignments refer to their rows by name
+FIELDS = {
+    'employee': ('first', 'last', 'phone', 'email'),
+    'task': ('name', 'description', 'price', 'hours'),
+    'status': ('description',),
+    'assignment': ('employee', 'task', 'status'),
+}
+
+# column check applied to each field, in the order of FIELDS
+CHECKERS = {
+    'employee': pm_objects.EMPLOYEE_CHECKERS,
+    'task': pm_objects.TASK_CHECKERS,
+    'status': pm_objects.STATUS_CHECKERS,
+    'assignment': (pm_objects.check_names, pm_objects.check_names, pm_objects.check_descriptions),
+}
+
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+
+class ImportReport:
+    """Outcome of an import: rows read, inserted and rejected, and the time it took"""
+
+    def __init__(self, table: str, max_rejects: int = MAX_REJECTS):
+        self.table = table
+        self.max_rejects = max_rejects
+        self.read = 0
+        self.inserted = 0
+        self.rejected_count = 0
+        self.rejected = []
+        self.seconds = 0.0
+
+    def reject(self, line: int, message: str):
+        """
+        Records a rejected row, keeping the messages of the first max_rejects only
+
+        :param line: line number of the row in the file
+        :param message: why the row was rejected
+        """
+
+        self.rejected_count += 1
+        if len(self.rejected) < self.max_rejects:
+            self.rejected.append((line, message))
+
+    def rows_per_second(self):
+        """Returns the number of rows read per second"""
+
+        return self.read / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return 'Imported {} of {} rows into {} in {:.2f}s ({:.0f} rows/s), rejected {}'.format(
+            self.inserted, self.read, self.table, self.seconds, self.rows_per_second(), self.rejected_count)
+
+
+def detect_format(path: str):
+    """
+    Works out the format of a file from its extension
+
+    :param path: path of the file
+    :return:
+        str - csv or jsonl
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError('Cannot tell the format of {}, use .csv or .jsonl'.format(path))
+    return FORMATS[extension]
+
+
+def read_rows(f, fmt: str):
+    """
+    Lazily reads the rows of a CSV file with a header line or of a JSON Lines file
+
+    :param f: an open text file
+    :param fmt: csv or jsonl
+    :return:
+        generator of (line number, dict of field values or the error of a line that could not be parsed)
+    """
+
+    if fmt == 'csv':
+        reader = csv.DictReader(f)
+        try:
+            reader.fieldnames
+        except csv.Error as e:
+            raise ValueError('Line {}: {}'.format(reader.line_num + 1, e))
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                # a malformed line is rejected like an invalid JSON line, reading goes on after it,
+                # the reader has not counted the line it failed on yet
+                yield reader.line_num + 1, e
+                continue
+            yield reader.line_num, row
+    elif fmt == 'jsonl':
+        for line, text in enumerate(f, 1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except ValueError as e:
+                row = e
+            yield line, row
+    else:
+        raise ValueError('Unknown format {}'.format(fmt))
+
+
+def validate_batch(table: str, batch: list):
+    """
+    Validates a batch of rows, run on the worker processes
+
+    :param table: employee, task, status or assignment
+    :param batch: list of (line number, dict of field values)
+    :return:
+        tuple - (list of (line number, tuple of validated values), list of (line number, error message))
+    """
+
+    fields = FIELDS[table]
+    lines = []
+    rows = []
+    invalid = []
+    for line, row in batch:
+        if not isinstance(row, dict):
+            invalid.append((line, 'Not a valid row: {}'.format(row)))
+            continue
+        values = tuple(row.get(field) for field in fields)
+        if None in values:
+            invalid.append((line, 'Missing {}'.format(', '.join(f for f, v in zip(fields, values) if v is None))))
+            continue
+        lines.append(line)
+        rows.append(values)
+    values, errors = pm_objects.validate_rows(rows, CHECKERS[table])
+    valid = []
+    for line, row, error in zip(lines, values, errors):
+        if error is None:
+            valid.append((line, row))
+        else:
+            invalid.append((line, error))
+    invalid.sort()
+    return valid, invalid
+
+
+def _batches(rows, size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _validated(table: str, rows, batch_size: int, workers: int):
+    """
+    Validates batches of rows, keeping at most two batches per worker in flight
+
+    :return:
+        generator of the validate_batch result of every batch, in file order
+    """
+
+    if workers <= 1:
+        for batch in _batches(rows, batch_size):
+            yield validate_batch(table, batch)
+        return
+    # imported here, single process imports and the spawned workers never need them
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # spawn, the importing process may hold database connections and threads
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        pending = deque()
+        for batch in _batches(rows, batch_size):
+            pending.append(pool.submit(validate_batch, table, batch))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _resolve(valid: list, report: ImportReport):
+    """
+    Replaces the names of validated assignment rows with ids, rejecting unknown names
+
+    :param valid: list of (line number, (employee, task, status))
+    :param report: the import report
+    :return:
+        list of (line number, (emp_id, task_id, status_id))
+    """
+
+    ids = [pm_db.resolve_names(kind, (row[index] for _, row in valid))
+           for index, kind in enumerate(('employee', 'task', 'status'))]
+    resolved = []
+    for line, row in valid:
+        missing = [name for name, found in zip(row, ids) if name not in found]
+        if missing:
+            report.reject(line, 'No such name: {}'.format(', '.join(missing)))
+        else:
+            resolved.append((line, tuple(found[name] for name, found in zip(row, ids))))
+    return resolved
+
+
+def import_file(table: str, path: str, fmt: str = None, batch_size: int = BATCH_SIZE, workers: int = None,
+                chunk_size: int = pm_db.CHUNK_SIZE, max_rejects: int = MAX_REJECTS):
+    """
+    Imports the rows of a CSV or JSON Lines file into a table
+
+    Every batch of rows is written in its own transaction, so rows of batches that were
+    written stay in the database if a later batch fails.
+
+    :param table: employee, task, status or assignment
+    :param path: path of the file
+    :param fmt: csv or jsonl, detected from the file extension if omitted
+    :param batch_size: number of rows validated and written together
+    :param workers: number of validation processes, 1 validates in this process, defaults
+        to the number of CPUs
+    :param chunk_size: number of rows written per executemany call
+    :param max_rejects: number of rejected rows whose messages are kept in the report
+    :return:
+        ImportReport
+    """
+
+    if table not in FIELDS:
+        raise ValueError('Cannot import into {}'.format(table))
+    fmt = fmt or detect_format(path)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    report = ImportReport(table, max_rejects)
+    start = time.perf_counter()
+    with open(path, newline='' if fmt == 'csv' else None, encoding='utf-8') as f:
+        for valid, invalid in _validated(table, read_rows(f, fmt), batch_size, workers):
+            report.read += len(valid) + len(invalid)
+            for line, message in invalid:
+                report.reject(line, message)
+            if table == 'assignment':
+                valid = _resolve(valid, report)
+            inserted, errors = pm_db.insert_rows(table, (row for _, row in valid), chunk_size)
+            report.inserted += inserted
+            for index, message in errors:
+                report.reject(valid[index][0], message)
+    report.seconds = time.perf_counter() - start
+    report.rejected.sort()
+    return report
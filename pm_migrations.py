@@ -0,0 +1,191 @@
+"""
+pm_migrations.py
+(Project Manager)
+
+Versioned schema migrations for the project manager database. The schema version
+is stored in the database itself through PRAGMA user_version, so existing database
+files are brought up to date in place.
+
+Last modified 10/18/2026
+"""
+
+import sqlite3
+
+# Each entry is the list of statements that moves the schema up by one version.
+# Never edit a migration that has shipped, append a new one instead.
+MIGRATIONS = [
+    # 1 - the 4 base tables
+    [''' CREATE TABLE IF NOT EXISTS employee (
+             id integer PRIMARY KEY,
+             first text NOT NULL,
+             last text NOT NULL,
+             phone text,
+             email text,
+             UNIQUE (first, last)
+         ); ''',
+     ''' CREATE TABLE IF NOT EXISTS task (
+             id integer PRIMARY KEY,
+             name text NOT NULL UNIQUE,
+             description text NOT NULL,
+             price real NOT NULL,
+             hours real NOT NULL
+         ); ''',
+     ''' CREATE TABLE IF NOT EXISTS status (
+             id integer PRIMARY KEY,
+             description text NOT NULL UNIQUE
+         ); ''',
+     ''' CREATE TABLE IF NOT EXISTS assignment (
+             id integer PRIMARY KEY,
+             emp_id integer NOT NULL,
+             task_id integer NOT NULL,
+             status_id integer NOT NULL,
+             FOREIGN KEY (emp_id) REFERENCES employee (id),
+             FOREIGN KEY (task_id) REFERENCES task (id),
+             FOREIGN KEY (status_id) REFERENCES status (id)
+         ); '''],
+
+    # 2 - indexes on the assignment foreign keys
+    [''' CREATE INDEX IF NOT EXISTS assignment_emp_id ON assignment (emp_id) ''',
+     ''' CREATE INDEX IF NOT EXISTS assignment_task_id ON assignment (task_id) ''',
+     ''' CREATE INDEX IF NOT EXISTS assignment_status_id ON assignment (status_id) '''],
+
+    # 3 - indexable employee full name
+    [''' ALTER TABLE employee ADD COLUMN full_name text
+             GENERATED ALWAYS AS (first || ' ' || last) VIRTUAL ''',
+     ''' CREATE INDEX IF NOT EXISTS employee_full_name ON employee (full_name) '''],
+
+    # 4 - covering indexes for the reports, each also serves lookups on its first column
+    [''' DROP INDEX IF EXISTS assignment_emp_id ''',
+     ''' DROP INDEX IF EXISTS assignment_task_id ''',
+     ''' DROP INDEX IF EXISTS assignment_status_id ''',
+     ''' CREATE INDEX IF NOT EXISTS assignment_emp_task_status ON assignment (emp_id, task_id, status_id) ''',
+     ''' CREATE INDEX IF NOT EXISTS assignment_task_status_emp ON assignment (task_id, status_id, emp_id) ''',
+     ''' CREATE INDEX IF NOT EXISTS assignment_status_emp_task ON assignment (status_id, emp_id, task_id) '''],
+
+    # 5 - full-text search over employees, tasks and statuses, the rowid of an entry is
+    # id * 4 + 1 for an employee, id * 4 + 2 for a task and id * 4 + 3 for a status
+    [''' CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+             title, body, prefix = '2 3', tokenize = 'unicode61 remove_diacritics 2'
+         ) ''',
+     ''' INSERT INTO search_index (search_index, rank) VALUES ('rank', 'bm25(10.0, 1.0)') ''',
+     ''' INSERT INTO search_index (rowid, title, body)
+             SELECT id * 4 + 1, first || ' ' || last, IFNULL(email, '') || ' ' || IFNULL(phone, '') FROM employee ''',
+     ''' INSERT INTO search_index (rowid, title, body) SELECT id * 4 + 2, name, description FROM task ''',
+     ''' INSERT INTO search_index (rowid, title, body) SELECT id * 4 + 3, description, '' FROM status ''',
+     ''' CREATE TRIGGER IF NOT EXISTS search_employee_insert AFTER INSERT ON employee
+         BEGIN
+             INSERT INTO search_index (rowid, title, body)
+                 VALUES (NEW.id * 4 + 1, NEW.first || ' ' || NEW.last, IFNULL(NEW.email, '') || ' ' || IFNULL(NEW.phone, ''));
+         END ''',
+     ''' CREATE TRIGGER IF NOT EXISTS search_employee_update AFTER UPDATE ON employee
+         BEGIN
+             DELETE FROM search_index WHERE rowid = OLD.id * 4 + 1;
+             INSERT INTO search_index (rowid, title, body)
+                 VALUES (NEW.id * 4 + 1, NEW.first || ' ' || NEW.last, IFNULL(NEW.email, '') || ' ' || IFNULL(NEW.phone, ''));
+         END ''',
+     ''' CREATE TRIGGER IF NOT EXISTS search_employee_delete AFTER DELETE ON employee
+         BEGIN
+             DELETE FROM search_index WHERE rowid = OLD.id * 4 + 1;
+         END ''',
+     ''' CREATE TRIGGER IF NOT EXISTS search_task_insert AFTER INSERT ON task
+         BEGIN
+             INSERT INTO search_index (rowid, title, body) VALUES (NEW.id * 4 + 2, NEW.name, NEW.description);
+         END ''',
+     ''' CREATE TRIGGER IF NOT EXISTS search_task_update AFTER UPDATE ON task
+         BEGIN
+             DELETE FROM search_index WHERE rowid = OLD.id * 4 + 2;
+             INSERT INTO search_index (rowid, title, body) VALUES (NEW.id * 4 + 2, NEW.name, NEW.description);
+         END ''',
+     ''' CREATE TRIGGER IF NOT EXISTS search_task_delete AFTER DELETE ON task
+         BEGIN
+             DELETE FROM search_index WHERE rowid = OLD.id * 4 + 2;
+         END ''',
+     ''' CREATE TRIGGER IF NOT EXISTS search_status_insert AFTER INSERT ON status
+         BEGIN
+             INSERT INTO search_index (rowid, title, body) VALUES (NEW.id * 4 + 3, NEW.description, '');
+         END ''',
+     ''' CREATE TRIGGER IF NOT EXISTS search_status_update AFTER UPDATE ON status
+         BEGIN
+             DELETE FROM search_index WHERE rowid = OLD.id * 4 + 3;
+             INSERT INTO search_index (rowid, title, body) VALUES (NEW.id * 4 + 3, NEW.description, '');
+         END ''',
+     ''' CREATE TRIGGER IF NOT EXISTS search_status_delete AFTER DELETE ON status
+         BEGIN
+             DELETE FROM search_index WHERE rowid = OLD.id * 4 + 3;
+         END '''],
+
+    # 6 - case-insensitive name indexes for the type-ahead prefix lookups
+    [''' CREATE INDEX IF NOT EXISTS employee_full_name_nocase ON employee (full_name COLLATE NOCASE) ''',
+     ''' CREATE INDEX IF NOT EXISTS task_name_nocase ON task (name COLLATE NOCASE) ''',
+     ''' CREATE INDEX IF NOT EXISTS status_description_nocase ON status (description COLLATE NOCASE) '''],
+
+    # 7 - task price and hours ranges for the assignment filters, with table statistics so
+    # the planner can tell a narrow range from a broad one
+    [''' CREATE INDEX IF NOT EXISTS task_price ON task (price) ''',
+     ''' CREATE INDEX IF NOT EXISTS task_hours ON task (hours) ''',
+     ''' ANALYZE '''],
+
+    # 8 - the foreign key indexes dropped by 4 again, they hold the assignments of each employee,
+    # task and status in id order for the pages sorted by name
+    [''' CREATE INDEX IF NOT EXISTS assignment_emp_id ON assignment (emp_id) ''',
+     ''' CREATE INDEX IF NOT EXISTS assignment_task_id ON assignment (task_id) ''',
+     ''' CREATE INDEX IF NOT EXISTS assignment_status_id ON assignment (status_id) ''',
+     ''' ANALYZE '''],
+]
+
+
+def get_version(conn: sqlite3.Connection):
+    """
+    Reads the schema version of a database
+
+    :param conn: an open database connection
+    :return:
+        int - the schema version, 0 for a database that was never migrated
+    """
+
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def latest_version():
+    """Returns the schema version the migrations bring a database up to"""
+
+    return len(MIGRATIONS)
+
+
+def migrate(conn: sqlite3.Connection, target: int = None):
+    """
+    Applies every migration newer than the database schema version
+
+    Each migration runs in its own transaction together with the version bump, so a
+    failed migration leaves the database at the last good version.
+
+    :param conn: an open database connection
+    :param target: version to stop at, defaults to the latest version
+    :return:
+        list - the version numbers that were applied
+    """
+
+    target = latest_version() if target is None else target
+    applied = []
+    for version in range(get_version(conn) + 1, target + 1):
+        try:
+            conn.execute('BEGIN')
+            for statement in MIGRATIONS[version - 1]:
+                conn.execute(statement)
+            conn.execute('PRAGMA user_version = {:d}'.format(version))
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        applied.append(version)
+    return applied
+
+
+def reset(conn: sqlite3.Connection):
+    """
+    Marks a database as never migrated, used after its tables have been dropped
+
+    :param conn: an open database connection
+    """
+
+    conn.execute('PRAGMA user_version = 0')
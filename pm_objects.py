@@ -9,6 +9,12 @@ Last modified 12/5/2020
 
 import re
 
+FIRST_NAME_PATTERN = re.compile('^[A-Z][a-zA-Z]*$')
+LAST_NAME_PATTERN = re.compile('^[a-zA-Z]+([\'-][a-zA-Z]+)*$')
+EMAIL_PATTERN = re.compile('^[a-z0-9]+[\\._]?[a-z0-9]+[\\._]?[a-z0-9]+[@]\\w+[.]\\w{2,3}$')
+NON_DIGIT_PATTERN = re.compile('[^0-9]')
+STANDARD_PHONE_PATTERN = re.compile('[0-9]{3}-[0-9]{3}-[0-9]{4}')
+
 
 def verify_first_name(first: str):
     """
@@ -19,9 +25,8 @@ def verify_first_name(first: str):
         first - validated first name
     """
 
-    reg_exp = '^[A-Z][a-zA-Z]*$'
     first = first.strip()
-    if re.search(reg_exp, first):
+    if FIRST_NAME_PATTERN.search(first):
         return first
     else:
         raise TypeError('Not a valid first name')
@@ -36,9 +41,8 @@ def verify_last_name(last: str):
         last - validated last name
     """
 
-    reg_exp = '^[a-zA-Z]+([\'-][a-zA-Z]+)*$'
     last = last.strip()
-    if re.search(reg_exp, last):
+    if LAST_NAME_PATTERN.search(last):
         return last
     else:
         raise TypeError('Not a valid last name')
@@ -53,9 +57,8 @@ def verify_email(email: str):
         email - validated email address
     """
 
-    reg_exp = '^[a-z0-9]+[\\._]?[a-z0-9]+[\\._]?[a-z0-9]+[@]\\w+[.]\\w{2,3}$'
     email = email.strip().lower()
-    if re.search(reg_exp, email):
+    if EMAIL_PATTERN.search(email):
         return email
     else:
         raise TypeError('Not a valid email')
@@ -70,7 +73,7 @@ def verify_phone(phone: str):
         phone - validated and standardized phone number
     """
 
-    phone = re.sub('[^0-9]', "", phone.strip())
+    phone = NON_DIGIT_PATTERN.sub("", phone.strip())
     if len(phone) != 10:
         raise TypeError('Not a valid phone number, must have 10 digits')
     else:
@@ -126,9 +129,202 @@ def verify_number(numb: float):
         raise TypeError('Hours and Price data must be numeric')
 
 
+def _strings(values: list):
+    """Strips the string values of a column, replacing anything else with None"""
+
+    return [value.strip() if isinstance(value, str) else None for value in values]
+
+
+def _errors(values: list, message: str):
+    """Builds the error mask of a checked column, message where the value is None"""
+
+    return [None if value is not None else message for value in values]
+
+
+def check_first_names(values: list):
+    """
+    Validates a column of first names
+
+    :param values: a sequence of user supplied fields
+    :return:
+        tuple - (validated first names, error messages), each value or message None where not applicable
+    """
+
+    search = FIRST_NAME_PATTERN.search
+    values = [value if value is not None and search(value) else None for value in _strings(values)]
+    return values, _errors(values, 'Not a valid first name')
+
+
+def check_last_names(values: list):
+    """
+    Validates a column of last names
+
+    :param values: a sequence of user supplied fields
+    :return:
+        tuple - (validated last names, error messages), each value or message None where not applicable
+    """
+
+    search = LAST_NAME_PATTERN.search
+    values = [value if value is not None and search(value) else None for value in _strings(values)]
+    return values, _errors(values, 'Not a valid last name')
+
+
+def check_emails(values: list):
+    """
+    Validates a column of email addresses
+
+    :param values: a sequence of user supplied fields
+    :return:
+        tuple - (validated email addresses, error messages), each value or message None where not applicable
+    """
+
+    search = EMAIL_PATTERN.search
+    values = [value.lower() if value is not None else None for value in _strings(values)]
+    values = [value if value is not None and search(value) else None for value in values]
+    return values, _errors(values, 'Not a valid email')
+
+
+def check_phones(values: list):
+    """
+    Validates and transforms a column of phone numbers into standard notation
+
+    :param values: a sequence of user supplied fields
+    :return:
+        tuple - (standardized phone numbers, error messages), each value or message None where not applicable
+    """
+
+    standard = STANDARD_PHONE_PATTERN.fullmatch
+    sub = NON_DIGIT_PATTERN.sub
+    values = _strings(values)
+    digits = [None if value is None or standard(value) else sub('', value) for value in values]
+    values = [value if phone is None else phone[:3] + '-' + phone[3:6] + '-' + phone[-4:] if len(phone) == 10 else None
+              for value, phone in zip(values, digits)]
+    return values, _errors(values, 'Not a valid phone number, must have 10 digits')
+
+
+def check_names(values: list):
+    """
+    Validates a column of names
+
+    :param values: a sequence of user supplied fields
+    :return:
+        tuple - (validated names, error messages), each value or message None where not applicable
+    """
+
+    values = [value if value is not None and len(value) > 1 else None for value in _strings(values)]
+    return values, _errors(values, 'Not a valid name')
+
+
+def check_descriptions(values: list):
+    """
+    Validates a column of descriptions
+
+    :param values: a sequence of user supplied fields
+    :return:
+        tuple - (validated descriptions, error messages), each value or message None where not applicable
+    """
+
+    values = [value if value is not None and len(value) > 1 else None for value in _strings(values)]
+    return values, _errors(values, 'Not a valid description')
+
+
+def check_numbers(values: list):
+    """
+    Validates a column of prices/hours
+
+    :param values: a sequence of user supplied fields
+    :return:
+        tuple - (validated prices/hours, error messages), each value or message None where not applicable
+    """
+
+    numbers = []
+    errors = []
+    for value in values:
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            numbers.append(None)
+            errors.append('Hours and Price data must be numeric')
+            continue
+        if value > 0:
+            numbers.append(value)
+            errors.append(None)
+        else:
+            numbers.append(None)
+            errors.append('Numbers must be greater than zero')
+    return numbers, errors
+
+
+def validate_rows(rows: list, checkers: tuple):
+    """
+    Validates rows a whole column at a time, without raising for invalid rows
+
+    :param rows: a list of tuples of user supplied fields
+    :param checkers: the check function of each field
+    :return:
+        tuple - (validated rows, error messages), lists as long as rows, holding None for
+        the rows that failed and for the rows that passed respectively
+    """
+
+    if not rows:
+        return [], []
+    checked = [check(column) for check, column in zip(checkers, zip(*rows))]
+    values = list(zip(*(column for column, _ in checked)))
+    errors = [None] * len(rows)
+    for _, column_errors in reversed(checked):
+        if any(column_errors):
+            errors = [error or previous for error, previous in zip(column_errors, errors)]
+    if any(errors):
+        values = [None if error else row for row, error in zip(values, errors)]
+    return values, errors
+
+
+EMPLOYEE_CHECKERS = (check_first_names, check_last_names, check_phones, check_emails)
+TASK_CHECKERS = (check_names, check_descriptions, check_numbers, check_numbers)
+STATUS_CHECKERS = (check_descriptions,)
+
+
+def validate_employees(rows: list):
+    """
+    Validates many employees at once
+
+    :param rows: a list of (first, last, phone, email) tuples
+    :return:
+        tuple - (validated rows, error messages), see validate_rows
+    """
+
+    return validate_rows(rows, EMPLOYEE_CHECKERS)
+
+
+def validate_tasks(rows: list):
+    """
+    Validates many tasks at once
+
+    :param rows: a list of (name, description, price, hours) tuples
+    :return:
+        tuple - (validated rows, error messages), see validate_rows
+    """
+
+    return validate_rows(rows, TASK_CHECKERS)
+
+
+def validate_statuses(rows: list):
+    """
+    Validates many statuses at once
+
+    :param rows: a list of (description,) tuples
+    :return:
+        tuple - (validated rows, error messages), see validate_rows
+    """
+
+    return validate_rows(rows, STATUS_CHECKERS)
+
+
 class Employee:
     """Represents an employee"""
 
+    __slots__ = ('__emp_id', '__first', '__last', '__phone', '__email')
+
     def __init__(self, first: str, last: str, phone: str, email: str, emp_id=-1):
         self.__emp_id = emp_id if emp_id != -1 else None
         self.__first = verify_first_name(first)
@@ -136,6 +332,20 @@ class Employee:
         self.__phone = verify_phone(phone)
         self.__email = verify_email(email)
 
+    @classmethod
+    def from_row(cls, row):
+        """
+        Builds an employee from a trusted database row without validating it again
+
+        :param row: a row of (id, first, last, phone, email), such as an sqlite3.Row
+        :return:
+            Employee
+        """
+
+        empl = cls.__new__(cls)
+        empl.__emp_id, empl.__first, empl.__last, empl.__phone, empl.__email = row
+        return empl
+
     def get_id(self):
         """Returns an employees id number"""
         return self.__emp_id
@@ -160,6 +370,8 @@ class Employee:
 class Task:
     """Represents a project task"""
 
+    __slots__ = ('__task_id', '__name', '__description', '__price', '__hours')
+
     def __init__(self, name: str, description: str, price: float, hours: float, task_id=-1):
         self.__task_id = task_id if task_id != -1 else None
         self.__name = verify_name(name)
@@ -167,6 +379,20 @@ class Task:
         self.__price = verify_number(price)
         self.__hours = verify_number(hours)
 
+    @classmethod
+    def from_row(cls, row):
+        """
+        Builds a task from a trusted database row without validating it again
+
+        :param row: a row of (id, name, description, price, hours), such as an sqlite3.Row
+        :return:
+            Task
+        """
+
+        task = cls.__new__(cls)
+        task.__task_id, task.__name, task.__description, task.__price, task.__hours = row
+        return task
+
     def get_id(self):
         """Returns an employees id number"""
         return self.__task_id
@@ -191,10 +417,26 @@ class Task:
 class Status:
     """Represents a project status"""
 
+    __slots__ = ('__status_id', '__description')
+
     def __init__(self, description: str, status_id=-1):
         self.__status_id = status_id if status_id != -1 else None
         self.__description = verify_description(description)
 
+    @classmethod
+    def from_row(cls, row):
+        """
+        Builds a status from a trusted database row without validating it again
+
+        :param row: a row of (id, description), such as an sqlite3.Row
+        :return:
+            Status
+        """
+
+        stat = cls.__new__(cls)
+        stat.__status_id, stat.__description = row
+        return stat
+
     def get_id(self):
         """Returns an employees id number"""
         return self.__status_id
@@ -207,12 +449,28 @@ class Status:
 class Assignment:
     """Represents a project assignment"""
 
+    __slots__ = ('__asgmt_id', '__emp_id', '__task_id', '__status_id')
+
     def __init__(self, emp_id: int, task_id: int, status_id: int, asgmt_id=-1):
         self.__asgmt_id = asgmt_id if asgmt_id != -1 else None
         self.__emp_id = emp_id
         self.__task_id = task_id
         self.__status_id = status_id
 
+    @classmethod
+    def from_row(cls, row):
+        """
+        Builds an assignment from a trusted database row without validating it again
+
+        :param row: a row of (id, emp_id, task_id, status_id), such as an sqlite3.Row
+        :return:
+            Assignment
+        """
+
+        asgmt = cls.__new__(cls)
+        asgmt.__asgmt_id, asgmt.__emp_id, asgmt.__task_id, asgmt.__status_id = row
+        return asgmt
+
     def get_id(self):
         """Returns an employees id number"""
         return self.__asgmt_id
@@ -0,0 +1,375 @@
+"""
+pm_queries.py
+(Project Manager)
+
+Registry of the SQL statements used by pm_db. Every statement is run through this
+module by name so its calls and time spent can be counted.
+
+Last modified 10/18/2026
+"""
+
+import threading
+import time
+
+# size of the prepared statement cache of every connection
+STATEMENT_CACHE_SIZE = 256
+# rows fetched at a time when a cursor is iterated
+FETCH_BATCH = 256
+
+ASSIGNMENT_SELECT = '''SELECT assignment.id, employee.full_name as Employee,
+                       task.name as Task, status.description as Status FROM assignment
+                       JOIN employee ON assignment.emp_ID = employee.id
+                       JOIN task ON assignment.task_ID = task.ID
+                       JOIN status ON assignment.status_ID = status.ID'''
+
+# the assignment rows sorted by a name, CROSS JOIN keeps the named table outermost so an unfiltered page
+# walks its name index and reads the assignments of each name in id order through the foreign key index
+# instead of sorting the whole join
+ASSIGNMENT_BY_NAME_SELECT = {
+    'employee': '''SELECT assignment.id, employee.full_name as Employee,
+                   task.name as Task, status.description as Status FROM employee
+                   CROSS JOIN assignment ON assignment.emp_ID = employee.id
+                   JOIN task ON assignment.task_ID = task.ID
+                   JOIN status ON assignment.status_ID = status.ID''',
+    'task': '''SELECT assignment.id, employee.full_name as Employee,
+               task.name as Task, status.description as Status FROM task
+               CROSS JOIN assignment ON assignment.task_ID = task.ID
+               JOIN employee ON assignment.emp_ID = employee.id
+               JOIN status ON assignment.status_ID = status.ID''',
+    'status': '''SELECT assignment.id, employee.full_name as Employee,
+                 task.name as Task, status.description as Status FROM status
+                 CROSS JOIN assignment ON assignment.status_ID = status.ID
+                 JOIN employee ON assignment.emp_ID = employee.id
+                 JOIN task ON assignment.task_ID = task.ID''',
+}
+
+# the same rows read from the denormalized copy kept by the assignment view triggers
+ASSIGNMENT_VIEW_SELECT = '''SELECT id, employee as Employee, task as Task, status as Status FROM assignment_view'''
+
+# the first matches of a full-text query in rowid order, which FTS5 reads without going through the
+# whole match set, shortest name first
+SEARCH_SELECT = '''SELECT CASE rowid % 4 WHEN 1 THEN 'employee' WHEN 2 THEN 'task' ELSE 'status' END as Kind,
+                          rowid / 4 as ID, title as Name, body as Detail
+                   FROM (SELECT rowid, title, body FROM search_index WHERE search_index MATCH ? LIMIT ?)
+                   ORDER BY length(title), rowid LIMIT ?'''
+
+EMPLOYEE_SELECT = '''SELECT id, first, last, phone, email FROM employee'''
+TASK_SELECT = '''SELECT id, name, description, price, hours FROM task'''
+STATUS_SELECT = '''SELECT id, description FROM status'''
+
+# conditions of the assignment filters on the assignment table or on the assignment view, each
+# one served by an index, {} in task_range stands for the price and hours bounds on the task table,
+# which the assignment query joins and the assignment view query looks up by task name
+ASSIGNMENT_FILTERS = {
+    'assignment': {
+        'employee': '''assignment.emp_id = (SELECT id FROM employee WHERE full_name = ?)''',
+        'task': '''assignment.task_id = (SELECT id FROM task WHERE name = ?)''',
+        'status': '''assignment.status_id = (SELECT id FROM status WHERE description = ?)''',
+        'task_range': '''{}''',
+    },
+    'assignment_view': {
+        'employee': '''assignment_view.employee = ?''',
+        'task': '''assignment_view.task = ?''',
+        'status': '''assignment_view.status = ?''',
+        'task_range': '''assignment_view.task IN (SELECT name FROM task WHERE {})''',
+    },
+}
+
+# totals per employee, task or status, read from {source} whose rows each stand for {count} assignments
+REPORT_SELECT = '''SELECT {name} AS {label}, sum({count}) AS Assignments,
+                          total({count} * task.price) AS Price, total({count} * task.hours) AS Hours,
+                          total(CASE WHEN status.description = ? THEN {count} END) / sum({count}) AS Completion
+                   FROM {source} AS a
+                   JOIN employee ON a.emp_id = employee.id
+                   JOIN task ON a.task_id = task.id
+                   JOIN status ON a.status_id = status.id
+                   GROUP BY a.{key} ORDER BY {name}'''
+
+# name column, heading and assignment key of each report grouping
+REPORT_GROUPS = {
+    'employee': ('employee.full_name', 'Employee', 'emp_id'),
+    'task': ('task.name', 'Task', 'task_id'),
+    'status': ('status.description', 'Status', 'status_id'),
+}
+
+QUERIES = {
+    'empty_table': '''SELECT EXISTS (SELECT 1 FROM employee) + EXISTS (SELECT 1 FROM task)
+                             + EXISTS (SELECT 1 FROM status) + EXISTS (SELECT 1 FROM assignment)''',
+    'table_exists': '''SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name = ?''',
+    'search_titles': SEARCH_SELECT,
+    'search': SEARCH_SELECT,
+
+    'employee_all': EMPLOYEE_SELECT,
+    'employee_last': EMPLOYEE_SELECT + ''' ORDER BY id DESC LIMIT 1''',
+    'employee_id': '''SELECT id FROM employee WHERE full_name=?''',
+    'employee_ids': '''SELECT full_name, id FROM employee ORDER BY id ASC LIMIT ?''',
+    'employee_ids_in': '''SELECT full_name, id FROM employee WHERE full_name IN ({})''',
+    'employee_names': '''SELECT full_name as Employee FROM employee ORDER BY id ASC''',
+    'employee_prefix': '''SELECT full_name FROM employee
+                          WHERE full_name >= ? COLLATE NOCASE AND full_name < ? COLLATE NOCASE
+                          ORDER BY full_name COLLATE NOCASE LIMIT ?''',
+    'employee_page': EMPLOYEE_SELECT,
+    'employee_count': '''SELECT count(*) FROM employee''',
+    'employee_insert': '''INSERT INTO employee(first, last, phone, email) VALUES(?,?,?,?)''',
+
+    'task_all': TASK_SELECT,
+    'task_last': TASK_SELECT + ''' ORDER BY id DESC LIMIT 1''',
+    'task_id': '''SELECT id FROM task WHERE name=?''',
+    'task_ids': '''SELECT name, id FROM task ORDER BY id ASC LIMIT ?''',
+    'task_ids_in': '''SELECT name, id FROM task WHERE name IN ({})''',
+    'task_names': '''SELECT name FROM task ORDER BY id ASC''',
+    'task_prefix': '''SELECT name FROM task WHERE name >= ? COLLATE NOCASE AND name < ? COLLATE NOCASE
+                      ORDER BY name COLLATE NOCASE LIMIT ?''',
+    'task_page': TASK_SELECT,
+    'task_count': '''SELECT count(*) FROM task''',
+    'task_insert': '''INSERT INTO task(name, description, price, hours) VALUES(?,?,?,?)''',
+
+    'status_all': STATUS_SELECT,
+    'status_last': STATUS_SELECT + ''' ORDER BY id DESC LIMIT 1''',
+    'status_id': '''SELECT id FROM status WHERE description=?''',
+    'status_ids': '''SELECT description, id FROM status ORDER BY id ASC LIMIT ?''',
+    'status_ids_in': '''SELECT description, id FROM status WHERE description IN ({})''',
+    'status_names': '''SELECT description FROM status ORDER BY id ASC''',
+    'status_prefix': '''SELECT description FROM status
+                        WHERE description >= ? COLLATE NOCASE AND description < ? COLLATE NOCASE
+                        ORDER BY description COLLATE NOCASE LIMIT ?''',
+    'status_page': STATUS_SELECT,
+    'status_count': '''SELECT count(*) FROM status''',
+    'status_insert': '''INSERT INTO status(description) VALUES(?)''',
+
+    'assignment_all': ASSIGNMENT_SELECT,
+    'assignment_last': ASSIGNMENT_SELECT + ''' ORDER BY assignment.id DESC LIMIT 1''',
+    'assignment_by_empl': ASSIGNMENT_SELECT + ''' WHERE employee.full_name = ?''',
+    'assignment_by_stat': ASSIGNMENT_SELECT + ''' WHERE status.description = ?''',
+    'assignment_page': ASSIGNMENT_SELECT,
+    'assignment_page_employee': ASSIGNMENT_BY_NAME_SELECT['employee'],
+    'assignment_page_task': ASSIGNMENT_BY_NAME_SELECT['task'],
+    'assignment_page_status': ASSIGNMENT_BY_NAME_SELECT['status'],
+    'assignment_filtered': ASSIGNMENT_SELECT,
+    'assignment_all_view': ASSIGNMENT_VIEW_SELECT,
+    'assignment_last_view': ASSIGNMENT_VIEW_SELECT + ''' ORDER BY id DESC LIMIT 1''',
+    'assignment_by_empl_view': ASSIGNMENT_VIEW_SELECT + ''' WHERE employee = ?''',
+    'assignment_by_stat_view': ASSIGNMENT_VIEW_SELECT + ''' WHERE status = ?''',
+    'assignment_page_view': ASSIGNMENT_VIEW_SELECT,
+    'assignment_filtered_view': ASSIGNMENT_VIEW_SELECT,
+    'assignment_detail_view': '''SELECT employee as Employee, task as Task, status as Status
+                                 FROM assignment_view WHERE id = ?''',
+    'assignment_ids': '''SELECT id FROM assignment''',
+    'assignment_id_range': '''SELECT id FROM assignment WHERE id BETWEEN ? AND ? ORDER BY id LIMIT ?''',
+    'assignment_max_id': '''SELECT max(id) FROM assignment''',
+    'assignment_columns': '''SELECT id, emp_id, task_id, status_id FROM assignment ORDER BY id''',
+    'assignment_detail': '''SELECT employee.full_name as Employee, task.name as Task, status.description as Status
+                            FROM assignment
+                            JOIN employee ON assignment.emp_ID = employee.id
+                            JOIN task ON assignment.task_ID = task.ID
+                            JOIN status ON assignment.status_ID = status.ID
+                            WHERE assignment.id = ?''',
+    'assignment_emp_id': '''SELECT emp_id FROM assignment WHERE id = ?''',
+    'assignment_task_id': '''SELECT task_id FROM assignment WHERE id = ?''',
+    'assignment_status_id': '''SELECT status_id FROM assignment WHERE id = ?''',
+    'assignment_count': '''SELECT count(*) FROM assignment''',
+    'assignment_insert': '''INSERT INTO assignment(emp_id, task_id, status_id) VALUES(?,?,?)''',
+    'assignment_update': '''UPDATE assignment SET emp_id = ? , task_id = ? , status_id = ? WHERE id = ?''',
+}
+QUERIES.update({'report_' + group: REPORT_SELECT.format(name=name, label=label, key=key, source='assignment', count='1')
+                for group, (name, label, key) in REPORT_GROUPS.items()})
+QUERIES.update({'report_' + group + '_summary': REPORT_SELECT.format(name=name, label=label, key=key,
+                                                                     source='assignment_summary', count='a.assignments')
+                for group, (name, label, key) in REPORT_GROUPS.items()})
+
+# copies the joined rows of the assignments matching {} into assignment_view
+ASSIGNMENT_VIEW_FILL = '''INSERT OR REPLACE INTO assignment_view (id, employee, task, status)
+                              SELECT assignment.id, employee.full_name, task.name, status.description
+                              FROM assignment
+                              JOIN employee ON assignment.emp_ID = employee.id
+                              JOIN task ON assignment.task_ID = task.ID
+                              JOIN status ON assignment.status_ID = status.ID
+                              WHERE {}'''
+
+
+def _view_triggers(table: str, key: str, columns: str):
+    """Builds the triggers keeping assignment_view in step with the rows of one base table"""
+
+    refresh = ASSIGNMENT_VIEW_FILL.format('assignment.{} = NEW.id'.format(key))
+    remove = 'DELETE FROM assignment_view WHERE id IN (SELECT id FROM assignment WHERE {} = OLD.id)'.format(key)
+    return [
+        '''CREATE TRIGGER IF NOT EXISTS assignment_view_{0}_insert AFTER INSERT ON {0}
+           BEGIN {1}; END'''.format(table, refresh),
+        '''CREATE TRIGGER IF NOT EXISTS assignment_view_{0}_update AFTER UPDATE OF {1} ON {0}
+           BEGIN {2}; {3}; END'''.format(table, columns, remove, refresh),
+        '''CREATE TRIGGER IF NOT EXISTS assignment_view_{0}_delete AFTER DELETE ON {0}
+           BEGIN {1}; END'''.format(table, remove),
+    ]
+
+
+# creates and fills the denormalized assignment table along with the triggers maintaining it
+ASSIGNMENT_VIEW_ENABLE = [
+    '''CREATE TABLE IF NOT EXISTS assignment_view (
+           id integer PRIMARY KEY,
+           employee text NOT NULL,
+           task text NOT NULL,
+           status text NOT NULL
+       )''',
+    '''CREATE INDEX IF NOT EXISTS assignment_view_employee ON assignment_view (employee)''',
+    '''CREATE INDEX IF NOT EXISTS assignment_view_task ON assignment_view (task)''',
+    '''CREATE INDEX IF NOT EXISTS assignment_view_status ON assignment_view (status)''',
+    '''DELETE FROM assignment_view''',
+    ASSIGNMENT_VIEW_FILL.format('1'),
+    '''CREATE TRIGGER IF NOT EXISTS assignment_view_assignment_insert AFTER INSERT ON assignment
+       BEGIN {}; END'''.format(ASSIGNMENT_VIEW_FILL.format('assignment.id = NEW.id')),
+    '''CREATE TRIGGER IF NOT EXISTS assignment_view_assignment_update AFTER UPDATE ON assignment
+       BEGIN DELETE FROM assignment_view WHERE id = OLD.id; {}; END'''.format(
+        ASSIGNMENT_VIEW_FILL.format('assignment.id = NEW.id')),
+    '''CREATE TRIGGER IF NOT EXISTS assignment_view_assignment_delete AFTER DELETE ON assignment
+       BEGIN DELETE FROM assignment_view WHERE id = OLD.id; END''',
+] + _view_triggers('employee', 'emp_id', 'id, first, last') \
+  + _view_triggers('task', 'task_id', 'id, name') \
+  + _view_triggers('status', 'status_id', 'id, description')
+
+ASSIGNMENT_VIEW_DISABLE = ['DROP TRIGGER IF EXISTS assignment_view_{}_{}'.format(table, event)
+                           for table in ('assignment', 'employee', 'task', 'status')
+                           for event in ('insert', 'update', 'delete')] + ['DROP TABLE IF EXISTS assignment_view']
+
+_STATS = {}
+_STATS_LOCK = threading.Lock()
+
+
+def _record(name: str, seconds: float, elapsed: float = None):
+    """
+    Counts time spent on a statement
+
+    :param name: name of the statement
+    :param seconds: time to add to its total
+    :param elapsed: time spent so far on the call when seconds is a fetch of its rows, None for a new call
+    """
+
+    with _STATS_LOCK:
+        calls, total, slowest = _STATS.get(name, (0, 0.0, 0.0))
+        _STATS[name] = (calls + (elapsed is None), total + seconds, max(slowest, seconds if elapsed is None else elapsed))
+
+
+class TimedCursor:
+    """
+    Cursor whose fetches count toward the time of the statement that made it, so a read
+    streamed with fetchmany or iteration is timed through its last row
+    """
+
+    def __init__(self, cursor, name: str, elapsed: float):
+        self._cursor = cursor
+        self._name = name
+        self._elapsed = elapsed
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        while True:
+            rows = self.fetchmany(FETCH_BATCH)
+            if not rows:
+                return
+            yield from rows
+
+    def fetchone(self):
+        return self._timed(self._cursor.fetchone)
+
+    def fetchmany(self, size: int = None):
+        return self._timed(self._cursor.fetchmany, self._cursor.arraysize if size is None else size)
+
+    def fetchall(self):
+        return self._timed(self._cursor.fetchall)
+
+    def _timed(self, fetch, *args):
+        start = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            seconds = time.perf_counter() - start
+            self._elapsed += seconds
+            _record(self._name, seconds, self._elapsed)
+
+
+def execute(target, name: str, params=(), sql: str = None):
+    """
+    Runs a registered statement and counts its time, including the time spent fetching
+    its rows from the returned cursor
+
+    :param target: a connection or cursor to run the statement on
+    :param name: name of the statement in QUERIES
+    :param params: statement parameters
+    :param sql: the SQL to run instead of the registered text, for statements built
+        from a registered one such as pages
+    :return:
+        TimedCursor - the cursor the statement ran on
+    """
+
+    start = time.perf_counter()
+    try:
+        cursor = target.execute(sql or QUERIES[name], params)
+    finally:
+        elapsed = time.perf_counter() - start
+        _record(name, elapsed)
+    return TimedCursor(cursor, name, elapsed)
+
+
+def executemany(cur, name: str, seq_of_params):
+    """
+    Runs a registered statement once per parameter tuple and counts its time
+
+    :param cur: a cursor
+    :param name: name of the statement in QUERIES
+    :param seq_of_params: an iterable of parameter tuples
+    :return:
+        the cursor the statement ran on
+    """
+
+    start = time.perf_counter()
+    try:
+        return cur.executemany(QUERIES[name], seq_of_params)
+    finally:
+        _record(name, time.perf_counter() - start)
+
+
+def lookup(conn, name: str, params=()):
+    """
+    Runs a registered single row lookup on a cursor kept open for that statement, so hot
+    lookups skip creating a cursor as well as parsing and planning
+
+    :param conn: a connection, its cursors are reused if it has a cursors dictionary
+    :param name: name of the statement in QUERIES
+    :param params: statement parameters
+    :return:
+        the first row, None if there is none
+    """
+
+    cursors = getattr(conn, 'cursors', None)
+    if cursors is None:
+        cur = conn.cursor()
+    else:
+        cur = cursors.get(name)
+        if cur is None:
+            cur = cursors[name] = conn.cursor()
+    start = time.perf_counter()
+    try:
+        return cur.execute(QUERIES[name], params).fetchone()
+    finally:
+        _record(name, time.perf_counter() - start)
+
+
+def stats():
+    """
+    Reports how often each statement ran and how long it took, slowest total first
+
+    :return:
+        list of (name, calls, total seconds, average seconds, slowest seconds)
+    """
+
+    with _STATS_LOCK:
+        rows = [(name, calls, total, total / calls, slowest) for name, (calls, total, slowest) in _STATS.items()]
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+def reset_stats():
+    """Clears every timing counter"""
+
+    with _STATS_LOCK:
+        _STATS.clear()
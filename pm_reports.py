@@ -0,0 +1,131 @@
+"""
+pm_reports.py
+(Project Manager)
+
+Reports of the billed price, hours and completion of assignments grouped by employee,
+task or status. The totals are computed by SQLite over covering indexes, or read from an
+optional summary table that triggers keep up to date as assignments are inserted,
+modified and deleted.
+
+Last modified 10/18/2026
+"""
+
+import pm_db
+
+# status description counted as completed by the completion ratio
+COMPLETED_STATUS = 'Completed'
+
+GROUPS = ('employee', 'task', 'status')
+
+# assignment counts per employee, task and status combination, usually far fewer rows
+# than the assignments themselves
+SUMMARY_TABLE = 'assignment_summary'
+
+ENABLE_SUMMARY = [
+    ''' CREATE TABLE IF NOT EXISTS assignment_summary (
+            emp_id integer NOT NULL,
+            task_id integer NOT NULL,
+            status_id integer NOT NULL,
+            assignments integer NOT NULL,
+            PRIMARY KEY (emp_id, task_id, status_id)
+        ) WITHOUT ROWID ''',
+    ''' DELETE FROM assignment_summary ''',
+    ''' INSERT INTO assignment_summary (emp_id, task_id, status_id, assignments)
+            SELECT emp_id, task_id, status_id, count(*) FROM assignment
+            GROUP BY emp_id, task_id, status_id ''',
+    ''' CREATE TRIGGER IF NOT EXISTS assignment_summary_insert AFTER INSERT ON assignment
+        BEGIN
+            INSERT INTO assignment_summary (emp_id, task_id, status_id, assignments)
+                VALUES (NEW.emp_id, NEW.task_id, NEW.status_id, 1)
+                ON CONFLICT (emp_id, task_id, status_id) DO UPDATE SET assignments = assignments + 1;
+        END ''',
+    ''' CREATE TRIGGER IF NOT EXISTS assignment_summary_update
+        AFTER UPDATE OF emp_id, task_id, status_id ON assignment
+        BEGIN
+            UPDATE assignment_summary SET assignments = assignments - 1
+                WHERE emp_id = OLD.emp_id AND task_id = OLD.task_id AND status_id = OLD.status_id;
+            DELETE FROM assignment_summary
+                WHERE emp_id = OLD.emp_id AND task_id = OLD.task_id AND status_id = OLD.status_id
+                AND assignments = 0;
+            INSERT INTO assignment_summary (emp_id, task_id, status_id, assignments)
+                VALUES (NEW.emp_id, NEW.task_id, NEW.status_id, 1)
+                ON CONFLICT (emp_id, task_id, status_id) DO UPDATE SET assignments = assignments + 1;
+        END ''',
+    ''' CREATE TRIGGER IF NOT EXISTS assignment_summary_delete AFTER DELETE ON assignment
+        BEGIN
+            UPDATE assignment_summary SET assignments = assignments - 1
+                WHERE emp_id = OLD.emp_id AND task_id = OLD.task_id AND status_id = OLD.status_id;
+            DELETE FROM assignment_summary
+                WHERE emp_id = OLD.emp_id AND task_id = OLD.task_id AND status_id = OLD.status_id
+                AND assignments = 0;
+        END ''',
+]
+
+DISABLE_SUMMARY = [
+    ''' DROP TRIGGER IF EXISTS assignment_summary_insert ''',
+    ''' DROP TRIGGER IF EXISTS assignment_summary_update ''',
+    ''' DROP TRIGGER IF EXISTS assignment_summary_delete ''',
+    ''' DROP TABLE IF EXISTS assignment_summary ''',
+]
+
+
+def enable_summary():
+    """Creates the summary table from the current assignments and the triggers that maintain it"""
+
+    pm_db.execute_statements(ENABLE_SUMMARY)
+
+
+def disable_summary():
+    """Drops the summary table and its triggers, reports are then computed from the assignments"""
+
+    pm_db.execute_statements(DISABLE_SUMMARY)
+
+
+def summary_enabled():
+    """
+    Determines if the summary table is in use
+
+    :return:
+        bool - True if the summary table exists, False if not
+    """
+
+    return pm_db.table_exists(SUMMARY_TABLE)
+
+
+def report(group: str, use_summary: bool = None):
+    """
+    Totals the assignments per employee, task or status
+
+    :param group: employee, task or status
+    :param use_summary: True to read the summary table, False to read the assignments,
+        defaults to the summary table when it is enabled
+    :return:
+        list of rows of (name, Assignments, Price, Hours, Completion), where Price and
+        Hours are the totals of the assigned tasks and Completion is the share of the
+        assignments with the COMPLETED_STATUS
+    """
+
+    if group not in GROUPS:
+        raise ValueError('Cannot report by {}, use one of {}'.format(group, ', '.join(GROUPS)))
+    if use_summary is None:
+        use_summary = summary_enabled()
+    name = 'report_' + group + ('_summary' if use_summary else '')
+    return pm_db.read(name, (COMPLETED_STATUS,)).fetchall()
+
+
+def by_employee(use_summary: bool = None):
+    """Totals the assignments per employee, see report"""
+
+    return report('employee', use_summary)
+
+
+def by_task(use_summary: bool = None):
+    """Totals the assignments per task, see report"""
+
+    return report('task', use_summary)
+
+
+def by_status(use_summary: bool = None):
+    """Totals the assignments per status, see report"""
+
+    return report('status', use_summary)
@@ -7,57 +7,34 @@ GUI Project Manager software that stores data into a database
 Last modified 12/5/2020
 """
 
+from functools import partial
+import sqlite3
+import sys
+import time
+import traceback
+import types
 from tkinter import ttk
 import tkinter as tk
 import pm_db
-from tkinter import *
-import urllib.request
+import pm_widgets
+import pm_worker
 import pm_objects
 from tkinter import messagebox
-import tkinter.messagebox
 
+# quiet time after the last keystroke before the search box looks the text up
+SEARCH_DELAY_MS = 150
 ABOUT = 'pm_objects.py\n(Project Manager)\nCoded by Marcos Simoes\nGUI Project Manager software that stores data into a database'
 
 
 def create_tables():
-    """Creates the 4 tables used by the project management software"""
-
-    sql_create_employee_table = ''' CREATE TABLE IF NOT EXISTS employee (
-                                        id integer PRIMARY KEY,
-                                        first text NOT NULL,
-                                        last text NOT NULL,
-                                        phone text,
-                                        email text,
-                                        UNIQUE (first, last)
-                                    ); '''
-
-    sql_create_task_table = '''CREATE TABLE IF NOT EXISTS task (
-                                    id integer PRIMARY KEY,
-                                    name text NOT NULL UNIQUE,
-                                    description text NOT NULL,
-                                    price real NOT NULL,
-                                    hours real NOT NULL
-                                );'''
-
-    sql_create_status_table = '''CREATE TABLE IF NOT EXISTS status (
-                                    id integer PRIMARY KEY,
-                                    description text NOT NULL UNIQUE
-                                );'''
-
-    sql_create_assignment_table = '''CREATE TABLE IF NOT EXISTS assignment (
-                                    id integer PRIMARY KEY,
-                                    emp_id integer NOT NULL,
-                                    task_id integer NOT NULL,
-                                    status_id integer NOT NULL,
-                                    FOREIGN KEY (emp_id) REFERENCES employee (id),
-                                    FOREIGN KEY (task_id) REFERENCES task (id),
-                                    FOREIGN KEY (status_id) REFERENCES status (id)
-                                );'''
-
-    pm_db.create_table(sql_create_employee_table)
-    pm_db.create_table(sql_create_task_table)
-    pm_db.create_table(sql_create_status_table)
-    pm_db.create_table(sql_create_assignment_table)
+    """
+    Creates the 4 tables used by the project management software along with their indexes
+
+    :return:
+        list - the schema versions that were applied, including 1 when the tables were just created
+    """
+
+    return pm_db.migrate()
 
 
 def populate_tables():
@@ -65,54 +42,39 @@ def populate_tables():
 
     pm_db.drop_all_tables()
     create_tables()
-    pm_db.insert_employee(pm_objects.Employee('Alfreds', 'Futterkiste', '311-555-2368', 'afutterkiste@protonmail.com'))
-    pm_db.insert_employee(pm_objects.Employee('Artie', 'Bucco', '212-664-7665', 'nuovovesuvio@gmail.com'))
-    pm_db.insert_employee(pm_objects.Employee('Jennifer', 'Melfi', '212-718-1234', 'melfipsychiatry@outlook.com'))
-    pm_db.insert_employee(pm_objects.Employee('Christopher', 'Moltisanti', '916-225-5887', 'dimeo2@yahoo.com'))
-    pm_db.insert_employee(pm_objects.Employee('Salvatore', 'Bonpensiero', '415-273-9164', 'bigp@icloud.com'))
-    pm_db.insert_task(pm_objects.Task('Graylyn', 'Cater wedding', 3550.00, 4.5))
-    pm_db.insert_task(pm_objects.Task('Wilshire', 'Manicure playing field', 2000.00, 5))
-    pm_db.insert_task(pm_objects.Task('Wells Fargo Center', 'Clean exterior windows', 15000.00, 300))
-    pm_db.insert_task(pm_objects.Task('W-S Beltway', 'Clear acre of land for road construction', 2150.00, 3.5))
-    pm_db.insert_task(pm_objects.Task('Winston Salem Fairgrounds', 'General cleanup after an event', 500.00, 4))
-    pm_db.insert_status(pm_objects.Status('Not started'))
-    pm_db.insert_status(pm_objects.Status('In Progress'))
-    pm_db.insert_status(pm_objects.Status('Completed'))
-    pm_db.insert_status(pm_objects.Status('Postponed'))
-    pm_db.insert_status(pm_objects.Status('Cancelled'))
-    pm_db.insert_assignment(pm_objects.Assignment(1, 2, 3))
-    pm_db.insert_assignment(pm_objects.Assignment(2, 3, 1))
-    pm_db.insert_assignment(pm_objects.Assignment(3, 4, 2))
-    pm_db.insert_assignment(pm_objects.Assignment(4, 5, 3))
-    pm_db.insert_assignment(pm_objects.Assignment(5, 1, 1))
-    pm_db.insert_assignment(pm_objects.Assignment(1, 3, 2))
-    pm_db.insert_assignment(pm_objects.Assignment(2, 1, 3))
-    pm_db.insert_assignment(pm_objects.Assignment(3, 2, 1))
-    pm_db.insert_assignment(pm_objects.Assignment(4, 4, 2))
-    pm_db.insert_assignment(pm_objects.Assignment(5, 5, 2))
-
-
-def make_treeview_sortable(table: ttk.Treeview, col, reverse: bool):
-    """
-    Makes clicking the table headers sort the whole table by the selected field
-
-    :param table: a database table
-    :param col: the column header the user has clicked on
-    :param reverse: boolean value to toggles the sorting
-    """
-
-    try:
-        sequence = [(float(table.set(element, column=col)), element) for element in table.get_children("")]
-    except ValueError:
-        sequence = [(table.set(element, column=col), element) for element in table.get_children("")]
-    sequence.sort(reverse=reverse)
-    for index, (val, element) in enumerate(sequence):
-        table.move(element, "", index)
-    table.heading(column=col, text=col, command=lambda _col=col: make_treeview_sortable(table, _col, not reverse))
+    pm_db.insert_employee_many([
+        pm_objects.Employee('Alfreds', 'Futterkiste', '311-555-2368', 'afutterkiste@protonmail.com'),
+        pm_objects.Employee('Artie', 'Bucco', '212-664-7665', 'nuovovesuvio@gmail.com'),
+        pm_objects.Employee('Jennifer', 'Melfi', '212-718-1234', 'melfipsychiatry@outlook.com'),
+        pm_objects.Employee('Christopher', 'Moltisanti', '916-225-5887', 'dimeo2@yahoo.com'),
+        pm_objects.Employee('Salvatore', 'Bonpensiero', '415-273-9164', 'bigp@icloud.com')])
+    pm_db.insert_task_many([
+        pm_objects.Task('Graylyn', 'Cater wedding', 3550.00, 4.5),
+        pm_objects.Task('Wilshire', 'Manicure playing field', 2000.00, 5),
+        pm_objects.Task('Wells Fargo Center', 'Clean exterior windows', 15000.00, 300),
+        pm_objects.Task('W-S Beltway', 'Clear acre of land for road construction', 2150.00, 3.5),
+        pm_objects.Task('Winston Salem Fairgrounds', 'General cleanup after an event', 500.00, 4)])
+    pm_db.insert_status_many([
+        pm_objects.Status('Not started'),
+        pm_objects.Status('In Progress'),
+        pm_objects.Status('Completed'),
+        pm_objects.Status('Postponed'),
+        pm_objects.Status('Cancelled')])
+    pm_db.insert_assignment_many([
+        pm_objects.Assignment(1, 2, 3),
+        pm_objects.Assignment(2, 3, 1),
+        pm_objects.Assignment(3, 4, 2),
+        pm_objects.Assignment(4, 5, 3),
+        pm_objects.Assignment(5, 1, 1),
+        pm_objects.Assignment(1, 3, 2),
+        pm_objects.Assignment(2, 1, 3),
+        pm_objects.Assignment(3, 2, 1),
+        pm_objects.Assignment(4, 4, 2),
+        pm_objects.Assignment(5, 5, 2)])
 
 
 def add_employee(first: tk.StringVar, last: tk.StringVar, phone: tk.StringVar, email: tk.StringVar,
-                 table: ttk.Treeview, emp_list: list):
+                 table: pm_widgets.PagedTreeview):
     """
     Attempts to add an employee to the table with user entered values
 
@@ -121,16 +83,11 @@ def add_employee(first: tk.StringVar, last: tk.StringVar, phone: tk.StringVar, e
     :param phone: phone number
     :param email: email address
     :param table: a table widget
-    :param emp_list: a list of all employee full names
     """
 
     try:
         if pm_db.insert_employee(pm_objects.Employee(first.get(), last.get(), phone.get(), email.get())):
-            rows = pm_db.get_last_employee()
-            for employee in rows:
-                emp = list(employee)
-                table.insert("", tk.END, values=emp)
-            emp_list.append(first.get() + ' ' + last.get())
+            table.refresh()
             first.set("")
             last.set("")
             phone.set("")
@@ -139,8 +96,8 @@ def add_employee(first: tk.StringVar, last: tk.StringVar, phone: tk.StringVar, e
         messagebox.showerror("Validation Error", str(e))
 
 
-def add_task(name: tk.StringVar, desc: tk.StringVar, price: tk.StringVar, hours: tk.StringVar, table: ttk.Treeview,
-             task_list: list):
+def add_task(name: tk.StringVar, desc: tk.StringVar, price: tk.StringVar, hours: tk.StringVar,
+             table: pm_widgets.PagedTreeview):
     """
     Attempts to add a task to the table with user entered values
 
@@ -149,16 +106,11 @@ def add_task(name: tk.StringVar, desc: tk.StringVar, price: tk.StringVar, hours:
     :param price: price charged for price
     :param hours: estimated hours to complete task
     :param table: a table widget
-    :param task_list: a list of all task names
     """
 
     try:
         if pm_db.insert_task(pm_objects.Task(name.get(), desc.get(), price.get(), hours.get())):
-            rows = pm_db.get_last_task()
-            for task in rows:
-                tsk = list(task)
-                table.insert("", tk.END, values=tsk)
-            task_list.append(name.get())
+            table.refresh()
             name.set("")
             desc.set("")
             price.set("")
@@ -167,28 +119,45 @@ def add_task(name: tk.StringVar, desc: tk.StringVar, price: tk.StringVar, hours:
         messagebox.showerror("Validation Error", str(e))
 
 
-def add_status(desc: tk.StringVar, table: ttk.Treeview, status_list: list):
+def add_status(desc: tk.StringVar, table: pm_widgets.PagedTreeview):
     """
     Attempts to add a status to the table with a user entered value
 
     :param desc: description of project status
     :param table: a table widget
-    :param status_list: a list of all status descriptions
     """
 
     try:
         if pm_db.insert_status(pm_objects.Status(desc.get())):
-            rows = pm_db.get_last_status()
-            for status in rows:
-                stat = list(status)
-                table.insert("", tk.END, values=stat)
-            status_list.append(desc.get())
+            table.refresh()
             desc.set("")
     except TypeError as e:
         messagebox.showerror('Validation Error', str(e))
 
 
-def add_assignment(empl: str, task: str, stat: str, table: ttk.Treeview, asgmt_list: list):
+def find_ids(empl: str, task: str, stat: str):
+    """
+    Looks up the ids of typed or picked names, showing an error for a name that does not exist
+
+    :param empl: employee full name
+    :param task: task name
+    :param stat: status description
+    :return:
+        tuple - (emp_id, task_id, stat_id), None if a name was not found
+    """
+
+    ids = []
+    for kind, name, find in (('employee', empl, pm_db.get_employee_id), ('task', task, pm_db.get_task_id),
+                             ('status', stat, pm_db.get_stat_id)):
+        row = find(name)
+        if row is None:
+            messagebox.showerror('Validation Error', 'There is no {} named "{}"'.format(kind, name))
+            return None
+        ids.append(int(*row))
+    return tuple(ids)
+
+
+def add_assignment(empl: str, task: str, stat: str, table: pm_widgets.PagedTreeview):
     """
     Adds an assignment to the table from user selected values
 
@@ -196,16 +165,14 @@ def add_assignment(empl: str, task: str, stat: str, table: ttk.Treeview, asgmt_l
     :param task: task name
     :param stat: status description
     :param table: a table widget
-    :param asgmt_list: a list of all assignments ids
     """
 
-    emp_id = int(*pm_db.get_employee_id(empl))
-    task_id = int(*pm_db.get_task_id(task))
-    stat_id = int(*pm_db.get_stat_id(stat))
+    ids = find_ids(empl, task, stat)
+    if ids is None:
+        return
     try:
-        if pm_db.insert_assignment(pm_objects.Assignment(emp_id, task_id, stat_id)):
-            reload_asgmt_table(table)
-            asgmt_list.append((len([a for a, in pm_db.get_asgmt_ids()])))
+        if pm_db.insert_assignment(pm_objects.Assignment(*ids)):
+            table.refresh()
     except TypeError as e:
         messagebox.showerror('Validation Error', str(e))
 
@@ -220,220 +187,285 @@ def modify_assignment(asgmt_id: str, empl: str, task: str, stat: str):
     :param stat: a status description
     """
 
-    emp_id = int(*pm_db.get_employee_id(empl))
-    task_id = int(*pm_db.get_task_id(task))
-    stat_id = int(*pm_db.get_stat_id(stat))
-    pm_db.modify_assignment(int(asgmt_id), emp_id, task_id, stat_id)
+    if not asgmt_id.strip().isdecimal():
+        messagebox.showerror('Validation Error', 'The assignment id must be a number')
+        return
+    ids = find_ids(empl, task, stat)
+    if ids is not None and not pm_db.modify_assignment(int(asgmt_id), *ids):
+        messagebox.showerror('Validation Error', 'There is no assignment with id {}'.format(asgmt_id.strip()))
+
 
+def show_assignment_detail(detail, fields: tuple, widgets: tuple):
+    """
+    Fills the modify assignment fields with the names of an assignment, or clears them and
+    disables the modify widgets when there is no such assignment
 
-def reload_empl_table(table: ttk.Treeview):
+    :param detail: the row from pm_db.get_assignment_detail, None for an id that does not exist
+    :param fields: storage areas of the employee, task and status names
+    :param widgets: the widgets modifying the assignment, enabled only while one is shown
+    """
+
+    for field, column in zip(fields, ('Employee', 'Task', 'Status')):
+        field.set(detail[column] if detail else '')
+    for widget in widgets:
+        widget.configure(state=tk.NORMAL if detail else tk.DISABLED)
+
+
+def reload_empl_table(table: pm_widgets.PagedTreeview):
     """
     Reloads the employee widget with data from the employee database table
 
     :param table: a table widget
     """
 
-    table.delete(*table.get_children())
-    rows = pm_db.get_all_employees()
-    for employee in rows:
-        emp = list(employee)
-        table.insert("", tk.END, values=emp)
+    table.reload()
 
 
-def reload_task_table(table: ttk.Treeview):
+def reload_task_table(table: pm_widgets.PagedTreeview):
     """
     Reloads the task widget with data from the task database table
 
     :param table: a table widget
     """
 
-    table.delete(*table.get_children())
-    rows = pm_db.get_all_tasks()
-    for task in rows:
-        tsk = list(task)
-        table.insert("", tk.END, values=tsk)
+    table.reload()
 
 
-def reload_stat_table(table: ttk.Treeview):
+def reload_stat_table(table: pm_widgets.PagedTreeview):
     """
     Reloads the status widget with data from the status database table
 
     :param table: a table widget
     """
 
-    table.delete(*table.get_children())
-    rows = pm_db.get_all_statuses()
-    for stat in rows:
-        cond = list(stat)
-        table.insert("", tk.END, values=cond)
+    table.reload()
 
 
-def reload_asgmt_table(table: ttk.Treeview):
+def reload_asgmt_table(table: pm_widgets.PagedTreeview):
     """
     Reloads the assignment widget with data from the assignment database table
 
     :param table: a table widget
     """
 
-    table.delete(*table.get_children())
-    rows = pm_db.get_all_assignments()
-    for assignment in rows:
-        job = list(assignment)
-        table.insert("", tk.END, values=job)
+    table.set_source(pm_db.get_assignment_page)
 
 
-def asgmt_table_by_empl(empl: str, table: ttk.Treeview):
+def asgmt_table_by_filter(table: pm_widgets.PagedTreeview, show_all: tk.Button, empl: tk.StringVar,
+                          task: tk.StringVar, stat: tk.StringVar, min_price: tk.StringVar, max_price: tk.StringVar,
+                          min_hours: tk.StringVar, max_hours: tk.StringVar):
     """
-    Filters assignment widget to display for selected employee
+    Filters assignment widget to display the assignments matching every filled in field,
+    the table is left as it is when the filter did not change
 
-    :param empl: an employees full name
     :param table: a table widget
+    :param show_all: the button showing all assignments again, enabled while a filter is applied
+    :param empl: an employees full name
+    :param task: a task name
+    :param stat: a status description
+    :param min_price: lowest task price
+    :param max_price: highest task price
+    :param min_hours: fewest task hours
+    :param max_hours: most task hours
     """
 
-    table.delete(*table.get_children())
-    rows = pm_db.get_by_empl_from_asgmt(empl)
-    for assignment in rows:
-        job = list(assignment)
-        table.insert("", tk.END, values=job)
+    try:
+        where = pm_db.AssignmentFilter(*(var.get().strip() or None for var in (empl, task, stat)),
+                                       *(float(var.get()) if var.get().strip() else None
+                                         for var in (min_price, max_price, min_hours, max_hours)))
+    except ValueError:
+        messagebox.showerror('Validation Error', 'The price and hours must be numbers')
+        return
+    if where == getattr(table.fetch_page, 'keywords', {}).get('where', pm_db.AssignmentFilter()):
+        return
+    table.set_source(partial(pm_db.get_assignment_page, where=where) if where else pm_db.get_assignment_page)
+    show_all.configure(state=tk.NORMAL if where else tk.DISABLED)
+
+
+def background_color(style: ttk.Style):
+    style.configure('TFrame', background='red')
 
 
-def asgmt_table_by_stat(stat: str, table: ttk.Treeview):
+def schedule_search(ui, tree: ttk.Treeview, text: str, delay_ms: int = SEARCH_DELAY_MS):
     """
-    Filters assignment widget to display for selected status
+    Looks the search box text up once the user stops typing for delay_ms, every keystroke
+    restarts the wait so only the last text reaches the database worker
 
-    :param stat: a status description
-    :param table: a table widget
+    :param ui: the widgets and storage areas shared between the tabs
+    :param tree: the search results widget
+    :param text: words to look for
+    :param delay_ms: milliseconds to wait after the last keystroke
     """
 
-    table.delete(*table.get_children())
-    rows = pm_db.get_by_stat_from_asgmt(stat)
-    for assignment in rows:
-        job = list(assignment)
-        table.insert("", tk.END, values=job)
+    if ui.search_after is not None:
+        tree.after_cancel(ui.search_after)
+    ui.search_after = tree.after(delay_ms, run_search, ui, tree, text)
 
 
-def update_option_menu(ddl: tk.OptionMenu, collection: list, variable: tk.StringVar):
+def run_search(ui, tree: ttk.Treeview, text: str):
     """
-    Updates list being used by a drop down list
+    Searches on the database worker and shows the results, a newer search makes the results
+    of an older one stale
 
-    :param ddl: drop down list widget
-    :param collection: a list of selectable items
-    :param variable: storage area for selected item from the list
+    :param ui: the widgets and storage areas shared between the tabs
+    :param tree: the search results widget
+    :param text: words to look for
     """
 
-    menu = ddl["menu"]
-    menu.delete(0, 'end')
-    for items in collection:
-        menu.add_command(label=items, command=lambda value=items: variable.set(value))
+    ui.search_after = None
+    ui.executor.submit(pm_db.search, text, channel='search', callback=lambda rows: show_search_results(tree, rows))
 
 
-def background_color(style: ttk.Style):
-    style.configure('TFrame', background='red')
+def show_search_results(tree: ttk.Treeview, rows: list):
+    """
+    Replaces the rows of the search results widget
+
+    :param tree: the search results widget
+    :param rows: rows of (Kind, ID, Name, Detail) from pm_db.search
+    """
+
+    tree.delete(*tree.get_children())
+    for row in rows:
+        tree.insert('', tk.END, values=tuple(row))
 
 
-def update_all_drop_down_lists(emp: list, tsk: list, stat: list, asg: list):
+def open_search_result(tree: ttk.Treeview, filters: dict, apply_filter, tab_control: ttk.Notebook,
+                       asgmt_tab: ttk.Frame):
+    """
+    Shows the assignments of the selected employee, task or status search result, clearing
+    the rest of the assignment filter first
+
+    :param tree: the search results widget
+    :param filters: storage areas of the assignment filter fields, keyed by pm_db.AssignmentFilter field
+    :param apply_filter: applies the assignment filter fields to the assignment table
+    :param tab_control: the tabs widget, selecting the Assignment Table tab builds it
+    :param asgmt_tab: the Assignment Table tab
     """
-    Updates all the lists being used by all the drop down menus
 
-    :param emp: a list of employee full names
-    :param tsk: a list of task names
-    :param stat: a list of status descriptions
-    :param asg: a list of assignment ids
-    :return:
+    selected = tree.focus()
+    if not selected:
+        return
+    kind, _, name, _ = tree.item(selected, 'values')
+    if kind not in filters:
+        return
+    for field in filters.values():
+        field.set('')
+    filters[kind].set(name)
+    tab_control.select(asgmt_tab)
+    apply_filter()
+
+
+def report_callback_exception(exc, value, tb):
+    """
+    Shows errors raised while handling GUI events in a messagebox
+
+    :param exc: the exception class
+    :param value: the exception
+    :param tb: its traceback
     """
 
-    emp[:] = [e for e, in pm_db.get_empl_names()]
-    tsk[:] = [t for t, in pm_db.get_task_names()]
-    stat[:] = [s for s, in pm_db.get_status_names()]
-    asg[:] = [a for a, in pm_db.get_asgmt_ids()]
+    if isinstance(value, sqlite3.Error):
+        messagebox.showerror("Database Error", str(value))
+        return
+    traceback.print_exception(exc, value, tb)
+    messagebox.showerror("Error", str(value))
 
 
 def about():
     """Display the opening docstring in a messagebox"""
 
-    tkinter.messagebox.showinfo('About Program Manager', ABOUT)
+    messagebox.showinfo('About Program Manager', ABOUT)
 
 
-def main():
-    # sets up the main window
-    root = tk.Tk()
-    root.title('Project Manager')
-    root.iconphoto(False, tk.PhotoImage(file='cow.png'))
-    style = ttk.Style()
-    style.configure('Treeview.Heading', foreground='green')
+class StartupTimer:
+    """Times the steps of starting up the GUI, up to the first paint of the window"""
 
-    # file menu
-    menu = Menu(root)
-    root.config(menu=menu)
-    file_menu = Menu(menu, tearoff=0)
-    menu.add_cascade(label='File', menu=file_menu)
-    file_menu.add_command(label='Exit', command=root.quit)
-    color_menu = Menu(menu, tearoff=0)
-    menu.add_cascade(label='Background Color', menu=color_menu)
-    color_menu.add_command(label="Red", command=lambda: style.configure('TFrame', background='red'))
-    color_menu.add_command(label='Orange', command=lambda: style.configure('TFrame', background='orange'))
-    color_menu.add_command(label='Yellow', command=lambda: style.configure('TFrame', background='yellow'))
-    color_menu.add_command(label='Green', command=lambda: style.configure('TFrame', background='green'))
-    color_menu.add_command(label='Blue', command=lambda: style.configure('TFrame', background='blue'))
-    color_menu.add_command(label='Purple', command=lambda: style.configure('TFrame', background='purple'))
-    color_menu.add_command(label='Gray (default)', command=lambda: style.configure('TFrame', background='grey94'))
-    color_menu.add_command(label='Black', command=lambda: style.configure('TFrame', background='black'))
-    help_menu = Menu(menu, tearoff=0)
-    menu.add_cascade(label='Help', menu=help_menu)
-    help_menu.add_command(label='About Program Manager', command=about)
+    def __init__(self):
+        self.start = self.last = time.perf_counter()
+        self.steps = []
+        self.reported = False
 
-    # declares all the String Variables needed
-    emp_first = tk.StringVar()
-    emp_last = tk.StringVar()
-    emp_phone = tk.StringVar()
-    emp_email = tk.StringVar()
-    task_name = tk.StringVar()
-    task_desc = tk.StringVar()
-    task_price = tk.StringVar()
-    task_hours = tk.StringVar()
-    stat_desc = tk.StringVar()
-    asgmt_empl = tk.StringVar()
-    asgmt_tsk = tk.StringVar()
-    asgmt_stat = tk.StringVar()
-    asgmt_id = tk.StringVar()
-    asgmt_empl2 = tk.StringVar()
-    asgmt_tsk2 = tk.StringVar()
-    asgmt_stat2 = tk.StringVar()
-    asgmt_empl_filter = tk.StringVar()
-    asgmt_stat_filter = tk.StringVar()
+    def mark(self, step: str):
+        """
+        Records the time since the previous mark as a step
 
-    # connects to database and adds sample data if tables are empty
-    pm_db.connect()
-    if pm_db.empty_table():
-        populate_tables()
+        :param step: name of the step that just finished
+        """
 
-    # sets up tabs
-    tab_control = ttk.Notebook(root)
-    tab1 = ttk.Frame(tab_control)
-    tab2 = ttk.Frame(tab_control)
-    tab3 = ttk.Frame(tab_control)
-    tab4 = ttk.Frame(tab_control)
-    tab5 = ttk.Frame(tab_control)
-    tab_control.add(tab1, text='Main')
-    tab_control.add(tab2, text='Employee Table')
-    tab_control.add(tab3, text='Task Table')
-    tab_control.add(tab4, text='Status Table')
-    tab_control.add(tab5, text='Assignment Table')
-    tab_control.pack(expand=1, fill='both')
+        now = time.perf_counter()
+        self.record(step, now - self.last)
+        self.last = now
 
-    # creates Main tab
-    top_start_frm = Frame(tab1)
-    bottom_start_frm = Frame(tab1)
+    def record(self, step: str, seconds: float):
+        """
+        Records a step timed elsewhere, steps recorded after the report are printed right away
+
+        :param step: name of the step
+        :param seconds: time the step took
+        """
+
+        self.steps.append((step, seconds))
+        if self.reported:
+            print('{:<24}{:>10.1f} ms'.format(step, seconds * 1000), file=sys.stderr)
+
+    def report(self):
+        """Prints the time of every step so far and the time to first paint to standard error"""
+
+        for step, seconds in self.steps:
+            print('{:<24}{:>10.1f} ms'.format(step, seconds * 1000), file=sys.stderr)
+        print('{:<24}{:>10.1f} ms'.format('time to first paint', (self.last - self.start) * 1000), file=sys.stderr)
+        self.reported = True
+
+
+def refresh_lists(ui, *kinds):
+    """
+    Refreshes the choices of the type-ahead lists on the tabs built so far
+
+    :param ui: the widgets and storage areas shared between the tabs
+    :param kinds: employee, task, status or assignment, every kind if none is given
+    """
+
+    for kind in kinds or ui.lists:
+        for combobox in ui.lists[kind]:
+            combobox.refresh()
+
+
+def reload_tables(ui):
+    """
+    Reloads the table widgets on the tabs built so far, the others load when first selected
+
+    :param ui: the widgets and storage areas shared between the tabs
+    """
+
+    for kind, reload in (('employee', reload_empl_table), ('task', reload_task_table), ('status', reload_stat_table),
+                         ('assignment', reload_asgmt_table)):
+        if kind in ui.tables:
+            reload(ui.tables[kind])
+
+
+def build_main_tab(ui, tab: ttk.Frame):
+    """
+    Creates the Main tab
+
+    :param ui: the widgets and storage areas shared between the tabs
+    :param tab: the frame of the tab
+    """
+
+    tab_control = ui.tab_control
+    search_text = tk.StringVar()
+    top_start_frm = tk.Frame(tab)
+    bottom_start_frm = tk.Frame(tab)
     img = tk.PhotoImage(file='logo.png')
     top_start_frm.pack()
     bottom_start_frm.pack()
     logo = tk.Text(top_start_frm, height=13, width=25)
+    logo.image = img
     logo.insert(tk.END, '\n')
     logo.image_create(tk.END, image=img)
-    logo.pack(side=LEFT)
-    logo.config(state=DISABLED)
+    logo.pack(side=tk.LEFT)
+    logo.config(state=tk.DISABLED)
     text = tk.Text(top_start_frm, height=13, width=50)
-    text.pack(side=LEFT)
+    text.pack(side=tk.LEFT)
     text.insert(tk.END, '\nAccess the different tables by clicking the tabs\n'
                         'above. Under each table you will find\n'
                         'functionality to modify or view the corresponding\n'
@@ -441,232 +473,349 @@ def main():
                         'whole table by the selected field. Clicking a\n'
                         'second time will resort the whole table in the\n'
                         'opposite order.\n')
-    text.config(state=DISABLED)
-    drop_all_btn = Button(bottom_start_frm, text='Drop All Tables', command=lambda: (pm_db.drop_all_tables(),
-                                                                                     tab_control.tab(tab2, state='disabled'),
-                                                                                     tab_control.tab(tab3, state='disabled'),
-                                                                                     tab_control.tab(tab4, state='disabled'),
-                                                                                     tab_control.tab(tab5, state='disabled'),
-                                                                                     load_sample_btn.configure(state=NORMAL),
-                                                                                     drop_all_btn.configure(state=DISABLED)))
-    drop_all_btn.pack(side=LEFT, padx=5, pady=5)
-    load_sample_btn = Button(bottom_start_frm, text='Load Sample Data', command=lambda: (populate_tables(),
-                                                                                         tab_control.tab(tab2, state='normal'),
-                                                                                         tab_control.tab(tab3, state='normal'),
-                                                                                         tab_control.tab(tab4, state='normal'),
-                                                                                         tab_control.tab(tab5, state='normal'),
-                                                                                         load_sample_btn.configure(state=DISABLED),
-                                                                                         drop_all_btn.configure(state=NORMAL),
-                                                                                         reload_empl_table(emp_tree),
-                                                                                         reload_task_table(task_tree),
-                                                                                         reload_stat_table(stat_tree),
-                                                                                         reload_asgmt_table(asgmt_tree),
-                                                                                         update_all_drop_down_lists(employee_list, task_list, status_list, id_list),
-                                                                                         update_option_menu(asgmt_employee_ddl, employee_list, asgmt_empl),
-                                                                                         update_option_menu(modify_employee_ddl, employee_list, asgmt_empl2),
-                                                                                         update_option_menu(filter_by_empl_ddl, employee_list, asgmt_empl_filter),
-                                                                                         update_option_menu(asgmt_task_ddl, task_list, asgmt_tsk),
-                                                                                         update_option_menu(modify_task_ddl, task_list, asgmt_tsk2),
-                                                                                         update_option_menu(asgmt_status_ddl, status_list, asgmt_stat),
-                                                                                         update_option_menu(modify_status_ddl, status_list, asgmt_stat2),
-                                                                                         update_option_menu(filter_by_status_ddl, status_list, asgmt_stat_filter),
-                                                                                         update_option_menu(asgmt_id_ddl, id_list, asgmt_id)))
-    load_sample_btn.pack(side=LEFT, padx=5, pady=5)
+    text.config(state=tk.DISABLED)
+    drop_all_btn = tk.Button(bottom_start_frm, text='Drop All Tables', command=lambda: (pm_db.drop_all_tables(),
+                                                                                     [tab_control.tab(data_tab, state='disabled') for data_tab in ui.data_tabs],
+                                                                                     load_sample_btn.configure(state=tk.NORMAL),
+                                                                                     drop_all_btn.configure(state=tk.DISABLED)))
+    drop_all_btn.pack(side=tk.LEFT, padx=5, pady=5)
+    load_sample_btn = tk.Button(bottom_start_frm, text='Load Sample Data', command=lambda: (populate_tables(),
+                                                                                         [tab_control.tab(data_tab, state='normal') for data_tab in ui.data_tabs],
+                                                                                         load_sample_btn.configure(state=tk.DISABLED),
+                                                                                         drop_all_btn.configure(state=tk.NORMAL),
+                                                                                         reload_tables(ui),
+                                                                                         refresh_lists(ui)))
+    load_sample_btn.pack(side=tk.LEFT, padx=5, pady=5)
+    search_frm = tk.Frame(tab, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
+    search_frm.pack(expand=1, fill='both')
+    search_bar_frm = tk.Frame(search_frm)
+    search_bar_frm.pack(fill=tk.X)
+    search_lbl = tk.Label(search_bar_frm, text='SEARCH:  ').pack(side=tk.LEFT)
+    search_txt = tk.Entry(search_bar_frm, textvariable=search_text, width=60)
+    search_txt.pack(side=tk.LEFT, fill=tk.X, expand=1)
+    search_tree = ttk.Treeview(search_frm, columns=('KIND', 'ID', 'NAME', 'DETAIL'), show='headings', height=8)
+    for heading, width in (('KIND', 80), ('ID', 70), ('NAME', 200), ('DETAIL', 320)):
+        search_tree.heading(heading, text=heading)
+        search_tree.column(heading, width=width)
+    search_scrollbar = ttk.Scrollbar(search_frm, orient='vertical', command=search_tree.yview)
+    search_tree.configure(yscrollcommand=search_scrollbar.set)
+    search_tree.pack(side=tk.LEFT, expand=1, fill='both')
+    search_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    search_tree.bind('<Double-1>', lambda event: open_search_result(search_tree, ui.asgmt_filters, lambda: ui.apply_asgmt_filter(),
+                                                                    tab_control, ui.asgmt_tab))
     if pm_db.empty_table():
-        drop_all_btn.configure(state=DISABLED)
+        drop_all_btn.configure(state=tk.DISABLED)
     else:
-        load_sample_btn.configure(state=DISABLED)
+        load_sample_btn.configure(state=tk.DISABLED)
+    search_text.trace('w', lambda *args: schedule_search(ui, search_tree, search_text.get()))
 
-    # creates Employee Table tab
-    top_emp_frm = Frame(tab2)
-    bottom_emp_frm = Frame(tab2, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
+
+def build_employee_tab(ui, tab: ttk.Frame):
+    """
+    Creates the Employee Table tab and loads its first page
+
+    :param ui: the widgets and storage areas shared between the tabs
+    :param tab: the frame of the tab
+    """
+
+    emp_first = tk.StringVar()
+    emp_last = tk.StringVar()
+    emp_phone = tk.StringVar()
+    emp_email = tk.StringVar()
+    top_emp_frm = tk.Frame(tab)
+    bottom_emp_frm = tk.Frame(tab, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
     top_emp_frm.pack()
     bottom_emp_frm.pack()
-    rows = pm_db.get_all_employees()
-    row = rows.fetchone()
-    headings = row.keys()
-    headings = [x.upper() for x in headings]
-    emp_tree = ttk.Treeview(top_emp_frm, columns=headings, show='headings')
-    emp_tree.pack()
-    rows = pm_db.get_all_employees()
-    for employee in rows:
-        emp = list(employee)
-        emp_tree.insert("", tk.END, values=emp)
-    for col in headings:
-        emp_tree.heading(col, text=col, command=lambda _col=col: make_treeview_sortable(emp_tree, _col, False))
-    add_emp_lbl = Label(bottom_emp_frm, text="ADD EMPLOYEE:  ").pack(side=LEFT)
-    fn_lbl = Label(bottom_emp_frm, text="First Name:").pack(side=LEFT)
-    first_name_txt = Entry(bottom_emp_frm, textvariable=emp_first).pack(side=LEFT)
-    ln_lbl = Label(bottom_emp_frm, text="Last Name:").pack(side=LEFT)
-    last_name_txt = Entry(bottom_emp_frm, textvariable=emp_last).pack(side=LEFT)
-    phone_lbl = Label(bottom_emp_frm, text="Phone:").pack(side=LEFT)
-    phone_txt = Entry(bottom_emp_frm, textvariable=emp_phone).pack(side=LEFT)
-    email_lbl = Label(bottom_emp_frm, text="Email:").pack(side=LEFT)
-    email_txt = Entry(bottom_emp_frm, textvariable=emp_email).pack(side=LEFT)
-    add_emp_btn = Button(bottom_emp_frm, text="Add", command=lambda: (add_employee(emp_first, emp_last, emp_phone, emp_email, emp_tree, employee_list),
-                                                                      update_option_menu(asgmt_employee_ddl, employee_list, asgmt_empl),
-                                                                      update_option_menu(modify_employee_ddl, employee_list, asgmt_empl2),
-                                                                      update_option_menu(filter_by_empl_ddl, employee_list, asgmt_empl_filter))).pack(side=LEFT)
-
-    # creates Task table tab
-    top_task_frm = Frame(tab3)
-    bottom_task_frm = Frame(tab3, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
+    headings = [x.upper() for x in pm_db.get_columns('employee')]
+    emp_tree = pm_widgets.PagedTreeview(top_emp_frm, headings, pm_db.get_employee_page, executor=ui.executor)
+    emp_tree.pack(side=tk.LEFT)
+    emp_tree.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    emp_tree.reload()
+    ui.tables['employee'] = emp_tree
+    add_emp_lbl = tk.Label(bottom_emp_frm, text="ADD EMPLOYEE:  ").pack(side=tk.LEFT)
+    fn_lbl = tk.Label(bottom_emp_frm, text="First Name:").pack(side=tk.LEFT)
+    first_name_txt = tk.Entry(bottom_emp_frm, textvariable=emp_first).pack(side=tk.LEFT)
+    ln_lbl = tk.Label(bottom_emp_frm, text="Last Name:").pack(side=tk.LEFT)
+    last_name_txt = tk.Entry(bottom_emp_frm, textvariable=emp_last).pack(side=tk.LEFT)
+    phone_lbl = tk.Label(bottom_emp_frm, text="Phone:").pack(side=tk.LEFT)
+    phone_txt = tk.Entry(bottom_emp_frm, textvariable=emp_phone).pack(side=tk.LEFT)
+    email_lbl = tk.Label(bottom_emp_frm, text="Email:").pack(side=tk.LEFT)
+    email_txt = tk.Entry(bottom_emp_frm, textvariable=emp_email).pack(side=tk.LEFT)
+    add_emp_btn = tk.Button(bottom_emp_frm, text="Add", command=lambda: (add_employee(emp_first, emp_last, emp_phone, emp_email, emp_tree),
+                                                                      refresh_lists(ui, 'employee'))).pack(side=tk.LEFT)
+
+
+def build_task_tab(ui, tab: ttk.Frame):
+    """
+    Creates the Task Table tab and loads its first page
+
+    :param ui: the widgets and storage areas shared between the tabs
+    :param tab: the frame of the tab
+    """
+
+    task_name = tk.StringVar()
+    task_desc = tk.StringVar()
+    task_price = tk.StringVar()
+    task_hours = tk.StringVar()
+    top_task_frm = tk.Frame(tab)
+    bottom_task_frm = tk.Frame(tab, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
     top_task_frm.pack()
     bottom_task_frm.pack()
-    rows = pm_db.get_all_tasks()
-    row = rows.fetchone()
-    headings = row.keys()
-    headings = [x.upper() for x in headings]
-    task_tree = ttk.Treeview(top_task_frm, columns=headings, show='headings')
-    task_tree.pack()
-    rows = pm_db.get_all_tasks()
-    for task in rows:
-        tsk = list(task)
-        task_tree.insert("", tk.END, values=tsk)
-    for col in headings:
-        task_tree.heading(col, text=col, command=lambda _col=col: make_treeview_sortable(task_tree, _col, False))
-    add_task_lbl = Label(bottom_task_frm, text='ADD TASK:  ').pack(side=LEFT)
-    name_lbl = Label(bottom_task_frm, text='Name:').pack(side=LEFT)
-    name_txt = Entry(bottom_task_frm, textvariable=task_name).pack(side=LEFT)
-    desc_lbl = Label(bottom_task_frm, text='Description:').pack(side=LEFT)
-    description_txt = Entry(bottom_task_frm, textvariable=task_desc).pack(side=LEFT)
-    price_lbl = Label(bottom_task_frm, text='Price:').pack(side=LEFT)
-    price_txt = Entry(bottom_task_frm, textvariable=task_price).pack(side=LEFT)
-    hours_lbl = Label(bottom_task_frm, text='Hours:').pack(side=LEFT)
-    hours_txt = Entry(bottom_task_frm, textvariable=task_hours).pack(side=LEFT)
-    add_tsk_btn = Button(bottom_task_frm, text='Add', command=lambda: (add_task(task_name, task_desc, task_price, task_hours, task_tree, task_list),
-                                                                       update_option_menu(asgmt_task_ddl, task_list, asgmt_tsk),
-                                                                       update_option_menu(modify_task_ddl, task_list, asgmt_tsk2))).pack(side=LEFT)
-
-    # creates Status tab
-    top_stat_frm = Frame(tab4)
-    bottom_stat_frm = Frame(tab4, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
+    headings = [x.upper() for x in pm_db.get_columns('task')]
+    task_tree = pm_widgets.PagedTreeview(top_task_frm, headings, pm_db.get_task_page, executor=ui.executor)
+    task_tree.pack(side=tk.LEFT)
+    task_tree.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    task_tree.reload()
+    ui.tables['task'] = task_tree
+    add_task_lbl = tk.Label(bottom_task_frm, text='ADD TASK:  ').pack(side=tk.LEFT)
+    name_lbl = tk.Label(bottom_task_frm, text='Name:').pack(side=tk.LEFT)
+    name_txt = tk.Entry(bottom_task_frm, textvariable=task_name).pack(side=tk.LEFT)
+    desc_lbl = tk.Label(bottom_task_frm, text='Description:').pack(side=tk.LEFT)
+    description_txt = tk.Entry(bottom_task_frm, textvariable=task_desc).pack(side=tk.LEFT)
+    price_lbl = tk.Label(bottom_task_frm, text='Price:').pack(side=tk.LEFT)
+    price_txt = tk.Entry(bottom_task_frm, textvariable=task_price).pack(side=tk.LEFT)
+    hours_lbl = tk.Label(bottom_task_frm, text='Hours:').pack(side=tk.LEFT)
+    hours_txt = tk.Entry(bottom_task_frm, textvariable=task_hours).pack(side=tk.LEFT)
+    add_tsk_btn = tk.Button(bottom_task_frm, text='Add', command=lambda: (add_task(task_name, task_desc, task_price, task_hours, task_tree),
+                                                                       refresh_lists(ui, 'task'))).pack(side=tk.LEFT)
+
+
+def build_status_tab(ui, tab: ttk.Frame):
+    """
+    Creates the Status Table tab and loads its first page
+
+    :param ui: the widgets and storage areas shared between the tabs
+    :param tab: the frame of the tab
+    """
+
+    stat_desc = tk.StringVar()
+    top_stat_frm = tk.Frame(tab)
+    bottom_stat_frm = tk.Frame(tab, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
     top_stat_frm.pack()
     bottom_stat_frm.pack()
-    rows = pm_db.get_all_statuses()
-    row = rows.fetchone()
-    headings = row.keys()
-    headings = [x.upper() for x in headings]
-    stat_tree = ttk.Treeview(top_stat_frm, columns=headings, show='headings')
-    stat_tree.pack()
-    rows = pm_db.get_all_statuses()
-    for status in rows:
-        mode = list(status)
-        stat_tree.insert("", tk.END, values=mode)
-    for col in headings:
-        stat_tree.heading(col, text=col, command=lambda _col=col: make_treeview_sortable(stat_tree, _col, False))
-    add_stat_lbl = Label(bottom_stat_frm, text='ADD STATUS:  ').pack(side=LEFT)
-    stat_desc_lbl = Label(bottom_stat_frm, text='Description:').pack(side=LEFT)
-    stat_description_txt = Entry(bottom_stat_frm, textvariable=stat_desc).pack(side=LEFT)
-    add_stat_btn = Button(bottom_stat_frm, text='Add', command=lambda: (add_status(stat_desc, stat_tree, status_list),
-                                                                        update_option_menu(asgmt_status_ddl, status_list, asgmt_stat),
-                                                                        update_option_menu(modify_status_ddl, status_list, asgmt_stat2),
-                                                                        update_option_menu(filter_by_status_ddl, status_list, asgmt_stat_filter))).pack(side=LEFT)
-
-    # creates Assignment tab
-    top_asgmt_frm = Frame(tab5)
-    add_asgmt_frm = Frame(tab5, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
-    modify_asgmt_frm = Frame(tab5, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
-    bottom_asgmt_frm = Frame(tab5)
-    filter_by_empl_frm = Frame(bottom_asgmt_frm, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
-    filter_by_status_frm = Frame(bottom_asgmt_frm, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
-    show_all_frm = Frame(bottom_asgmt_frm, highlightbackground='black', highlightthickness=1, padx=9, pady=8)
+    headings = [x.upper() for x in pm_db.get_columns('status')]
+    stat_tree = pm_widgets.PagedTreeview(top_stat_frm, headings, pm_db.get_status_page, executor=ui.executor)
+    stat_tree.pack(side=tk.LEFT)
+    stat_tree.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    stat_tree.reload()
+    ui.tables['status'] = stat_tree
+    add_stat_lbl = tk.Label(bottom_stat_frm, text='ADD STATUS:  ').pack(side=tk.LEFT)
+    stat_desc_lbl = tk.Label(bottom_stat_frm, text='Description:').pack(side=tk.LEFT)
+    stat_description_txt = tk.Entry(bottom_stat_frm, textvariable=stat_desc).pack(side=tk.LEFT)
+    add_stat_btn = tk.Button(bottom_stat_frm, text='Add', command=lambda: (add_status(stat_desc, stat_tree),
+                                                                        refresh_lists(ui, 'status'))).pack(side=tk.LEFT)
+
+
+def build_assignment_tab(ui, tab: ttk.Frame):
+    """
+    Creates the Assignment Table tab and loads its first page
+
+    :param ui: the widgets and storage areas shared between the tabs
+    :param tab: the frame of the tab
+    """
+
+    asgmt_empl = tk.StringVar()
+    asgmt_tsk = tk.StringVar()
+    asgmt_stat = tk.StringVar()
+    asgmt_id = tk.StringVar()
+    asgmt_empl2 = tk.StringVar()
+    asgmt_tsk2 = tk.StringVar()
+    asgmt_stat2 = tk.StringVar()
+    asgmt_empl_filter = ui.asgmt_filters['employee']
+    asgmt_tsk_filter = ui.asgmt_filters['task']
+    asgmt_stat_filter = ui.asgmt_filters['status']
+    asgmt_min_price = ui.asgmt_filters['min_price']
+    asgmt_max_price = ui.asgmt_filters['max_price']
+    asgmt_min_hours = ui.asgmt_filters['min_hours']
+    asgmt_max_hours = ui.asgmt_filters['max_hours']
+    top_asgmt_frm = tk.Frame(tab)
+    add_asgmt_frm = tk.Frame(tab, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
+    modify_asgmt_frm = tk.Frame(tab, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
+    bottom_asgmt_frm = tk.Frame(tab)
+    filter_frm = tk.Frame(bottom_asgmt_frm, highlightbackground='black', highlightthickness=1, padx=4, pady=4)
+    show_all_frm = tk.Frame(bottom_asgmt_frm, highlightbackground='black', highlightthickness=1, padx=9, pady=8)
     top_asgmt_frm.pack()
     add_asgmt_frm.pack()
     modify_asgmt_frm.pack()
     bottom_asgmt_frm.pack()
-    filter_by_empl_frm.pack(side=LEFT)
-    filter_by_status_frm.pack(side=LEFT)
-    show_all_frm.pack(side=LEFT)
-    rows = pm_db.get_all_assignments()
-    row = rows.fetchone()
-    headings = row.keys()
-    headings = [x.upper() for x in headings]
-    asgmt_tree = ttk.Treeview(top_asgmt_frm, columns=headings, show='headings')
-    asgmt_tree.pack()
-    rows = pm_db.get_all_assignments()
-    for assignment in rows:
-        job = list(assignment)
-        asgmt_tree.insert("", tk.END, values=job)
-    for col in headings:
-        asgmt_tree.heading(col, text=col, command=lambda _col=col: make_treeview_sortable(asgmt_tree, _col, False))
-    employee_list = [e for e, in pm_db.get_empl_names()]
-    asgmt_empl.set(employee_list[0])
-    task_list = [t for t, in pm_db.get_task_names()]
-    asgmt_tsk.set(task_list[0])
-    status_list = [s for s, in pm_db.get_status_names()]
-    asgmt_stat.set(status_list[0])
-    id_list = [a for a, in pm_db.get_asgmt_ids()]
-    add_asgmt_lbl = Label(add_asgmt_frm, text='ADD ASSIGNMENT:  ').pack(side=LEFT)
-    asgmt_employee_ddl = OptionMenu(add_asgmt_frm, asgmt_empl, *employee_list)
-    asgmt_employee_ddl.pack(side=LEFT, padx=2, pady=2)
-    asgmt_task_ddl = OptionMenu(add_asgmt_frm, asgmt_tsk, *task_list)
-    asgmt_task_ddl.pack(side=LEFT, padx=2, pady=2)
-    asgmt_status_ddl = OptionMenu(add_asgmt_frm, asgmt_stat, *status_list)
-    asgmt_status_ddl.pack(side=LEFT, padx=2, pady=2)
-    add_asgmt_btn = Button(add_asgmt_frm, text='Add', command=lambda: (add_assignment(asgmt_empl.get(), asgmt_tsk.get(),
-                                                                       asgmt_stat.get(), asgmt_tree, id_list),
-                                                                       update_option_menu(asgmt_id_ddl, id_list, asgmt_id),
-                                                                       asgmt_empl.set(employee_list[0]), asgmt_tsk.set(task_list[0]),
-                                                                       asgmt_stat.set(status_list[0]), show_all_btn.configure(state=DISABLED),
-                                                                       asgmt_empl_filter.set(""), asgmt_stat_filter.set(""),
-                                                                       asgmt_id.set("Pick an ID"), asgmt_empl2.set(""), asgmt_tsk2.set(""), asgmt_stat2.set(""),
-                                                                       modify_employee_ddl.configure(state=DISABLED), modify_task_ddl.configure(state=DISABLED),
-                                                                       modify_status_ddl.configure(state=DISABLED), modify_asgmt_btn.configure(state=DISABLED))).pack(side=LEFT, padx=2, pady=2)
-    asgmt_id.set('Pick an ID')
-    modify_asgmt_lbl = Label(modify_asgmt_frm, text='MODIFY ASSIGNMENT:  ').pack(side=LEFT)
-    asgmt_id_ddl = OptionMenu(modify_asgmt_frm, asgmt_id, *id_list)
-    asgmt_id_ddl.pack(side=LEFT, padx=2, pady=2)
-    modify_employee_ddl = OptionMenu(modify_asgmt_frm, asgmt_empl2, *employee_list)
-    modify_employee_ddl.pack(side=LEFT, padx=2, pady=2)
-    modify_task_ddl = OptionMenu(modify_asgmt_frm, asgmt_tsk2, *task_list)
-    modify_task_ddl.pack(side=LEFT, padx=2, pady=2)
-    modify_status_ddl = OptionMenu(modify_asgmt_frm, asgmt_stat2, *status_list)
-    modify_status_ddl.pack(side=LEFT, padx=2, pady=2)
-    modify_asgmt_btn = Button(modify_asgmt_frm, text='Modify', command=lambda: (modify_assignment(asgmt_id.get(), asgmt_empl2.get(),
+    filter_frm.pack(side=tk.LEFT)
+    show_all_frm.pack(side=tk.LEFT)
+    headings = [x.upper() for x in pm_db.get_columns('assignment')]
+    asgmt_tree = pm_widgets.PagedTreeview(top_asgmt_frm, headings, pm_db.get_assignment_page, executor=ui.executor)
+    asgmt_tree.pack(side=tk.LEFT)
+    asgmt_tree.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    asgmt_tree.reload()
+    ui.tables['assignment'] = asgmt_tree
+    employee_names = partial(pm_db.get_names_starting, 'employee')
+    task_names = partial(pm_db.get_names_starting, 'task')
+    status_names = partial(pm_db.get_names_starting, 'status')
+    add_asgmt_lbl = tk.Label(add_asgmt_frm, text='ADD ASSIGNMENT:  ').pack(side=tk.LEFT)
+    asgmt_employee_ddl = pm_widgets.TypeaheadCombobox(add_asgmt_frm, employee_names, executor=ui.executor, textvariable=asgmt_empl)
+    asgmt_employee_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    asgmt_task_ddl = pm_widgets.TypeaheadCombobox(add_asgmt_frm, task_names, executor=ui.executor, textvariable=asgmt_tsk)
+    asgmt_task_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    asgmt_status_ddl = pm_widgets.TypeaheadCombobox(add_asgmt_frm, status_names, executor=ui.executor, textvariable=asgmt_stat)
+    asgmt_status_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    add_asgmt_btn = tk.Button(add_asgmt_frm, text='Add', command=lambda: (add_assignment(asgmt_empl.get(), asgmt_tsk.get(),
+                                                                       asgmt_stat.get(), asgmt_tree),
+                                                                       asgmt_employee_ddl.clear(), asgmt_task_ddl.clear(), asgmt_status_ddl.clear(),
+                                                                       asgmt_id_ddl.clear(), asgmt_empl2.set(""), asgmt_tsk2.set(""), asgmt_stat2.set(""),
+                                                                       modify_employee_ddl.configure(state=tk.DISABLED), modify_task_ddl.configure(state=tk.DISABLED),
+                                                                       modify_status_ddl.configure(state=tk.DISABLED), modify_asgmt_btn.configure(state=tk.DISABLED))).pack(side=tk.LEFT, padx=2, pady=2)
+    modify_asgmt_lbl = tk.Label(modify_asgmt_frm, text='MODIFY ASSIGNMENT:  ').pack(side=tk.LEFT)
+    asgmt_id_ddl = pm_widgets.TypeaheadCombobox(modify_asgmt_frm, pm_db.get_asgmt_ids_starting, executor=ui.executor,
+                                                textvariable=asgmt_id, width=10)
+    asgmt_id_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    modify_employee_ddl = pm_widgets.TypeaheadCombobox(modify_asgmt_frm, employee_names, executor=ui.executor, textvariable=asgmt_empl2)
+    modify_employee_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    modify_task_ddl = pm_widgets.TypeaheadCombobox(modify_asgmt_frm, task_names, executor=ui.executor, textvariable=asgmt_tsk2)
+    modify_task_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    modify_status_ddl = pm_widgets.TypeaheadCombobox(modify_asgmt_frm, status_names, executor=ui.executor, textvariable=asgmt_stat2)
+    modify_status_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    modify_asgmt_btn = tk.Button(modify_asgmt_frm, text='Modify', command=lambda: (modify_assignment(asgmt_id.get(), asgmt_empl2.get(),
                                                                                 asgmt_tsk2.get(), asgmt_stat2.get()),
                                                                                 asgmt_empl2.set(""), asgmt_tsk2.set(""),
-                                                                                asgmt_stat2.set(""), asgmt_id.set("Pick an ID"), show_all_btn.configure(state=DISABLED),
-                                                                                modify_employee_ddl.configure(state=DISABLED), modify_task_ddl.configure(state=DISABLED),
-                                                                                modify_status_ddl.configure(state=DISABLED), modify_asgmt_btn.configure(state=DISABLED),
-                                                                                reload_asgmt_table(asgmt_tree), asgmt_empl_filter.set(""), asgmt_stat_filter.set("")))
-    modify_asgmt_btn.pack(side=LEFT, padx=2, pady=2)
-    modify_employee_ddl.configure(state=DISABLED)
-    modify_task_ddl.configure(state=DISABLED)
-    modify_status_ddl.configure(state=DISABLED)
-    modify_asgmt_btn.configure(state=DISABLED)
-    filter_by_empl_lbl = Label(filter_by_empl_frm, text='FILTER BY EMPLOYEE:  ').pack(side=LEFT)
-    filter_by_empl_ddl = OptionMenu(filter_by_empl_frm, asgmt_empl_filter, *employee_list)
-    filter_by_empl_ddl.pack(side=LEFT, padx=2, pady=2)
-
-    filter_by_status_lbl = Label(filter_by_status_frm, text='FILTER BY STATUS:  ').pack(side=LEFT)
-    filter_by_status_ddl = OptionMenu(filter_by_status_frm, asgmt_stat_filter, *status_list)
-    filter_by_status_ddl.pack(side=LEFT, padx=2, pady=2)
-    show_all_btn = Button(show_all_frm, text='Show All Assignments', command=lambda: (reload_asgmt_table(asgmt_tree), show_all_btn.configure(state=DISABLED),
-                                                                                      asgmt_empl_filter.set(""), asgmt_stat_filter.set("")))
+                                                                                asgmt_stat2.set(""), asgmt_id_ddl.clear(),
+                                                                                modify_employee_ddl.configure(state=tk.DISABLED), modify_task_ddl.configure(state=tk.DISABLED),
+                                                                                modify_status_ddl.configure(state=tk.DISABLED), modify_asgmt_btn.configure(state=tk.DISABLED),
+                                                                                asgmt_tree.refresh()))
+    modify_asgmt_btn.pack(side=tk.LEFT, padx=2, pady=2)
+    modify_employee_ddl.configure(state=tk.DISABLED)
+    modify_task_ddl.configure(state=tk.DISABLED)
+    modify_status_ddl.configure(state=tk.DISABLED)
+    modify_asgmt_btn.configure(state=tk.DISABLED)
+    filter_lbl = tk.Label(filter_frm, text='FILTER:  ').pack(side=tk.LEFT)
+    filter_by_empl_lbl = tk.Label(filter_frm, text='Employee:').pack(side=tk.LEFT)
+    filter_by_empl_ddl = pm_widgets.TypeaheadCombobox(filter_frm, employee_names, executor=ui.executor, textvariable=asgmt_empl_filter,
+                                                      command=lambda value: apply_asgmt_filter())
+    filter_by_empl_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    filter_by_task_lbl = tk.Label(filter_frm, text='Task:').pack(side=tk.LEFT)
+    filter_by_task_ddl = pm_widgets.TypeaheadCombobox(filter_frm, task_names, executor=ui.executor, textvariable=asgmt_tsk_filter,
+                                                      command=lambda value: apply_asgmt_filter())
+    filter_by_task_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    filter_by_status_lbl = tk.Label(filter_frm, text='Status:').pack(side=tk.LEFT)
+    filter_by_status_ddl = pm_widgets.TypeaheadCombobox(filter_frm, status_names, executor=ui.executor, textvariable=asgmt_stat_filter,
+                                                        command=lambda value: apply_asgmt_filter())
+    filter_by_status_ddl.pack(side=tk.LEFT, padx=2, pady=2)
+    filter_range_entries = []
+    for text, low, high in (('Price:', asgmt_min_price, asgmt_max_price), ('Hours:', asgmt_min_hours, asgmt_max_hours)):
+        tk.Label(filter_frm, text=text).pack(side=tk.LEFT)
+        filter_range_entries.append(tk.Entry(filter_frm, textvariable=low, width=7))
+        filter_range_entries[-1].pack(side=tk.LEFT)
+        tk.Label(filter_frm, text='to').pack(side=tk.LEFT)
+        filter_range_entries.append(tk.Entry(filter_frm, textvariable=high, width=7))
+        filter_range_entries[-1].pack(side=tk.LEFT)
+    for entry in filter_range_entries:
+        entry.bind('<Return>', lambda event: apply_asgmt_filter())
+    filter_btn = tk.Button(filter_frm, text='Apply', command=lambda: apply_asgmt_filter()).pack(side=tk.LEFT, padx=2, pady=2)
+    show_all_btn = tk.Button(show_all_frm, text='Show All Assignments', command=lambda: ([var.set("") for var in (asgmt_empl_filter, asgmt_tsk_filter, asgmt_stat_filter,
+                                                                                                             asgmt_min_price, asgmt_max_price,
+                                                                                                             asgmt_min_hours, asgmt_max_hours)],
+                                                                                      apply_asgmt_filter()))
     show_all_btn.pack()
-    modify_employee_ddl.configure(state=DISABLED)
-    modify_task_ddl.configure(state=DISABLED)
-    modify_status_ddl.configure(state=DISABLED)
-    modify_asgmt_btn.configure(state=DISABLED)
-    show_all_btn.configure(state=DISABLED)
-
-    # Tkinter OptionMenu (drop down list) have the ability to attach commands, however, if you change the list
-    # of options the commands also get discarded. If it is one simple command, it can be restored, however the
-    # complexity of the anonymous functions (lambdas) being used makes it so that using a trace is the only way
-    # to maintain functionality while allowing the flexibility needed. These are placed at the end so that the
-    # compiler will have seen all the referenced variables.
-    asgmt_id.trace('w', lambda *args: ((asgmt_empl2.set(employee_list[int(*pm_db.get_empl_id_from_asgmt(asgmt_id.get())) - 1]),
-                                       asgmt_tsk2.set(task_list[int(*pm_db.get_task_id_from_asgmt(asgmt_id.get())) - 1]),
-                                       asgmt_stat2.set(status_list[int(*pm_db.get_status_id_from_asgmt(asgmt_id.get())) - 1]),
-                                       modify_employee_ddl.configure(state=NORMAL), modify_task_ddl.configure(state=NORMAL),
-                                       modify_status_ddl.configure(state=NORMAL), modify_asgmt_btn.configure(state=NORMAL)) if asgmt_id.get() != "Pick an ID" else ()))
-    asgmt_empl_filter.trace('w', lambda *args: ((asgmt_table_by_empl(asgmt_empl_filter.get(), asgmt_tree), asgmt_stat_filter.set(""),
-                                                show_all_btn.configure(state=NORMAL)) if asgmt_empl_filter.get() != "" else ()))
-    asgmt_stat_filter.trace('w', lambda *args: ((asgmt_table_by_stat(asgmt_stat_filter.get(), asgmt_tree), asgmt_empl_filter.set(""),
-                                                 show_all_btn.configure(state=NORMAL)) if asgmt_stat_filter.get() != "" else ()))
+    apply_asgmt_filter = partial(asgmt_table_by_filter, asgmt_tree, show_all_btn, asgmt_empl_filter, asgmt_tsk_filter, asgmt_stat_filter,
+                                 asgmt_min_price, asgmt_max_price, asgmt_min_hours, asgmt_max_hours)
+    modify_employee_ddl.configure(state=tk.DISABLED)
+    modify_task_ddl.configure(state=tk.DISABLED)
+    modify_status_ddl.configure(state=tk.DISABLED)
+    modify_asgmt_btn.configure(state=tk.DISABLED)
+    show_all_btn.configure(state=tk.DISABLED)
+    ui.lists['employee'] += [asgmt_employee_ddl, modify_employee_ddl, filter_by_empl_ddl]
+    ui.lists['task'] += [asgmt_task_ddl, modify_task_ddl, filter_by_task_ddl]
+    ui.lists['status'] += [asgmt_status_ddl, modify_status_ddl, filter_by_status_ddl]
+    ui.lists['assignment'] += [asgmt_id_ddl]
+    ui.apply_asgmt_filter = apply_asgmt_filter
+
+    # The typed ID is followed with a trace, so that the assignment details follow it however it was changed.
+    # These are placed at the end so that the compiler will have seen all the referenced variables.
+    show_detail = partial(show_assignment_detail, fields=(asgmt_empl2, asgmt_tsk2, asgmt_stat2),
+                          widgets=(modify_employee_ddl, modify_task_ddl, modify_status_ddl, modify_asgmt_btn))
+    asgmt_id.trace('w', lambda *args: (ui.executor.submit(pm_db.get_assignment_detail, int(asgmt_id.get()), channel='assignment detail',
+                                                          callback=show_detail)
+                                       if asgmt_id.get().isdecimal() else (ui.executor.cancel('assignment detail'), show_detail(None))))
+
+
+def main(timings: bool = False):
+    """
+    Starts the GUI, only the Main tab is built up front and the other tabs are built the
+    first time they are selected
+
+    :param timings: print the time each start up step took, up to the first paint, to standard error
+    """
+
+    timer = StartupTimer()
+
+    # sets up the main window
+    root = tk.Tk()
+    root.title('Project Manager')
+    root.report_callback_exception = report_callback_exception
+    root.iconphoto(False, tk.PhotoImage(file='cow.png'))
+    style = ttk.Style()
+    style.configure('Treeview.Heading', foreground='green')
+
+    # runs the slow database reads off the GUI thread
+    executor = pm_worker.DbExecutor(root)
+
+    # file menu
+    menu = tk.Menu(root)
+    root.config(menu=menu)
+    file_menu = tk.Menu(menu, tearoff=0)
+    menu.add_cascade(label='File', menu=file_menu)
+    file_menu.add_command(label='Exit', command=root.quit)
+    color_menu = tk.Menu(menu, tearoff=0)
+    menu.add_cascade(label='Background Color', menu=color_menu)
+    color_menu.add_command(label="Red", command=lambda: style.configure('TFrame', background='red'))
+    color_menu.add_command(label='Orange', command=lambda: style.configure('TFrame', background='orange'))
+    color_menu.add_command(label='Yellow', command=lambda: style.configure('TFrame', background='yellow'))
+    color_menu.add_command(label='Green', command=lambda: style.configure('TFrame', background='green'))
+    color_menu.add_command(label='Blue', command=lambda: style.configure('TFrame', background='blue'))
+    color_menu.add_command(label='Purple', command=lambda: style.configure('TFrame', background='purple'))
+    color_menu.add_command(label='Gray (default)', command=lambda: style.configure('TFrame', background='grey94'))
+    color_menu.add_command(label='Black', command=lambda: style.configure('TFrame', background='black'))
+    help_menu = tk.Menu(menu, tearoff=0)
+    menu.add_cascade(label='Help', menu=help_menu)
+    help_menu.add_command(label='About Program Manager', command=about)
+    timer.mark('window')
+
+    # connects to database, upgrades its schema and adds sample data to a database that was
+    # just created, populate_tables drops the tables so it never runs once they hold rows
+    try:
+        pm_db.connect()
+        if 1 in create_tables() and pm_db.empty_table():
+            populate_tables()
+    except sqlite3.Error as e:
+        messagebox.showerror("Database Error", str(e))
+        executor.shutdown()
+        root.destroy()
+        return
+    # the name lookups are warmed on the worker instead of holding up the window
+    executor.submit(pm_db.warm_name_caches)
+    timer.mark('database')
+
+    # sets up tabs, each one builds its widgets and loads its data when first selected
+    tab_control = pm_widgets.LazyNotebook(root)
+    ui = types.SimpleNamespace(executor=executor, tab_control=tab_control, tables={},
+                               lists={'employee': [], 'task': [], 'status': [], 'assignment': []},
+                               asgmt_filters={field: tk.StringVar() for field in pm_db.AssignmentFilter.FIELDS},
+                               apply_asgmt_filter=None, search_after=None)
+    tab1 = ttk.Frame(tab_control)
+    ui.data_tabs = [ttk.Frame(tab_control) for _ in range(4)]
+    ui.asgmt_tab = ui.data_tabs[3]
+    tab_control.add_lazy(tab1, partial(build_main_tab, ui), text='Main')
+    for tab, build, text in zip(ui.data_tabs, (build_employee_tab, build_task_tab, build_status_tab, build_assignment_tab),
+                                ('Employee Table', 'Task Table', 'Status Table', 'Assignment Table')):
+        tab_control.add_lazy(tab, partial(build, ui), text=text)
+    tab_control.pack(expand=1, fill='both')
+    tab_control.build(tab1)
+    timer.mark('Main tab')
+
+    if timings:
+        tab_control.on_build = timer.record
+        root.after_idle(lambda: (root.update_idletasks(), timer.mark('first paint'), timer.report()))
 
     root.mainloop()
+    executor.shutdown()
 
 
-main()
+if __name__ == '__main__':
+    main('--timings' in sys.argv[1:])
@@ -0,0 +1,360 @@
+"""
+pm_widgets.py
+(Project Manager)
+
+Custom tkinter widgets used by the project manager GUI
+
+Last modified 10/18/2026
+"""
+
+from functools import partial
+import time
+import tkinter as tk
+from tkinter import ttk
+import pm_db
+
+
+class PagedTreeview(ttk.Treeview):
+    """
+    Table widget that only holds a window of rows around the visible area. Pages are
+    fetched from the database as the user scrolls towards either end of the window and
+    rows that fall too far out of view are dropped again.
+
+    Items are keyed by row id, so refresh() only touches the widget rows that changed
+    since the last refresh.
+
+    Clicking a heading sorts the table by that column in the database, a second click
+    reverses the order.
+
+    fetch_page is called as fetch_page(key, limit, forward, order_by=..., descending=...)
+    and must return a list of rows in display order, where key is the (sort value, id)
+    of the row the page starts after (or ends before when going backwards) and None
+    means the very first page. The first column of every row must be its id.
+
+    Given a DbExecutor, pages are fetched on its worker thread and a newer request made
+    by the widget makes any request it still has in flight stale.
+    """
+
+    def __init__(self, master, columns, fetch_page, page_size: int = pm_db.PAGE_SIZE, buffer_pages: int = 3,
+                 executor=None, **kwargs):
+        super().__init__(master, columns=columns, show='headings', **kwargs)
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.max_rows = page_size * buffer_pages
+        self.executor = executor
+        self.scrollbar = ttk.Scrollbar(master, orient=tk.VERTICAL, command=self.yview)
+        self.configure(yscrollcommand=self._on_scroll)
+        self._columns = list(columns)
+        self.order_by = self._columns[0]
+        self.descending = False
+        self._keys = []
+        self._values = {}
+        self._at_start = True
+        self._at_end = True
+        self._fill_pending = False
+        self._loading = False
+        for col in self._columns:
+            self.heading(col, text=col, command=lambda _col=col: self.sort_by(_col))
+
+    def sort_by(self, column: str):
+        """
+        Sorts the table by a column, reversing the order if it is already sorted by it
+
+        :param column: a column heading
+        """
+
+        self.descending = not self.descending if column == self.order_by else False
+        self.order_by = column
+        for col in self._columns:
+            arrow = (' \u25bc' if self.descending else ' \u25b2') if col == column else ''
+            self.heading(col, text=col + arrow)
+        self.reload()
+
+    def set_source(self, fetch_page):
+        """
+        Switches the widget to another page source and shows its first page
+
+        :param fetch_page: a page fetching function
+        """
+
+        self.fetch_page = fetch_page
+        self.reload()
+
+    def reload(self):
+        """Drops every held row and shows the first page again"""
+
+        fetch = self._fetcher()
+        limit = self.page_size
+        self._submit(lambda: fetch(None, limit, True), self._reloaded)
+
+    def refresh(self):
+        """
+        Re-reads the rows covered by the window and applies only the inserts, updates,
+        moves and deletes since the last refresh, leaving unchanged rows untouched
+        """
+
+        fetch = self._fetcher()
+        index = self._columns.index(self.order_by)
+        first_key = self._keys[0] if self._keys and not self._at_start else None
+        limit = max(len(self._keys), self.page_size)
+
+        def job():
+            start = None
+            if first_key is not None:
+                before = fetch(first_key, 1, False)
+                start = (before[-1][index], before[-1][0]) if before else None
+            return start, fetch(start, limit, True)
+
+        self._submit(job, lambda result: self._refreshed(*result, limit))
+
+    def _fetcher(self):
+        """Returns the page source bound to the current sort order"""
+
+        return partial(self.fetch_page, order_by=self.order_by, descending=self.descending)
+
+    def _submit(self, job, handler):
+        """
+        Runs a fetching job and passes its result to handler, on the executor's worker
+        thread if the widget has one
+
+        :param job: a function that only reads from the database
+        :param handler: a function applying the result to the widget
+        """
+
+        if self.executor is None:
+            handler(job())
+            return
+
+        def done(result):
+            self._loading = False
+            handler(result)
+
+        def failed(error):
+            # lets scrolling ask for the page again instead of waiting for it forever
+            self._loading = False
+
+        self._loading = True
+        self.executor.submit(job, callback=done, errback=failed, channel=str(self))
+
+    def _reloaded(self, rows):
+        self.delete(*self.get_children())
+        self._keys = []
+        self._values = {}
+        self._append(rows)
+        self._at_start = True
+        self._at_end = len(rows) < self.page_size
+        self.yview_moveto(0)
+
+    def _refreshed(self, start, rows, limit: int):
+        self._at_start = start is None
+        self._at_end = len(rows) < limit
+        self._sync(rows)
+
+    def _sync(self, rows):
+        """
+        Makes the widget show exactly the given rows
+
+        :param rows: rows in display order
+        """
+
+        wanted = {str(row[0]) for row in rows}
+        stale = [iid for iid in self._values if iid not in wanted]
+        if stale:
+            self.delete(*stale)
+        order = [str(row_id) for _, row_id in self._keys if str(row_id) in wanted]
+        values = {}
+        for index, row in enumerate(rows):
+            iid = str(row[0])
+            values[iid] = tuple(row)
+            if iid not in self._values:
+                self.insert("", index, iid=iid, values=list(row))
+                order.insert(index, iid)
+                continue
+            if self._values[iid] != values[iid]:
+                self.item(iid, values=list(row))
+            if order[index] != iid:
+                self.move(iid, "", index)
+                order.remove(iid)
+                order.insert(index, iid)
+        self._values = values
+        self._keys = [self._key(row) for row in rows]
+
+    def _key(self, row):
+        return row[self._columns.index(self.order_by)], row[0]
+
+    def _append(self, rows):
+        for row in rows:
+            self.insert("", tk.END, iid=str(row[0]), values=list(row))
+            self._keys.append(self._key(row))
+            self._values[str(row[0])] = tuple(row)
+
+    def _drop(self, keys):
+        iids = [str(row_id) for _, row_id in keys]
+        self.delete(*iids)
+        for iid in iids:
+            del self._values[iid]
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if not self._fill_pending:
+            self._fill_pending = True
+            self.after_idle(self._fill)
+
+    def _fill(self):
+        """Loads the next or previous page when the view gets close to an end of the window"""
+
+        self._fill_pending = False
+        if self._loading or not self._keys:
+            return
+        first, last = self.yview()
+        threshold = 0.25 * self.page_size / len(self._keys)
+        if last >= 1 - threshold and not self._at_end:
+            fetch = self._fetcher()
+            key = self._keys[-1]
+            limit = self.page_size
+            self._submit(lambda: fetch(key, limit, True), self._next_loaded)
+        elif first <= threshold and not self._at_start:
+            fetch = self._fetcher()
+            key = self._keys[0]
+            limit = self.page_size
+            self._submit(lambda: fetch(key, limit, False), self._previous_loaded)
+
+    def _next_loaded(self, rows):
+        self._at_end = len(rows) < self.page_size
+        self._append(rows)
+        excess = len(self._keys) - self.max_rows
+        if excess > 0:
+            self._drop(self._keys[:excess])
+            del self._keys[:excess]
+            self._at_start = False
+            # the view keeps its row offset, so step back to keep the same rows in sight
+            self.yview_scroll(-excess, 'units')
+
+    def _previous_loaded(self, rows):
+        self._at_start = len(rows) < self.page_size
+        for index, row in enumerate(rows):
+            self.insert("", index, iid=str(row[0]), values=list(row))
+            self._values[str(row[0])] = tuple(row)
+        self._keys[:0] = [self._key(row) for row in rows]
+        self.yview_scroll(len(rows), 'units')
+        excess = len(self._keys) - self.max_rows
+        if excess > 0:
+            self._drop(self._keys[-excess:])
+            del self._keys[-excess:]
+            self._at_end = False
+
+
+class TypeaheadCombobox(ttk.Combobox):
+    """
+    Combobox whose drop down list only holds the first few entries starting with the
+    typed text. The entries are looked up again once the user stops typing for delay_ms,
+    so a list of any size is never loaded in full.
+
+    fetch_matches is called as fetch_matches(prefix, limit) and must return a list of at
+    most limit entries starting with prefix.
+
+    Given a DbExecutor, lookups run on its worker thread and a newer lookup makes any
+    lookup still in flight stale. command, if given, is called with the text when an
+    entry is picked from the list or Return is pressed.
+    """
+
+    # keys that move around the list or the text without changing it
+    NAVIGATION_KEYS = {'Up', 'Down', 'Left', 'Right', 'Home', 'End', 'Return', 'KP_Enter', 'Escape', 'Tab',
+                       'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R'}
+
+    def __init__(self, master, fetch_matches, limit: int = pm_db.TYPEAHEAD_LIMIT, delay_ms: int = 150,
+                 executor=None, command=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.fetch_matches = fetch_matches
+        self.limit = limit
+        self.delay_ms = delay_ms
+        self.executor = executor
+        self.command = command
+        self._after_id = None
+        self.bind('<KeyRelease>', self._on_key)
+        self.bind('<<ComboboxSelected>>', self._on_choose)
+        self.bind('<Return>', self._on_choose)
+        self.refresh()
+
+    def refresh(self):
+        """Looks up the entries starting with the current text right away"""
+
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        prefix = self.get()
+        if self.executor is None:
+            self._show(self.fetch_matches(prefix, self.limit))
+        else:
+            self.executor.submit(self.fetch_matches, prefix, self.limit, callback=self._show, channel=str(self))
+
+    def clear(self):
+        """Empties the text and offers the first entries again"""
+
+        self.set('')
+        self.refresh()
+
+    def _show(self, matches):
+        self.configure(values=matches)
+
+    def _on_key(self, event):
+        if event.keysym in self.NAVIGATION_KEYS:
+            return
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self._after_id = self.after(self.delay_ms, self.refresh)
+
+    def _on_choose(self, event):
+        if self.command is not None:
+            self.command(self.get())
+
+
+class LazyNotebook(ttk.Notebook):
+    """
+    Notebook whose tabs build their widgets the first time they are selected, so starting
+    up only costs the tab in view and the tables of the other tabs are not read until they
+    are looked at.
+
+    build is called as build(frame) with the frame of the tab. on_build, if given, is
+    called as on_build(tab text, seconds the build took) after every build.
+    """
+
+    def __init__(self, master, on_build=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.on_build = on_build
+        self._builders = {}
+        self.bind('<<NotebookTabChanged>>', lambda event: self.build(self.select()))
+
+    def add_lazy(self, child, build, **kwargs):
+        """
+        Adds a tab whose widgets are built when it is first selected
+
+        :param child: the frame of the tab
+        :param build: function building the widgets of the tab into the frame
+        :param kwargs: tab options, as for add
+        """
+
+        self._builders[str(child)] = build
+        self.add(child, **kwargs)
+
+    def build(self, tab_id):
+        """
+        Builds the widgets of a tab now, unless they were built already
+
+        :param tab_id: the frame of the tab or its path name
+        """
+
+        build = self._builders.pop(str(tab_id), None)
+        if build is None:
+            return
+        start = time.perf_counter()
+        build(self.nametowidget(str(tab_id)))
+        if self.on_build is not None:
+            self.on_build(self.tab(tab_id, 'text'), time.perf_counter() - start)
+
+    def select(self, tab_id=None):
+        """Selects a tab, building it first if needed, or returns the selected tab when called without one"""
+
+        if tab_id is not None:
+            self.build(tab_id)
+        return super().select(tab_id)
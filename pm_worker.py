@@ -0,0 +1,116 @@
+"""
+pm_worker.py
+(Project Manager)
+
+Runs database calls on a background thread so slow queries never block the GUI
+
+Last modified 10/18/2026
+"""
+
+import itertools
+import queue
+import threading
+import pm_db
+
+
+class DbExecutor:
+    """
+    Runs pm_db operations on a dedicated worker thread, which keeps its own reader
+    connection from the pm_db pool.
+    Results are handed back to the Tk main loop, which polls for them with root.after, so
+    callbacks always run on the GUI thread.
+
+    A request that raises calls its errback, if it has one, with the exception on the GUI
+    thread and the exception is then raised from the Tk main loop.
+
+    Requests can be submitted on a channel. Submitting a new request on a channel makes
+    every older request on it stale: stale requests are skipped if they have not started
+    yet and their results are discarded if they have.
+    """
+
+    def __init__(self, root, poll_ms: int = 25):
+        self._root = root
+        self._poll_ms = poll_ms
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._tickets = itertools.count(1)
+        self._latest = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='pm-db-worker', daemon=True)
+        self._thread.start()
+        self._after_id = root.after(poll_ms, self._poll)
+
+    def submit(self, func, *args, callback=None, errback=None, channel: str = None, **kwargs):
+        """
+        Queues func(*args, **kwargs) to run on the worker thread
+
+        :param func: a function that only touches the database, never Tk widgets
+        :param callback: called on the GUI thread with the result of func
+        :param errback: called on the GUI thread with the exception when func raises
+        :param channel: name of the channel the request replaces older requests on
+        :return:
+            int - the ticket of the request
+        """
+
+        ticket = next(self._tickets)
+        if channel is not None:
+            with self._lock:
+                self._latest[channel] = ticket
+        self._requests.put((ticket, channel, func, args, kwargs, (callback, errback)))
+        return ticket
+
+    def cancel(self, channel: str):
+        """
+        Makes every pending request on a channel stale
+
+        :param channel: a channel name
+        """
+
+        with self._lock:
+            self._latest[channel] = next(self._tickets)
+
+    def shutdown(self):
+        """Stops the worker thread once the requests already queued are done"""
+
+        self._root.after_cancel(self._after_id)
+        self._requests.put(None)
+        self._thread.join()
+
+    def _stale(self, ticket: int, channel: str):
+        if channel is None:
+            return False
+        with self._lock:
+            return self._latest.get(channel) != ticket
+
+    def _run(self):
+        try:
+            while True:
+                request = self._requests.get()
+                if request is None:
+                    break
+                ticket, channel, func, args, kwargs, callbacks = request
+                if self._stale(ticket, channel):
+                    continue
+                try:
+                    self._results.put((ticket, channel, callbacks, func(*args, **kwargs), None))
+                except Exception as e:
+                    self._results.put((ticket, channel, callbacks, None, e))
+        finally:
+            pm_db.release_thread()
+
+    def _poll(self):
+        try:
+            while True:
+                ticket, channel, (callback, errback), result, error = self._results.get_nowait()
+                if self._stale(ticket, channel):
+                    continue
+                if error is not None:
+                    if errback is not None:
+                        errback(error)
+                    raise error
+                if callback is not None:
+                    callback(result)
+        except queue.Empty:
+            pass
+        finally:
+            self._after_id = self._root.after(self._poll_ms, self._poll)